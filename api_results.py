@@ -0,0 +1,96 @@
+"""
+Typed success results for Sarvam API calls
+Slot-based records holding only the fields the app reads. They are
+read-only mappings, so existing code keeps using result["success"],
+result.get("cached") and so on; error results stay plain dicts.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class ApiResult(Mapping):
+    """Base class: fields in _optional only appear as keys when set"""
+
+    __slots__ = ()
+    success = True
+    _fields: Tuple[str, ...] = ("success",)
+    _optional: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        if key in self._optional:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        for key in self._optional:
+            if getattr(self, key) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items() if key != "raw_response")
+        return f"{type(self).__name__}({fields})"
+
+
+class ChatResult(ApiResult):
+    """Successful chat completion"""
+
+    __slots__ = ("message", "cached", "raw_response")
+    _fields = ("success", "message")
+    _optional = ("cached", "raw_response")
+
+    def __init__(self, message: str, cached: Optional[bool] = None, raw_response: Optional[Dict[str, Any]] = None):
+        self.message = message
+        self.cached = cached
+        self.raw_response = raw_response
+
+
+class TranslateResult(ApiResult):
+    """Successful translation; translate_long also reports chunk counts"""
+
+    __slots__ = ("translated_text", "cached", "chunks", "failed_chunks", "raw_response")
+    _fields = ("success", "translated_text")
+    _optional = ("cached", "chunks", "failed_chunks", "raw_response")
+
+    def __init__(
+        self,
+        translated_text: str,
+        cached: Optional[bool] = None,
+        chunks: Optional[int] = None,
+        failed_chunks: Optional[int] = None,
+        raw_response: Optional[Dict[str, Any]] = None
+    ):
+        self.translated_text = translated_text
+        self.cached = cached
+        self.chunks = chunks
+        self.failed_chunks = failed_chunks
+        self.raw_response = raw_response
+
+
+class DetectResult(ApiResult):
+    """Successful language detection"""
+
+    __slots__ = ("detected_language", "confidence", "raw_response")
+    _fields = ("success", "detected_language", "confidence")
+    _optional = ("raw_response",)
+
+    def __init__(
+        self,
+        detected_language: Optional[str],
+        confidence: Optional[float],
+        raw_response: Optional[Dict[str, Any]] = None
+    ):
+        self.detected_language = detected_language
+        self.confidence = confidence
+        self.raw_response = raw_response
@@ -1,10 +1,66 @@
 import streamlit as st
+from concurrent.futures import CancelledError
+import sqlite3
 import time
-import requests
-from sarvam_client import SarvamClient
+from streamlit.errors import StreamlitAPIException
+from sarvam_client import SARVAM_BASE_URL, SarvamClient
+from http_transport import PooledTransport
+from translation_cache import TranslationCache
+from response_cache import ResponseCache
 from tiger_mascot import TigerMascot
 from image_tiger import get_simple_tiger_html
 from language_support import LanguageSupport
+from weather import WEATHER_BASE_URL, WeatherProvider
+from conversation_context import ConversationContext
+from conversation_store import ConversationHistory, ConversationStore
+from json_codec import get_codec
+from task_executor import ExecutorFullError, SessionTasks, TaskExecutor
+from request_body import ChatBodyEncoder
+from resilience import Deadline
+from translation_pipeline import StreamingTranslator
+from translation_strategy import NATIVE, TRANSLATE, TranslationStrategy
+from metrics import REGISTRY, MetricsServer, instrument_client
+from tracing import JsonlExporter, OtlpHttpExporter, RecentTraces, Tracer, trace_client, waterfall_rows
+
+# Messages rendered per page of chat history
+HISTORY_PAGE_SIZE = 30
+
+# Reply characters read before deciding whether it still needs translating
+SCRIPT_CHECK_CHARS = 48
+
+# Appended to a reply cut off at the turn's deadline
+TRUNCATED_NOTE = "\n\n*⏱️ Reply cut short to stay within the response time limit.*"
+
+# Seconds between refreshes of a running turn's progress
+REPLY_POLL_SECONDS = 0.25
+
+# How non-English replies are produced; "auto" lets TranslationStrategy decide per language
+REPLY_MODES = {
+    "auto": "⚡ Auto (fastest)",
+    NATIVE: "🗣️ Answer in my language",
+    TRANSLATE: "🔄 Translate English answer"
+}
+
+SCRIPT_RUN_SECONDS = REGISTRY.histogram(
+    "script_run_seconds",
+    "Streamlit script execution time; scope 'app' is a full rerun, 'chat_area' the chat fragment",
+    ("scope",)
+)
+OPERATION_SECONDS = REGISTRY.histogram(
+    "operation_seconds",
+    "End-to-end time of a user-facing operation, including cache hits and retries",
+    ("operation", "outcome")
+)
+UPSTREAM_TASK_SECONDS = REGISTRY.histogram(
+    "upstream_task_seconds",
+    "Time background upstream tasks spent queued and running",
+    ("task", "phase", "outcome")
+)
+TURN_DEADLINE_TOTAL = REGISTRY.counter(
+    "turn_deadline_total",
+    "User turns by deadline outcome: met, degraded (optional stages skipped) or exceeded",
+    ("turn", "outcome")
+)
 
 # Page configuration
 st.set_page_config(
@@ -14,11 +70,65 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Recent traces kept in memory for the sidebar waterfall
+@st.cache_resource
+def get_recent_traces():
+    return RecentTraces()
+
+# One tracer per process; exporters are chosen through st.secrets
+@st.cache_resource
+def get_tracer():
+    exporters = [get_recent_traces()]
+    if st.secrets.get("TRACE_EXPORT_PATH"):
+        exporters.append(JsonlExporter(st.secrets["TRACE_EXPORT_PATH"]))
+    if st.secrets.get("TRACE_OTLP_ENDPOINT"):
+        exporters.append(OtlpHttpExporter(st.secrets["TRACE_OTLP_ENDPOINT"]))
+    tracer = Tracer(
+        sample_rate=float(st.secrets.get("TRACE_SAMPLE_RATE", 1.0)),
+        exporters=exporters
+    )
+    REGISTRY.register_stats("tracing", "Tracing counters", tracer.stats)
+    return tracer
+
 # Initialize Sarvam client using st.secrets
 @st.cache_resource
 def get_sarvam_client():
     api_key = st.secrets.get("SARVAM_API_KEY", "default_api_key")
-    return SarvamClient(api_key)
+    # One pooled transport shared by every session in this process
+    transport = PooledTransport(
+        pool_maxsize=int(st.secrets.get("SARVAM_POOL_MAXSIZE", 10)),
+        connect_timeout=float(st.secrets.get("SARVAM_CONNECT_TIMEOUT", 3.05))
+    )
+    translation_cache = TranslationCache(
+        max_memory_bytes=int(st.secrets.get("TRANSLATION_CACHE_BYTES", 4 * 1024 * 1024)),
+        db_path=st.secrets.get("TRANSLATION_CACHE_PATH", ".cache/translations.sqlite3")
+    )
+    # Response caching is opt-in: cached answers skip the model entirely
+    response_cache = None
+    if st.secrets.get("RESPONSE_CACHE_ENABLED", False):
+        response_cache = ResponseCache(
+            max_entries_per_language=int(st.secrets.get("RESPONSE_CACHE_ENTRIES", 500)),
+            semantic_threshold=float(st.secrets.get("RESPONSE_CACHE_SIMILARITY", 0.9))
+        )
+    client = SarvamClient(
+        api_key,
+        transport=transport,
+        translation_cache=translation_cache,
+        response_cache=response_cache,
+        max_translate_workers=int(st.secrets.get("TRANSLATE_WORKERS", 4)),
+        base_url=st.secrets.get("SARVAM_BASE_URL", SARVAM_BASE_URL),
+        codec=get_codec(st.secrets.get("JSON_CODEC") or None),
+        keep_raw_response=bool(st.secrets.get("SARVAM_DEBUG", False))
+    )
+    instrument_client(client, service="sarvam")
+    trace_client(client, get_tracer())
+    REGISTRY.register_stats("translation_cache", "Translation cache counters", translation_cache.stats)
+    if response_cache is not None:
+        REGISTRY.register_stats("response_cache", "Chat response cache counters", response_cache.stats)
+    REGISTRY.register_stats("sarvam_pool", "Sarvam connection pool counters", client.pool_stats)
+    REGISTRY.register_stats("sarvam_resilience", "Circuit breaker and retry counters by endpoint", client.resilience_stats)
+    REGISTRY.register_stats("sarvam_coalescing", "Coalesced translate/detect calls", client.coalescing_stats)
+    return client
 
 # Initialize tiger mascot
 @st.cache_resource
@@ -30,18 +140,61 @@ def get_tiger_mascot():
 def get_language_support():
     return LanguageSupport()
 
+# Append-only conversation log shared by every session in this process
+@st.cache_resource
+def get_conversation_store():
+    db_path = st.secrets.get("CONVERSATION_DB_PATH", ".cache/conversations.sqlite3")
+    if not db_path:
+        return None
+    try:
+        store = ConversationStore(
+            db_path,
+            retention_days=float(st.secrets.get("CONVERSATION_RETENTION_DAYS", 30))
+        )
+    except (OSError, sqlite3.Error):
+        # Read-only or full disk: keep conversations in memory only
+        return None
+    REGISTRY.register_stats("conversation_store", "Conversation store writer counters", store.stats)
+    return store
+
 def initialize_session_state():
     """Initialize session state variables"""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    if "history" not in st.session_state:
+        # The conversation ID lives in the URL so a reload or reconnect resumes the chat;
+        # it is the conversation's only credential, so the link must be kept private
+        st.session_state.history = ConversationHistory.restore(
+            get_conversation_store(),
+            st.query_params.get("conversation", ""),
+            max_in_memory=int(st.secrets.get("CONVERSATION_MEMORY_MESSAGES", 200)),
+            max_bytes=int(st.secrets.get("CONVERSATION_MEMORY_BYTES", 512 * 1024)),
+            compress_after=int(st.secrets.get("CONVERSATION_COMPRESS_AFTER", 50))
+        )
+        st.query_params["conversation"] = st.session_state.history.conversation_id
     if "dark_mode" not in st.session_state:
         st.session_state.dark_mode = False
     if "tiger_state" not in st.session_state:
         st.session_state.tiger_state = "idle"
     if "selected_language" not in st.session_state:
         st.session_state.selected_language = "en-IN"
-    if "auto_translate" not in st.session_state:
-        st.session_state.auto_translate = False
+    if "reply_mode" not in st.session_state:
+        st.session_state.reply_mode = "auto"
+    if "history_window" not in st.session_state:
+        st.session_state.history_window = HISTORY_PAGE_SIZE
+    if "conversation_context" not in st.session_state:
+        st.session_state.conversation_context = ConversationContext(
+            budget_tokens=int(st.secrets.get("CONTEXT_BUDGET_TOKENS", 3000)),
+            keep_recent=int(st.secrets.get("CONTEXT_KEEP_RECENT", 6))
+        )
+    if "body_encoder" not in st.session_state:
+        # Messages sent on earlier turns are spliced into request bodies already encoded
+        st.session_state.body_encoder = ChatBodyEncoder(get_sarvam_client().codec)
+        # The turn whose worker last used the encoder
+        st.session_state.body_encoder_task = None
+    if "tasks" not in st.session_state:
+        # This session's handle on the shared executor: a new prompt supersedes a pending turn
+        st.session_state.tasks = SessionTasks(get_task_executor())
+        st.session_state.turn_progress = None
+        st.session_state.turn_error = None
 
 def apply_dark_theme():
     """Dark theme styling"""
@@ -61,50 +214,507 @@ def apply_light_theme():
     </style>
     """
 
+def show_older_messages():
+    """Pager callback: reveal another page of older chat history, reading it from the store if needed"""
+    history = st.session_state.history
+    shown = st.session_state.history_window
+    if shown + HISTORY_PAGE_SIZE > len(history.messages):
+        history.load_older(shown + HISTORY_PAGE_SIZE - len(history.messages))
+    st.session_state.history_window += HISTORY_PAGE_SIZE
+
+def rerun_chat_area():
+    """Rerun only the chat fragment, or the whole script when not inside a fragment rerun"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
 def render_tiger_mascot(tiger_mascot, state):
     animation_class = tiger_mascot.get_animation_class(state)
     tiger_html = get_simple_tiger_html(state=state, animation_class=animation_class)
     st.markdown(tiger_html, unsafe_allow_html=True)
 
-# ✅ ✅ ✅ UPDATED: WeatherAPI version
-def get_weather(city: str):
+# Initialize weather provider (shared cache across sessions)
+@st.cache_resource
+def get_weather_provider():
     api_key = st.secrets.get("WEATHER_API_KEY", "default_weather_api_key")
-    base_url = "http://api.weatherapi.com/v1/current.json"
-    params = {
-        "key": api_key,
-        "q": city,
-        "aqi": "no"
-    }
+    provider = WeatherProvider(
+        api_key,
+        base_url=st.secrets.get("WEATHER_BASE_URL", WEATHER_BASE_URL)
+    )
+    instrument_client(provider, service="weatherapi")
+    trace_client(provider, get_tracer())
+    REGISTRY.register_stats("weather_cache", "Weather cache and fetch counters", provider.stats)
+    return provider
+
+# Bounded worker pool running chat turns off the script thread, shared by all sessions
+@st.cache_resource
+def get_task_executor():
+    def observe(task):
+        outcome = "superseded" if task.superseded else "cancelled" if task.cancelled else "done"
+        if task.queue_seconds is not None:
+            UPSTREAM_TASK_SECONDS.observe(task.queue_seconds, task=task.name, phase="queued", outcome=outcome)
+        if task.run_seconds is not None:
+            UPSTREAM_TASK_SECONDS.observe(task.run_seconds, task=task.name, phase="running", outcome=outcome)
+
+    executor = TaskExecutor(
+        max_workers=int(st.secrets.get("UPSTREAM_WORKERS", 8)),
+        max_queue=int(st.secrets.get("UPSTREAM_QUEUE", 32)),
+        on_finish=observe
+    )
+    REGISTRY.register_stats("upstream_executor", "Upstream task executor queue depth, task ages and counters", executor.stats)
+    return executor
+
+# Per-language native vs translate-after figures, shared by all sessions
+@st.cache_resource
+def get_translation_strategy():
+    strategies = TranslationStrategy(
+        min_samples=int(st.secrets.get("STRATEGY_MIN_SAMPLES", 3)),
+        explore_every=int(st.secrets.get("STRATEGY_EXPLORE_EVERY", 20))
+    )
+
+    def collect():
+        return [
+            ("", {"language": language, "path": path, "stat": stat}, float(value))
+            for language, paths in strategies.stats().items()
+            for path, stats in paths.items()
+            for stat, value in stats.items()
+            if value is not None
+        ]
+
+    REGISTRY.register_collector(
+        "translation_strategy", "Native generation vs translate-after turns, latency and reliability by language", collect
+    )
+    return strategies
+
+# Prometheus endpoint next to the Streamlit server, enabled by setting METRICS_PORT
+@st.cache_resource
+def get_metrics_server():
+    port = int(st.secrets.get("METRICS_PORT", 0))
+    if not port:
+        return None
     try:
-        response = requests.get(base_url, params=params)
-        data = response.json()
-        if response.status_code == 200:
-            location = data["location"]["name"]
-            region = data["location"]["region"]
-            country = data["location"]["country"]
-            temp_c = data["current"]["temp_c"]
-            feelslike_c = data["current"]["feelslike_c"]
-            condition = data["current"]["condition"]["text"]
-            humidity = data["current"]["humidity"]
-            wind_kph = data["current"]["wind_kph"]
-
-            result = (
-                f"**Weather in {location}, {region}, {country}**\n"
-                f"- Condition: {condition}\n"
-                f"- Temperature: {temp_c}°C (Feels like {feelslike_c}°C)\n"
-                f"- Humidity: {humidity}%\n"
-                f"- Wind Speed: {wind_kph} kph"
+        return MetricsServer(REGISTRY, st.secrets.get("METRICS_HOST", "127.0.0.1"), port).start()
+    except OSError:
+        # Port taken, e.g. by another replica on this host
+        return None
+
+def new_turn_deadline():
+    """Start the latency budget for one user turn"""
+    return Deadline(float(st.secrets.get("TURN_DEADLINE_SECONDS", 45)))
+
+def record_turn_deadline(turn_span, deadline, turn):
+    """Count the turn's deadline outcome and attach it to the turn's trace"""
+    outcome = deadline.outcome()
+    TURN_DEADLINE_TOTAL.inc(turn=turn, outcome=outcome)
+    turn_span.set_attribute("deadline_outcome", outcome)
+    turn_span.set_attribute("deadline_remaining_ms", round(deadline.remaining() * 1000))
+    if deadline.degraded:
+        turn_span.set_attribute("degraded", ",".join(deadline.degraded))
+
+def get_weather(city: str, deadline=None):
+    started = time.perf_counter()
+    result = get_weather_provider().get_weather(city, deadline=deadline)
+    outcome = ("cached" if result.get("cached") else "ok") if result["success"] else "error"
+    OPERATION_SECONDS.observe(time.perf_counter() - started, operation="get_weather", outcome=outcome)
+    if result["success"]:
+        if result.get("stale"):
+            minutes = max(int(result["age_seconds"] // 60), 1)
+            return result["report"] + f"\n\n*🕒 As of {minutes} min ago; an update is on its way.*"
+        return result["report"]
+    return f"❌ {result['error']}"
+
+@st.fragment
+def chat_area(sarvam_client, tiger_mascot, language_support):
+    """Chat history, input and reply streaming, rerun in isolation from the rest of the page"""
+    with SCRIPT_RUN_SECONDS.time(scope="chat_area"):
+        render_chat_area(sarvam_client, tiger_mascot, language_support)
+
+def remember_trace(turn_span):
+    """Keep the finished turn's trace ID for the sidebar waterfall"""
+    if turn_span.sampled:
+        st.session_state.last_trace_id = turn_span.trace_id
+
+def render_trace_waterfall(spans):
+    rows = waterfall_rows(spans)
+    total = max((row["offset_ms"] + row["duration_ms"] for row in rows), default=0.0) or 1.0
+    html = ['<div style="font-size: 0.75rem; font-family: monospace;">']
+    for row in rows:
+        left = row["offset_ms"] / total * 100
+        width = max(row["duration_ms"] / total * 100, 0.5)
+        color = "#e74c3c" if row["status"] == "error" else "#ff6b35"
+        html.append(
+            f'<div style="margin: 2px 0;">'
+            f'<div style="padding-left: {row["depth"] * 0.75}rem;">{row["name"]} · {row["duration_ms"]:.0f} ms</div>'
+            f'<div style="position: relative; height: 6px; background: rgba(128, 128, 128, 0.15);">'
+            f'<div style="position: absolute; left: {left:.2f}%; width: {width:.2f}%; height: 6px; background: {color};"></div>'
+            f'</div></div>'
+        )
+    html.append("</div>")
+    st.markdown("".join(html), unsafe_allow_html=True)
+
+@st.fragment
+def trace_waterfall():
+    """Timing waterfall of this session's last traced turn, refreshable without a full rerun"""
+    trace_id = st.session_state.get("last_trace_id")
+    spans = get_recent_traces().get(trace_id) if trace_id else []
+    if spans:
+        st.caption(f"Trace `{trace_id[:16]}`")
+        render_trace_waterfall(spans)
+    else:
+        st.caption("No traced turn yet.")
+    st.button("🔄 Refresh timings", key="refresh_trace_waterfall")
+
+def reply_strategy_stats(language):
+    """Native vs translate-after figures for the session's language"""
+    strategies = get_translation_strategy()
+    paths = strategies.stats().get(language)
+    if not paths:
+        st.caption("No replies in this language yet.")
+        return
+    preferred = strategies.preferred(language)
+    if st.session_state.reply_mode == "auto" and preferred is not None:
+        st.caption(f"Auto currently prefers: **{REPLY_MODES[preferred]}**")
+    st.dataframe(
+        [
+            {
+                "path": path,
+                "turns": stats["turns"],
+                "success %": round(100 * stats["successes"] / stats["turns"]) if stats["turns"] else None,
+                "latency s": stats["latency_seconds"],
+                "hops skipped": stats["hops_skipped"]
+            }
+            for path, stats in paths.items()
+        ],
+        hide_index=True
+    )
+
+def run_chat_turn(
+    token, sarvam_client, messages, language, strategy, progress, deadline, translate_reserve,
+    strategies, language_support
+):
+    """
+    Worker side of a chat turn: stream the reply and, if needed, translate it
+
+    Runs on the upstream executor, never on the script thread, so it must not
+    call Streamlit. The script thread reads `progress` to show partial text.
+    For a non-English turn (strategy set), the first SCRIPT_CHECK_CHARS of the
+    reply decide whether it is already in the language's script; only if it
+    is not is it translated, sentence by sentence while it streams. Every
+    upstream call is bounded by the turn's deadline: translation is skipped
+    when less than translate_reserve seconds are left, and once the deadline
+    passes the reply is delivered as far as it got. How the turn went,
+    failures included, is recorded in `strategies` for the language and
+    path; cancelled turns are not.
+
+    Returns:
+        Dictionary with success status and message/translated/truncated or
+        error; "cancelled" is set when a newer prompt superseded the turn
+    """
+    tracer = get_tracer()
+    chat_started = time.perf_counter()
+
+    def record_strategy(success, skipped_hop=False):
+        # Every outcome counts, so failing or slow paths are not mistaken for cheap ones
+        if strategy is not None:
+            strategies.record(language, strategy, time.perf_counter() - chat_started, success, skipped_hop)
+
+    with tracer.span("chat_request", messages=len(messages)) as request_span:
+        body_encoder = progress["body_encoder"]
+        response = sarvam_client.stream_chat_completion(
+            messages=messages,
+            temperature=0.8,
+            cache_language=language,
+            body_encoder=body_encoder,
+            deadline=deadline
+        )
+        if not response.get("cached"):
+            request_span.set_attribute("body_bytes_encoded", body_encoder.last_encoded_bytes)
+            request_span.set_attribute("body_bytes_reused", body_encoder.last_reused_bytes)
+    if not response["success"]:
+        OPERATION_SECONDS.observe(time.perf_counter() - chat_started, operation="chat_completion", outcome="error")
+        record_strategy(False)
+        return response
+
+    translator = None
+    # True until the reply's script is known; English turns are never translated
+    checking_script = strategy is not None
+    skipped_hop = False
+
+    def check_script(text):
+        nonlocal translator, checking_script, skipped_hop
+        checking_script = False
+        if language_support.is_in_language_script(text, language):
+            skipped_hop = True
+        elif deadline.allows(translate_reserve):
+            # Translate sentence by sentence while the reply is still streaming
+            translator = StreamingTranslator(
+                sarvam_client, source_language="en-IN", target_language=language, deadline=deadline
             )
-            return result
+            translator.feed(text)
         else:
-            error_message = data.get("error", {}).get("message", "Unknown error")
-            return f"❌ Could not fetch weather: {error_message}"
+            deadline.degrade("translate")
+
+    stream = response["stream"]
+    with tracer.span("stream", cached=bool(response.get("cached"))) as stream_span:
+        chunks = []
+        streamed = 0
+        truncated = False
+        try:
+            for delta in stream:
+                if token.cancelled:
+                    # Closing the generator hands the connection back to the pool
+                    stream.close()
+                    if translator is not None:
+                        translator.cancel()
+                    return {"success": False, "error": "Superseded by a newer message", "cancelled": True}
+                chunks.append(delta)
+                streamed += len(delta)
+                if translator is not None:
+                    translator.feed(delta)
+                    progress["text"] = translator.ready_text()
+                elif checking_script and streamed >= SCRIPT_CHECK_CHARS:
+                    check_script("".join(chunks))
+                    progress["text"] = translator.ready_text() if translator is not None else "".join(chunks)
+                elif not (checking_script and strategy == TRANSLATE):
+                    # An English draft about to be translated is not shown
+                    progress["text"] = "".join(chunks)
+                if deadline.expired:
+                    stream.close()
+                    truncated = True
+                    break
+        except Exception:
+            # A read timed out at the deadline: keep what already arrived
+            if not chunks or not deadline.expired:
+                if translator is not None:
+                    translator.cancel()
+                record_strategy(False)
+                raise
+            truncated = True
+        if truncated:
+            deadline.mark_exceeded()
+            stream_span.set_attribute("truncated", True)
+        ai_response = "".join(chunks)
+    if not ai_response:
+        OPERATION_SECONDS.observe(time.perf_counter() - chat_started, operation="chat_completion", outcome="error")
+        record_strategy(False)
+        return {"success": False, "error": "No response choices found in API response"}
+    OPERATION_SECONDS.observe(
+        time.perf_counter() - chat_started,
+        operation="chat_completion",
+        outcome="cached" if response.get("cached") else "ok"
+    )
+    if checking_script:
+        # Short reply: decide on all of it
+        check_script(ai_response)
+
+    translated = None
+    if translator is not None and not deadline.allows(translate_reserve) and not translator.done():
+        # Too little time left to wait for the rest: show the English reply
+        translator.cancel()
+        deadline.degrade("translate")
+        translator = None
+    if translator is not None:
+        with tracer.span("translate", target_language=language):
+            translate_started = time.perf_counter()
+            translator.flush()
+            while not translator.done():
+                if token.cancelled:
+                    translator.cancel()
+                    return {"success": False, "error": "Superseded by a newer message", "cancelled": True}
+                if deadline.expired:
+                    # Chunks still running end by the deadline; the rest stay in English
+                    translator.cancel()
+                    deadline.degrade("translate")
+                    break
+                progress["text"] = translator.ready_text()
+                time.sleep(0.05)
+            translation_result = translator.finish()
+            OPERATION_SECONDS.observe(
+                time.perf_counter() - translate_started,
+                operation="translate_reply",
+                outcome="ok" if translation_result["success"] else "error"
+            )
+        if translation_result["success"]:
+            translated = translation_result["translated_text"]
+
+    if not response.get("cached"):
+        # Native generation only succeeds if no translation had to rescue it;
+        # a reply cut off at the deadline fails either way
+        if truncated:
+            success = False
+        elif strategy == NATIVE:
+            success = skipped_hop
+        else:
+            success = skipped_hop or (translated is not None and not translation_result["failed_chunks"])
+        record_strategy(success, skipped_hop)
+    return {"success": True, "message": ai_response, "translated": translated, "truncated": truncated}
+
+def end_turn_span(turn_span, task, deadline):
+    """Done callback: record the deadline outcome and close the turn's root span however the task ended"""
+    if task.cancelled:
+        turn_span.set_attribute("cancelled", True)
+        turn_span.end()
+        return
+    if task.future.exception() is not None:
+        turn_span.set_error(task.future.exception())
+    elif not task.result()["success"]:
+        turn_span.set_error(task.result()["error"])
+    record_turn_deadline(turn_span, deadline, "chat")
+    turn_span.end()
 
+def start_chat_turn(sarvam_client, language_support, prompt):
+    """Build the request, hand the turn to the upstream executor and record the prompt once accepted"""
+    tracer = get_tracer()
+    history = st.session_state.history
+    language = st.session_state.selected_language
+    strategies = get_translation_strategy()
+    strategy = None
+    if language != "en-IN":
+        mode = st.session_state.reply_mode
+        strategy = strategies.choose(language) if mode == "auto" else mode
+    deadline = new_turn_deadline()
+    translate_reserve = float(st.secrets.get("TRANSLATE_RESERVE_SECONDS", 3))
+    st.session_state.turn_error = None
+
+    turn_span = tracer.start_span("chat_turn", parent=None, language=language)
+    if strategy is not None:
+        turn_span.set_attribute("strategy", strategy)
+    with tracer.use_span(turn_span):
+        with tracer.span("build_messages", history=len(history)):
+            # Translate-after asks for an English answer
+            system_language = "en-IN" if strategy == TRANSLATE else language
+            system_message = language_support.create_system_message_for_language(system_language)
+            # The prompt joins the history only once the executor accepts the turn
+            messages_with_identity = st.session_state.conversation_context.build(
+                system_message, history.messages, offset=history.offset,
+                pending={"role": "user", "content": prompt}
+            )
+        owner = st.session_state.body_encoder_task
+        if owner is not None and not owner.done():
+            # A superseded or cancelled turn may still be encoding with the session's
+            # encoder on its worker; it keeps that one and the session moves to a new one
+            st.session_state.body_encoder = ChatBodyEncoder(sarvam_client.codec)
+        progress = {"text": "", "body_encoder": st.session_state.body_encoder}
+        try:
+            task = st.session_state.tasks.submit(
+                "chat_turn", run_chat_turn,
+                sarvam_client, messages_with_identity, language, strategy, progress,
+                deadline, translate_reserve, strategies, language_support
+            )
+        except ExecutorFullError as e:
+            turn_span.set_error(e)
+            turn_span.end()
+            st.session_state.turn_error = "Mufasa is busy with other conversations. Please try again in a moment."
+            st.session_state.tiger_state = "sad"
+            return
+    # A cancelled or superseded turn leaves this prompt unanswered; the next
+    # request merges it with the following prompt so roles still alternate
+    history.append("user", prompt)
+    task.future.add_done_callback(lambda _: end_turn_span(turn_span, task, deadline))
+    st.session_state.body_encoder_task = task
+    st.session_state.turn_progress = progress
+    st.session_state.tiger_state = "thinking"
+    remember_trace(turn_span)
+
+def deliver_chat_turn(task):
+    """Script side: store the finished turn's reply, or remember its error for display"""
+    try:
+        result = task.result()
+    except CancelledError:
+        return
     except Exception as e:
-        return f"❌ Error fetching weather: {str(e)}"
+        st.session_state.turn_error = f"❌ Unexpected error: {str(e)}"
+        st.session_state.tiger_state = "confused"
+        return
+    if result.get("cancelled"):
+        return
+    if result["success"]:
+        message, translated = result["message"], result["translated"]
+        if result.get("truncated"):
+            # Kept in the stored text so both the reader and the model's next turn know
+            message += TRUNCATED_NOTE
+            translated = translated + TRUNCATED_NOTE if translated else translated
+        st.session_state.history.append("assistant", message, translated=translated)
+        st.session_state.tiger_state = "happy"
+    else:
+        st.session_state.turn_error = f"❌ Error: {result.get('error', 'Unknown error occurred')}"
+        st.session_state.tiger_state = "sad"
+
+def render_chat_area(sarvam_client, tiger_mascot, language_support):
+    tracer = get_tracer()
+    tasks = st.session_state.tasks
+    finished = tasks.take("chat_turn")
+    if finished is not None:
+        deliver_chat_turn(finished)
+
+    mascot_placeholder = st.empty()
+    with mascot_placeholder.container():
+        render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
+
+    history = st.session_state.history
+    messages = history.messages
+    start = max(len(messages) - st.session_state.history_window, 0)
+    hidden = start + (history.offset if history.has_older else 0)
+    if hidden:
+        st.button(
+            f"⬆️ Load older messages ({hidden} hidden)",
+            key="load_older_messages",
+            on_click=show_older_messages
+        )
+    for message in messages[start:]:
+        with st.chat_message(message.role):
+            st.markdown(message.display())
+    if st.session_state.turn_error:
+        st.markdown(f'<div class="error-message">{st.session_state.turn_error}</div>', unsafe_allow_html=True)
+
+    chat_placeholder = language_support.get_chat_placeholder(st.session_state.selected_language)
+    if prompt := st.chat_input(chat_placeholder):
+        if prompt.lower().startswith("weather in"):
+            city_name = prompt[10:].strip()
+            deadline = new_turn_deadline()
+            with tracer.trace("weather_turn", city=city_name) as turn_span:
+                weather = get_weather(city_name, deadline)
+                record_turn_deadline(turn_span, deadline, "weather")
+            remember_trace(turn_span)
+            history.append("assistant", weather)
+            with st.chat_message("assistant"):
+                st.markdown(weather)
+            st.session_state.tiger_state = "happy"
+            rerun_chat_area()
+        else:
+            start_chat_turn(sarvam_client, language_support, prompt)
+            with st.chat_message("user"):
+                st.markdown(prompt)
+            with mascot_placeholder.container():
+                render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
+
+    if tasks.current("chat_turn") is not None:
+        pending_reply(language_support.get_thinking_message(st.session_state.selected_language))
+
+@st.fragment(run_every=REPLY_POLL_SECONDS)
+def pending_reply(thinking_message):
+    """
+    Show the running turn's progress; Streamlit reruns this every REPLY_POLL_SECONDS
+    instead of a script run sleeping until the turn is done
+
+    Args:
+        thinking_message: Placeholder shown until the first tokens arrive
+    """
+    pending = st.session_state.tasks.current("chat_turn")
+    if pending is None or pending.done():
+        # One full rerun per turn: the chat area delivers the reply and this poller goes away
+        st.rerun()
+    text = st.session_state.turn_progress["text"]
+    with st.chat_message("assistant"):
+        if text:
+            st.markdown(text + "▌")
+        else:
+            st.markdown(f'<div class="loading-message">{thinking_message}</div>', unsafe_allow_html=True)
 
 def main():
     initialize_session_state()
+    get_metrics_server()
 
     sarvam_client = get_sarvam_client()
     tiger_mascot = get_tiger_mascot()
@@ -134,89 +744,31 @@ def main():
 
     col1, col2, col3 = st.columns([2, 1, 1])
     with col2:
-        language_options = language_support.get_language_options()
-        current_lang_display = None
-        for display, code in language_options.items():
-            if code == st.session_state.selected_language:
-                current_lang_display = display
-                break
+        catalog = language_support.catalog
         selected_display = st.selectbox(
             "🌐 Language",
-            options=list(language_options.keys()),
-            index=list(language_options.keys()).index(current_lang_display) if current_lang_display else 0,
+            options=catalog.display_names,
+            index=catalog.index_of(st.session_state.selected_language),
             key="language_selector"
         )
-        new_language = language_options[selected_display]
+        new_language = catalog.code_for_display(selected_display)
         if new_language != st.session_state.selected_language:
             st.session_state.selected_language = new_language
+            # A reply still being generated for the old language is no longer wanted
+            st.session_state.tasks.cancel("chat_turn")
             st.rerun()
 
     with col3:
-        st.session_state.auto_translate = st.checkbox(
-            "🔄 Auto-translate",
-            value=st.session_state.auto_translate,
-            help="Automatically translate responses to your selected language"
+        st.session_state.reply_mode = st.selectbox(
+            "🔄 Reply mode",
+            options=list(REPLY_MODES),
+            index=list(REPLY_MODES).index(st.session_state.reply_mode),
+            format_func=REPLY_MODES.get,
+            help="How replies in your language are produced: Mufasa answering in it directly, "
+                 "or answering in English and translating. Auto picks whichever has been faster "
+                 "and reliable for your language."
         )
 
-    render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
-
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-    chat_placeholder = language_support.get_chat_placeholder(st.session_state.selected_language)
-    if prompt := st.chat_input(chat_placeholder):
-        if prompt.lower().startswith("weather in"):
-            city_name = prompt[10:].strip()
-            weather = get_weather(city_name)
-            st.session_state.messages.append({"role": "assistant", "content": weather})
-            with st.chat_message("assistant"):
-                st.markdown(weather)
-            st.session_state.tiger_state = "happy"
-            st.rerun()
-        else:
-            st.session_state.messages.append({"role": "user", "content": prompt})
-            with st.chat_message("user"):
-                st.markdown(prompt)
-            st.session_state.tiger_state = "thinking"
-            render_tiger_mascot(tiger_mascot, st.session_state.tiger_state)
-            with st.chat_message("assistant"):
-                message_placeholder = st.empty()
-                thinking_message = language_support.get_thinking_message(st.session_state.selected_language)
-                message_placeholder.markdown(f'<div class="loading-message">{thinking_message}</div>', unsafe_allow_html=True)
-                try:
-                    system_message = language_support.create_system_message_for_language(st.session_state.selected_language)
-                    messages_with_identity = st.session_state.messages.copy()
-                    if not messages_with_identity or messages_with_identity[0].get("role") != "system":
-                        messages_with_identity.insert(0, system_message)
-                    else:
-                        messages_with_identity[0] = system_message
-                    response = sarvam_client.chat_completion(messages=messages_with_identity, temperature=0.8)
-                    if response["success"]:
-                        ai_response = response["message"]
-                        if (st.session_state.auto_translate and st.session_state.selected_language != "en-IN"):
-                            translation_result = sarvam_client.translate_text(
-                                text=ai_response,
-                                source_language="en-IN",
-                                target_language=st.session_state.selected_language
-                            )
-                            if translation_result["success"]:
-                                translated = translation_result["translated_text"]
-                                ai_response = f"{translated}\n\n---\n*Original (English):* {ai_response}"
-                        st.session_state.tiger_state = "excited"
-                        message_placeholder.markdown(ai_response)
-                        st.session_state.messages.append({"role": "assistant", "content": ai_response})
-                        time.sleep(0.5)
-                        st.session_state.tiger_state = "happy"
-                    else:
-                        error_msg = f"❌ Error: {response.get('error', 'Unknown error occurred')}"
-                        message_placeholder.markdown(f'<div class="error-message">{error_msg}</div>', unsafe_allow_html=True)
-                        st.session_state.tiger_state = "sad"
-                except Exception as e:
-                    message_placeholder.markdown(f'<div class="error-message">❌ Unexpected error: {str(e)}</div>', unsafe_allow_html=True)
-                    st.session_state.tiger_state = "confused"
-            st.rerun()
-
     with st.sidebar:
         st.markdown("### 🦁 Mufasa - Your AI Companion")
         st.markdown("Mufasa is your wise AI assistant created by **Jeet Borah**. Powered by Sarvam AI, always ready to help.")
@@ -237,6 +789,13 @@ def main():
         st.markdown("- **Sad**: Error")
         st.markdown("- **Confused**: Unexpected error")
 
+        st.markdown("### ⏱️ Last Turn Timing")
+        trace_waterfall()
+
+        if st.session_state.selected_language != "en-IN":
+            st.markdown("### 🔀 Reply Strategy")
+            reply_strategy_stats(st.session_state.selected_language)
+
         st.markdown("### ☁️ Weather")
         city = st.text_input("Enter city name for weather")
         if st.button("🔍 Get Weather"):
@@ -247,7 +806,10 @@ def main():
                 st.warning("Please enter a city name.")
 
         if st.button("🗑️ Clear Chat History"):
-            st.session_state.messages = []
+            st.session_state.tasks.cancel("chat_turn")
+            st.session_state.turn_error = None
+            st.query_params["conversation"] = st.session_state.history.clear()
+            st.session_state.history_window = HISTORY_PAGE_SIZE
             st.session_state.tiger_state = "idle"
             st.rerun()
 
@@ -257,7 +819,11 @@ def main():
         else:
             st.success("✅ SARVAM API key configured")
 
+    # Last, so the sidebar is not held back while a pending turn streams in
+    chat_area(sarvam_client, tiger_mascot, language_support)
+
     st.markdown('</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
+    with SCRIPT_RUN_SECONDS.time(scope="app"):
+        main()
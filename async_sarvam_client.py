@@ -0,0 +1,444 @@
+"""
+Asyncio client for the Sarvam AI API
+Same surface, result shape, retries, circuit breakers and call hooks as
+SarvamClient, built on httpx
+"""
+
+import asyncio
+import threading
+from typing import List, Dict, Any, Awaitable, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from sarvam_client import (
+    SARVAM_BASE_URL,
+    SarvamClient,
+    build_chat_payload,
+    build_translate_payload,
+    chat_error_result,
+    chat_result_from_data,
+    detect_result_from_data,
+    translate_result_from_data
+)
+from call_hooks import CallHooks, Hook
+from json_codec import DEFAULT_CODEC, JSONDecodeError
+from resilience import CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, RetryPolicy
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    httpx counterpart of RetryPolicy.is_retryable_exception: only failures
+    where the request cannot have reached the server are retried
+    """
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+class AsyncSarvamClient:
+    """Asyncio counterpart of SarvamClient with a pooled httpx transport"""
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        connect_timeout: float = 3.05,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        base_url: str = SARVAM_BASE_URL,
+        hooks: Optional[CallHooks] = None,
+        codec=None,
+        keep_raw_response: bool = False
+    ):
+        """
+        Initialize the async client
+
+        Args:
+            api_key: Sarvam API subscription key
+            max_connections: Upper bound on open connections
+            max_keepalive_connections: Idle connections kept alive for reuse
+            connect_timeout: Seconds allowed for the TCP/TLS handshake
+            retry_policy: Retry/backoff policy for safe-to-retry failures
+            circuit_breakers: Breakers keyed by endpoint ("chat", "translate", "detect");
+                pass a SarvamClient's to share its view of the endpoints
+            base_url: API root, e.g. a local stand-in server for load tests
+            hooks: on_request/on_response callbacks fired around every HTTP attempt
+            codec: JSON codec for bodies and responses (see json_codec; orjson when installed)
+            keep_raw_response: Also return each decoded payload as raw_response, for debugging
+        """
+        if httpx is None:
+            raise ImportError("AsyncSarvamClient requires httpx. Install it with: pip install httpx")
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.headers = {
+            "api-subscription-key": api_key,
+            "Content-Type": "application/json"
+        }
+        self.connect_timeout = connect_timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else {
+            endpoint: CircuitBreaker(endpoint) for endpoint in ("chat", "translate", "detect")
+        }
+        self._retry_lock = threading.Lock()
+        self._retries = {endpoint: 0 for endpoint in self.circuit_breakers}
+        self.hooks = hooks if hooks is not None else CallHooks()
+        self.codec = codec if codec is not None else DEFAULT_CODEC
+        self.keep_raw_response = keep_raw_response
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+
+        # httpx connections belong to the event loop that opened them, so the
+        # AsyncClient is created lazily inside whichever loop drives this client
+        self._http: Optional["httpx.AsyncClient"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    def on_request(self, hook: Hook) -> Hook:
+        """Register a callback fired before every HTTP attempt (see call_hooks.CallHooks)"""
+        return self.hooks.on_request(hook)
+
+    def on_response(self, hook: Hook) -> Hook:
+        """Register a callback fired after every HTTP attempt (see call_hooks.CallHooks)"""
+        return self.hooks.on_response(hook)
+
+    def resilience_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker state and retry counts per endpoint
+
+        Returns:
+            Dictionary keyed by endpoint with breaker stats plus "retries"
+        """
+        with self._retry_lock:
+            retries = dict(self._retries)
+        stats = {}
+        for endpoint, breaker in self.circuit_breakers.items():
+            stats[endpoint] = breaker.stats()
+            stats[endpoint]["retries"] = retries.get(endpoint, 0)
+        return stats
+
+    def _client(self) -> "httpx.AsyncClient":
+        if self._http is None:
+            self._http = httpx.AsyncClient(headers=self.headers, limits=self._limits)
+        return self._http
+
+    def _timeout(self, read_timeout: float) -> "httpx.Timeout":
+        return httpx.Timeout(read_timeout, connect=min(self.connect_timeout, read_timeout))
+
+    async def _send(
+        self,
+        endpoint: str,
+        path: str,
+        payload: Dict[str, Any],
+        read_timeout: float,
+        deadline: Optional[Deadline] = None
+    ) -> "httpx.Response":
+        """
+        POST through the endpoint's circuit breaker with retries
+
+        Follows SarvamClient._send: the same retry policy, breaker, hooks and
+        deadline handling, with asyncio sleeps between attempts.
+
+        Raises:
+            CircuitOpenError: The endpoint's breaker is open
+            DeadlineExceeded: The deadline passed before or during an attempt
+        """
+        breaker = self.circuit_breakers[endpoint]
+        policy = self.retry_policy
+        url = f"{self.base_url}{path}"
+        body = self.codec.dumps(payload)
+        attempt = 0
+
+        while True:
+            call = self.hooks.start(endpoint, "POST", url, attempt, False, len(body))
+            timeout = read_timeout
+            if deadline is not None:
+                try:
+                    timeout = deadline.timeout(read_timeout, endpoint)
+                except DeadlineExceeded as e:
+                    self.hooks.finish(call, error=e)
+                    raise
+            if not breaker.allow():
+                error = CircuitOpenError(endpoint, breaker.retry_in())
+                self.hooks.finish(call, error=error)
+                raise error
+
+            try:
+                response = await self._client().post(url, content=body, timeout=self._timeout(timeout))
+            except httpx.HTTPError as e:
+                self.hooks.finish(call, error=e)
+                if deadline is not None and deadline.expired and isinstance(e, httpx.TimeoutException):
+                    # Our budget ran out, which says nothing about the endpoint's health
+                    breaker.release()
+                    deadline.mark_exceeded()
+                    raise DeadlineExceeded(endpoint) from e
+                breaker.record_failure()
+                delay = policy.backoff(attempt) if attempt < policy.max_retries else None
+                delay = SarvamClient._within_deadline(delay, deadline)
+                if delay is None or not is_retryable_error(e):
+                    raise
+            except BaseException as e:
+                # Includes cancellation of the awaiting task: not a verdict on the
+                # endpoint, but a half-open probe slot must not stay taken
+                self.hooks.finish(call, error=e)
+                breaker.release()
+                raise
+            else:
+                self.hooks.finish(call, response.status_code, len(response.content))
+                if not policy.is_retryable_status(response.status_code):
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                delay = None
+                if attempt < policy.max_retries:
+                    delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                delay = SarvamClient._within_deadline(delay, deadline)
+                if delay is None:
+                    return response
+
+            attempt += 1
+            with self._retry_lock:
+                self._retries[endpoint] = self._retries.get(endpoint, 0) + 1
+            await asyncio.sleep(delay)
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "sarvam-m",
+        temperature: float = 0.8,
+        top_p: float = 0.9,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        wiki_grounding: bool = False,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Get chat completion from Sarvam AI
+
+        Takes the same arguments as SarvamClient.chat_completion.
+
+        Returns:
+            Dictionary with success status and response/error message
+        """
+
+        payload = build_chat_payload(
+            messages, model, temperature, top_p, max_tokens, stop,
+            frequency_penalty, presence_penalty, wiki_grounding
+        )
+
+        try:
+            response = await self._send("chat", "/chat/completions", payload, 30, deadline)
+
+            if response.status_code == 200:
+                return chat_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
+
+            return chat_error_result(response)
+
+        except (CircuitOpenError, DeadlineExceeded) as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        except httpx.TimeoutException:
+            return {
+                "success": False,
+                "error": "Request timed out. Please check your internet connection and try again."
+            }
+
+        except httpx.TransportError:
+            return {
+                "success": False,
+                "error": "Connection error. Please check your internet connection."
+            }
+
+        except httpx.HTTPError as e:
+            return {
+                "success": False,
+                "error": f"Request error: {str(e)}"
+            }
+
+        except JSONDecodeError:
+            return {
+                "success": False,
+                "error": "Invalid JSON response from API"
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Unexpected error: {str(e)}"
+            }
+
+    async def translate_text(
+        self,
+        text: str,
+        source_language: str = "en-IN",
+        target_language: str = "hi-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate text using Sarvam AI translation API
+
+        Takes the same arguments as SarvamClient.translate_text.
+
+        Returns:
+            Dictionary with success status and translated text or error
+        """
+
+        payload = build_translate_payload(
+            text, source_language, target_language, speaker_gender, mode
+        )
+
+        try:
+            response = await self._send("translate", "/translate", payload, 15, deadline)
+
+            if response.status_code == 200:
+                return translate_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
+            else:
+                return {
+                    "success": False,
+                    "error": f"Translation failed: HTTP {response.status_code}"
+                }
+
+        except DeadlineExceeded as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Translation error: {str(e)}"
+            }
+
+    async def detect_language(self, text: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Detect the language of given text
+
+        Args:
+            text: Text to analyze
+            deadline: The turn's Deadline (optional)
+
+        Returns:
+            Dictionary with success status and detected language or error
+        """
+
+        try:
+            response = await self._send("detect", "/detect-language", {"input": text}, 10, deadline)
+
+            if response.status_code == 200:
+                return detect_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
+            else:
+                return {
+                    "success": False,
+                    "error": f"Language detection failed: HTTP {response.status_code}"
+                }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Language detection error: {str(e)}"
+            }
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """
+        Test the connection to Sarvam AI API
+
+        Returns:
+            Dictionary with success status and connection info
+        """
+
+        result = await self.chat_completion(
+            messages=[{"role": "user", "content": "Hello"}],
+            temperature=0.1
+        )
+
+        if result["success"]:
+            return {
+                "success": True,
+                "message": "API connection successful"
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"API connection failed: {result.get('error', 'Unknown error')}"
+            }
+
+    def run_sync(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the client's own background event loop
+
+        Lets synchronous callers such as Streamlit script threads use the
+        client without each starting (and tearing down) an event loop, which
+        would throw away the pooled connections every time. A client driven
+        through run_sync should not also be awaited from another loop.
+
+        Args:
+            coro: Coroutine to run, usually built from this client's methods
+            timeout: Seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="sarvam-async-loop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncSarvamClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+async def gather_bounded(
+    calls: List[Awaitable[Dict[str, Any]]],
+    max_concurrency: int = 4
+) -> List[Dict[str, Any]]:
+    """
+    Run several client calls concurrently with bounded parallelism
+
+    Args:
+        calls: Coroutines such as client.translate_text(...)
+        max_concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        Results in the same order as calls; a call that raises is reported
+        as a {"success": False, "error": ...} result
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await call
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": f"Unexpected error: {str(e)}"
+                }
+
+    return await asyncio.gather(*(run(call) for call in calls))
@@ -0,0 +1,68 @@
+"""
+Run the whole benchmark suite and print or save the results as JSON
+Run with: python -m benchmarks [--quick] [--only NAME ...] [--output FILE] [--compare BASELINE]
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+
+from benchmarks.harness import compare, dump, environment
+
+SUITES = (
+    "bench_language_support",
+    "bench_tiger_mascot",
+    "bench_script_detector",
+    "bench_sarvam_client",
+    "bench_conversation_memory",
+    "bench_app_rerun",
+)
+
+# Smaller iteration counts for a fast smoke run
+QUICK_ARGS = {
+    "bench_language_support": {"number": 200},
+    "bench_tiger_mascot": {"number": 200},
+    "bench_script_detector": {"number": 100},
+    "bench_sarvam_client": {"number": 100, "round_trips": 20},
+    "bench_conversation_memory": {"messages": 200},
+    "bench_app_rerun": {"sizes": (10, 100), "runs": 3},
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=SUITES, help="Run only these suites")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations for a smoke run")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or SUITES:
+        module = importlib.import_module(f"benchmarks.{name}")
+        kwargs = QUICK_ARGS.get(name, {}) if args.quick else {}
+        start = time.perf_counter()
+        results.extend(module.run(**kwargs))
+        print(f"{name}: {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    report = {"environment": environment(), "results": results}
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["regressions"] = compare(results, baseline["results"], args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(dump(report))
+    else:
+        print(dump(report))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+End-to-end benchmark: Streamlit rerun latency of app.py at several history sizes
+Uses Streamlit's AppTest harness, so no server or browser is started
+Run with: python -m benchmarks.bench_app_rerun
+"""
+
+import os
+from typing import List, Sequence
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.harness import Record, dump, sample
+from conversation_store import ConversationHistory
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+SECRETS = {
+    "SARVAM_API_KEY": "bench-key",
+    "WEATHER_API_KEY": "bench-key",
+    # Memory-only translation cache: the benchmark must not touch .cache/
+    "TRANSLATION_CACHE_PATH": "",
+    # Memory-only conversations, for the same reason
+    "CONVERSATION_DB_PATH": "",
+}
+
+
+def _history(size: int) -> ConversationHistory:
+    history = ConversationHistory(max_in_memory=size)
+    for i in range(size):
+        history.append(
+            "user" if i % 2 == 0 else "assistant",
+            f"**Message {i}**: the monsoon reaches Mumbai in early June. " * 3
+        )
+    return history
+
+
+def _app(size: int, full_history: bool) -> AppTest:
+    app = AppTest.from_file(APP_PATH, default_timeout=60)
+    for key, value in SECRETS.items():
+        app.secrets[key] = value
+    app.session_state["history"] = _history(size)
+    if full_history:
+        app.session_state["history_window"] = size
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"app.py raised during warm-up: {app.exception[0].message}")
+    return app
+
+
+def run(sizes: Sequence[int] = (10, 100, 1000), runs: int = 10) -> List[Record]:
+    """
+    Time full-script reruns with a pre-populated chat history
+
+    Each size is measured with the default paged history window and with the
+    whole history rendered, which is what every rerun cost before paging.
+
+    Returns:
+        One record per history size and mode
+    """
+    results = []
+    for size in sizes:
+        for full_history in (False, True):
+            app = _app(size, full_history)
+            mode = "full_history" if full_history else "windowed"
+            results.append(sample(
+                f"app_rerun.{mode}.{size}",
+                app.run,
+                runs,
+                messages=size,
+                rendered=len(app.chat_message)
+            ))
+    return results
+
+
+if __name__ == "__main__":
+    print(dump(run()))
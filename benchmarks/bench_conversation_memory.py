@@ -0,0 +1,91 @@
+"""
+Memory benchmark: bytes held per chat message in a session's history
+Compares the old dict messages (translation and English original in one
+string) with ChatMessage records, with and without body compression
+Run with: python -m benchmarks.bench_conversation_memory
+"""
+
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from benchmarks.harness import Record, dump, micro
+from conversation_store import ConversationHistory
+
+ENGLISH = (
+    "The monsoon usually reaches Kerala in the first week of June and Mumbai about ten days later. "
+    "It brings most of the year's rain, so farmers plan their sowing around it. "
+)
+HINDI = (
+    "मानसून आमतौर पर जून के पहले सप्ताह में केरल पहुंचता है और लगभग दस दिन बाद मुंबई। "
+    "इससे साल की अधिकांश बारिश होती है, इसलिए किसान अपनी बुवाई की योजना इसी के अनुसार बनाते हैं। "
+)
+
+
+def _turns(count: int):
+    for i in range(count // 2):
+        yield "user", f"Question {i}: when does the monsoon reach Mumbai?", None
+        yield "assistant", f"{ENGLISH * 3} ({i})", f"{HINDI * 3} ({i})"
+
+
+def _dict_history(count: int) -> list:
+    messages = []
+    for role, content, translated in _turns(count):
+        if translated is not None:
+            content = f"{translated}\n\n---\n*Original (English):* {content}"
+        messages.append({"role": role, "content": content})
+    return messages
+
+
+def _record_history(compress_after: int) -> Callable[[int], ConversationHistory]:
+    def build(count: int) -> ConversationHistory:
+        history = ConversationHistory(max_in_memory=count, compress_after=compress_after)
+        for role, content, translated in _turns(count):
+            history.append(role, content, translated)
+        return history
+    return build
+
+
+def _bytes_per_message(build: Callable[[int], object], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build(count)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del kept
+    return round(used / count, 1)
+
+
+def run(messages: int = 2000) -> List[Record]:
+    """
+    Measure traced allocations per message for each representation
+
+    Returns:
+        One memory record per representation, plus the cost of reading back
+        and rendering a compressed message
+    """
+    variants = (
+        ("dict", _dict_history),
+        ("chat_message", _record_history(0)),
+        ("chat_message_compressed", _record_history(20)),
+    )
+    results: List[Record] = [
+        {
+            "benchmark": f"conversation_memory.{name}",
+            "messages": messages,
+            "bytes_per_message": _bytes_per_message(build, messages)
+        }
+        for name, build in variants
+    ]
+    history = _record_history(20)(messages)
+    old = history.messages[1]
+    results.append(micro("conversation_memory.compressed_display", old.display, number=1000, compressed=old.compressed))
+    results.append(micro("conversation_memory.compressed_payload", old.to_payload, number=1000))
+    return results
+
+
+if __name__ == "__main__":
+    print(dump(run()))
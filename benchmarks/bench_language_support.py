@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: LanguageSupport lookups and local language detection
+Run with: python -m benchmarks.bench_language_support
+"""
+
+from typing import List
+
+from benchmarks.harness import Record, dump, micro
+from language_support import LanguageSupport
+
+TEXTS = {
+    "english": "What is the weather like in Mumbai today?",
+    "hindi": "आज मुंबई में मौसम कैसा है?",
+    "tamil": "இன்று மும்பையில் வானிலை எப்படி இருக்கிறது?",
+    "hinglish": "Aaj ka mausam kaisa hai, मुंबई में?",
+}
+
+
+def run(number: int = 5000) -> List[Record]:
+    """
+    Time the per-rerun lookups the app makes and the local detector
+
+    Returns:
+        One record per operation
+    """
+    support = LanguageSupport()
+    results = [
+        micro("language_support.construct", LanguageSupport, number=max(number // 10, 1)),
+        micro("language_support.get_language_options", support.get_language_options, number),
+        micro("language_support.get_language_name", lambda: support.get_language_name("ta-IN"), number),
+        micro("language_support.get_welcome_message", lambda: support.get_welcome_message("hi-IN"), number),
+        micro("language_support.get_chat_placeholder", lambda: support.get_chat_placeholder("bn-IN"), number),
+        micro("language_support.get_thinking_message", lambda: support.get_thinking_message("kn-IN"), number),
+        micro(
+            "language_support.create_system_message_for_language",
+            lambda: support.create_system_message_for_language("ml-IN"),
+            number
+        ),
+    ]
+    for name, text in TEXTS.items():
+        results.append(micro(
+            f"language_support.detect_language_from_text.{name}",
+            lambda: support.detect_language_from_text(text),
+            number,
+            chars=len(text)
+        ))
+    batch = list(TEXTS.values()) * 25
+    results.append(micro(
+        "language_support.detect_many",
+        lambda: support.detect_many(batch),
+        max(number // 50, 1),
+        texts=len(batch)
+    ))
+    return results
+
+
+if __name__ == "__main__":
+    print(dump(run()))
@@ -0,0 +1,196 @@
+"""
+Micro-benchmark: SarvamClient request building, response parsing and full
+round trips against a local stand-in server (no network access needed)
+Run with: python -m benchmarks.bench_sarvam_client
+"""
+
+import json
+from typing import List
+
+import requests
+
+from benchmarks.harness import Record, dump, micro
+from json_codec import CODECS, DEFAULT_CODEC, orjson
+from loadtest.stand_in import StandInServer
+from request_body import ChatBodyEncoder
+from sarvam_client import (
+    SarvamClient,
+    build_chat_payload,
+    build_translate_payload,
+    chat_result_from_data,
+    translate_result_from_data
+)
+
+HISTORY = [
+    {"role": "system", "content": "You are Mufasa, a wise AI companion."},
+] + [
+    {"role": "user" if i % 2 == 0 else "assistant", "content": f"Message number {i} about the monsoon. " * 4}
+    for i in range(20)
+]
+
+CHAT_RESPONSE = json.dumps({
+    "id": "bench",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Roar! " * 80}}],
+    "usage": {"prompt_tokens": 420, "completion_tokens": 160}
+})
+
+TRANSLATE_RESPONSE = json.dumps({
+    "request_id": "bench",
+    "translated_text": "मानसून जून की शुरुआत में मुंबई पहुंचता है। " * 12,
+    "source_language_code": "en-IN"
+}, ensure_ascii=False)
+
+STREAM_CHUNK = json.dumps({
+    "id": "bench",
+    "choices": [{"index": 0, "delta": {"content": "नमस्ते "}}]
+}, ensure_ascii=False).encode("utf-8")
+
+
+def _response(body: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = body.encode("utf-8")
+    return response
+
+
+def _decode_benchmarks(number: int) -> List[Record]:
+    """Before: response.json() plus a result dict keeping raw_response. After: codec plus lean typed result"""
+    chat = _response(CHAT_RESPONSE)
+    translate = _response(TRANSLATE_RESPONSE)
+
+    def legacy_chat():
+        data = chat.json()
+        return {"success": True, "message": data["choices"][0]["message"]["content"], "raw_response": data}
+
+    def legacy_translate():
+        data = translate.json()
+        return {"success": True, "translated_text": data.get("translated_text", ""), "raw_response": data}
+
+    variants: List[tuple] = [("legacy", legacy_chat, legacy_translate, lambda: json.loads(STREAM_CHUNK.decode("utf-8")))]
+    for name in CODECS:
+        if name == "orjson" and orjson is None:
+            continue
+        codec = CODECS[name]()
+        variants.append((
+            name,
+            lambda codec=codec: chat_result_from_data(codec.loads(chat.content)),
+            lambda codec=codec: translate_result_from_data(codec.loads(translate.content)),
+            lambda codec=codec: codec.loads(STREAM_CHUNK)
+        ))
+
+    results = []
+    for name, decode_chat, decode_translate, decode_chunk in variants:
+        results.append(micro(f"sarvam_client.decode_chat.{name}", decode_chat, number, bytes=len(chat.content)))
+        results.append(micro(f"sarvam_client.decode_translate.{name}", decode_translate, number, bytes=len(translate.content)))
+        results.append(micro(f"sarvam_client.decode_stream_chunk.{name}", decode_chunk, number, bytes=len(STREAM_CHUNK)))
+    return results
+
+
+def _turn_encoding_benchmarks(number: int, sizes=(20, 100)) -> List[Record]:
+    """Body encoding for the next turn of a conversation: from scratch vs cached fragments"""
+    results = []
+    for size in sizes:
+        history = [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                # Short questions, replies of a few paragraphs
+                "content": f"Question {i} about the monsoon?" if i % 2 == 0 else f"Reply {i}: मानसून जून में आता है. " * 40
+            }
+            for i in range(size)
+        ]
+        # A fresh last message per call, as on a real turn
+        turns = [{"role": "user", "content": f"Turn {i}: when does it rain?"} for i in range(64)]
+        encoder = ChatBodyEncoder(DEFAULT_CODEC)
+        counter = iter(range(10 ** 9))
+
+        def payload():
+            messages = history + [turns[next(counter) % len(turns)]]
+            return build_chat_payload(messages, "sarvam-m", 0.8, 0.9, None, None, 0.0, 0.0, False)
+
+        results.append(micro(
+            f"sarvam_client.encode_chat_turn.full.{size}",
+            lambda: DEFAULT_CODEC.dumps(payload()),
+            number,
+            codec=DEFAULT_CODEC.name
+        ))
+        results.append(micro(
+            f"sarvam_client.encode_chat_turn.incremental.{size}",
+            lambda: encoder.encode(payload()),
+            number,
+            codec=DEFAULT_CODEC.name
+        ))
+    return results
+
+
+def run(number: int = 2000, round_trips: int = 200) -> List[Record]:
+    """
+    Time payload construction, parsing and local HTTP round trips
+
+    Returns:
+        One record per operation
+    """
+    results = [
+        micro(
+            "sarvam_client.build_chat_payload",
+            lambda: build_chat_payload(HISTORY, "sarvam-m", 0.8, 0.9, None, None, 0.0, 0.0, False),
+            number,
+            messages=len(HISTORY)
+        ),
+        micro(
+            "sarvam_client.encode_chat_payload",
+            lambda: DEFAULT_CODEC.dumps(build_chat_payload(HISTORY, "sarvam-m", 0.8, 0.9, None, None, 0.0, 0.0, False)),
+            number,
+            messages=len(HISTORY),
+            codec=DEFAULT_CODEC.name
+        ),
+        micro(
+            "sarvam_client.build_translate_payload",
+            lambda: build_translate_payload("The monsoon reaches Mumbai in June.", "en-IN", "hi-IN", "Male", "formal"),
+            number
+        ),
+        micro(
+            "sarvam_client.parse_chat_response",
+            lambda: chat_result_from_data(DEFAULT_CODEC.loads(CHAT_RESPONSE)),
+            number,
+            bytes=len(CHAT_RESPONSE),
+            codec=DEFAULT_CODEC.name
+        ),
+    ]
+    results.extend(_decode_benchmarks(number))
+    results.extend(_turn_encoding_benchmarks(number))
+
+    with StandInServer() as server:
+        client = SarvamClient("bench-key", base_url=server.base_url)
+        try:
+            messages = HISTORY[-4:]
+            results.append(micro(
+                "sarvam_client.chat_completion.local",
+                lambda: client.chat_completion(messages),
+                round_trips
+            ))
+            results.append(micro(
+                "sarvam_client.stream_chat_completion.local",
+                lambda: "".join(client.stream_chat_completion(messages)["stream"]),
+                round_trips
+            ))
+            # No translation cache on this client, so every call is a real round trip
+            results.append(micro(
+                "sarvam_client.translate_text.local",
+                lambda: client.translate_text("The monsoon reaches Mumbai in June.", target_language="hi-IN"),
+                round_trips
+            ))
+            results.append(micro(
+                "sarvam_client.detect_language.local",
+                lambda: client.detect_language("What is the weather like today?"),
+                round_trips
+            ))
+            results[-1]["pool"] = client.pool_stats()
+        finally:
+            client.transport.close()
+            client.translate_pool.shutdown(wait=False)
+    return results
+
+
+if __name__ == "__main__":
+    print(dump(run()))
@@ -0,0 +1,78 @@
+"""
+Micro-benchmark: table-driven script detector vs the original any()-scan detector
+Run with: python -m benchmarks.bench_script_detector
+"""
+
+from typing import List
+
+from benchmarks.harness import Record, best_of, dump
+from script_detector import ScriptDetector
+
+
+def legacy_detect_language_from_text(text):
+    """The original LanguageSupport implementation, kept as the baseline"""
+    if any('\u0900' <= char <= '\u097F' for char in text):  # Devanagari
+        return "hi-IN"
+    elif any('\u0980' <= char <= '\u09FF' for char in text):  # Bengali
+        return "bn-IN"
+    elif any('\u0B80' <= char <= '\u0BFF' for char in text):  # Tamil
+        return "ta-IN"
+    elif any('\u0C00' <= char <= '\u0C7F' for char in text):  # Telugu
+        return "te-IN"
+    elif any('\u0A80' <= char <= '\u0AFF' for char in text):  # Gujarati
+        return "gu-IN"
+    elif any('\u0C80' <= char <= '\u0CFF' for char in text):  # Kannada
+        return "kn-IN"
+    elif any('\u0D00' <= char <= '\u0D7F' for char in text):  # Malayalam
+        return "ml-IN"
+    elif any('\u0A00' <= char <= '\u0A7F' for char in text):  # Punjabi
+        return "pa-IN"
+    elif any('\u0B00' <= char <= '\u0B7F' for char in text):  # Odia
+        return "or-IN"
+    else:
+        return "en-IN"
+
+
+SAMPLES = {
+    "english_short": "What is the weather like in Mumbai today?",
+    "odia_short": "ଆଜି ମୁଁ ଆପଣଙ୍କୁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?",
+    "english_long": "Mufasa explains the history of the Indian subcontinent in detail. " * 40,
+    "odia_long": "ମୁଁ ମୁଫାସା, ଆପଣଙ୍କର ଜ୍ଞାନୀ AI ସାଥୀ, ଆଜି ମୁଁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି " * 40,
+}
+
+
+def run(number: int = 2000) -> List[Record]:
+    """
+    Time both detectors on each sample
+
+    Returns:
+        One record per sample with per-call microseconds and the speedup
+    """
+    detector = ScriptDetector()
+    results = []
+    for name, text in SAMPLES.items():
+        legacy = best_of(lambda: legacy_detect_language_from_text(text), number)
+        table = best_of(lambda: detector.detect(text), number)
+        results.append({
+            "benchmark": f"script_detector.{name}",
+            "chars": len(text),
+            "legacy_us": round(legacy, 3),
+            "table_us": round(table, 3),
+            "speedup": round(legacy / table, 2) if table else None
+        })
+
+    batch = list(SAMPLES.values()) * 25
+    loop = best_of(lambda: [detector.detect(text) for text in batch], max(number // 50, 1))
+    many = best_of(lambda: detector.detect_many(batch), max(number // 50, 1))
+    results.append({
+        "benchmark": "script_detector.detect_many",
+        "texts": len(batch),
+        "loop_us": round(loop, 3),
+        "batch_us": round(many, 3),
+        "speedup": round(loop / many, 2) if many else None
+    })
+    return results
+
+
+if __name__ == "__main__":
+    print(dump(run()))
@@ -0,0 +1,36 @@
+"""
+Micro-benchmark: TigerMascot state handling and mascot HTML generation
+Run with: python -m benchmarks.bench_tiger_mascot
+"""
+
+from typing import List
+
+from benchmarks.harness import Record, dump, micro
+from image_tiger import get_simple_tiger_html, get_tiger_face_html
+from tiger_mascot import TigerMascot
+
+REPLY = "Namaste! That is a great question. The monsoon reaches Mumbai in early June."
+
+
+def run(number: int = 5000) -> List[Record]:
+    """
+    Time mascot state lookups and the HTML rendered on every rerun
+
+    Returns:
+        One record per operation
+    """
+    mascot = TigerMascot()
+    return [
+        micro("tiger_mascot.construct", TigerMascot, number=max(number // 10, 1)),
+        micro("tiger_mascot.get_tiger_emoji", lambda: mascot.get_tiger_emoji("happy"), number),
+        micro("tiger_mascot.get_animation_class", lambda: mascot.get_animation_class("thinking"), number),
+        micro("tiger_mascot.get_state_description", lambda: mascot.get_state_description("idle"), number),
+        micro("tiger_mascot.determine_reaction_state", lambda: mascot.determine_reaction_state(REPLY), number),
+        micro("tiger_mascot.get_tiger_status_html", lambda: mascot.get_tiger_status_html("excited"), number),
+        micro("tiger_mascot.get_simple_tiger_html", lambda: get_simple_tiger_html("happy", "bounce"), number),
+        micro("tiger_mascot.get_tiger_face_html", lambda: get_tiger_face_html("thinking", "spin"), number),
+    ]
+
+
+if __name__ == "__main__":
+    print(dump(run()))
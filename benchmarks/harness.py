@@ -0,0 +1,131 @@
+"""
+Shared timing and reporting helpers for the benchmark suite
+Every benchmark returns a list of flat JSON records so runs can be saved and
+compared against a baseline
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+Record = Dict[str, object]
+
+
+def best_of(stmt: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """
+    Best per-call time of a micro-benchmark
+
+    Args:
+        stmt: Zero-argument callable to time
+        number: Calls per timing round
+        repeat: Timing rounds; the fastest one is reported
+
+    Returns:
+        Microseconds per call
+    """
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e6
+
+
+def micro(name: str, stmt: Callable[[], object], number: int = 2000, **extra) -> Record:
+    """
+    Time a callable and build its result record
+
+    Args:
+        name: Dotted benchmark name, e.g. "language_support.get_language_name"
+        stmt: Zero-argument callable to time
+        number: Calls per timing round
+        extra: Additional fields copied into the record
+
+    Returns:
+        Record with benchmark name, us_per_call and the extra fields
+    """
+    record: Record = {"benchmark": name, "us_per_call": round(best_of(stmt, number), 3)}
+    record.update(extra)
+    return record
+
+
+def sample(name: str, stmt: Callable[[], object], runs: int, **extra) -> Record:
+    """
+    Time a slow operation run by run and summarize the distribution
+
+    Args:
+        name: Dotted benchmark name
+        stmt: Zero-argument callable to time once per run
+        runs: Number of timed runs
+        extra: Additional fields copied into the record
+
+    Returns:
+        Record with min/median/p95/max milliseconds
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        stmt()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    record: Record = {
+        "benchmark": name,
+        "runs": runs,
+        "min_ms": round(timings[0], 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(int(len(timings) * 0.95), len(timings) - 1)], 3),
+        "max_ms": round(timings[-1], 3)
+    }
+    record.update(extra)
+    return record
+
+
+def primary_metric(record: Record) -> Optional[str]:
+    """Field used to compare a record across runs (lower is better)"""
+    for field in ("us_per_call", "median_ms", "table_us", "batch_us", "bytes_per_message"):
+        if field in record:
+            return field
+    return None
+
+
+def compare(current: List[Record], baseline: List[Record], tolerance: float = 0.2) -> List[Record]:
+    """
+    Find benchmarks that got slower than a saved baseline
+
+    Args:
+        current: Records from this run
+        baseline: Records from an earlier run
+        tolerance: Allowed slowdown as a fraction (0.2 = 20%)
+
+    Returns:
+        One record per regression with baseline, current and ratio
+    """
+    previous = {record["benchmark"]: record for record in baseline}
+    regressions = []
+    for record in current:
+        before = previous.get(record["benchmark"])
+        field = primary_metric(record)
+        if before is None or field is None or not before.get(field):
+            continue
+        ratio = record[field] / before[field]
+        if ratio > 1 + tolerance:
+            regressions.append({
+                "benchmark": record["benchmark"],
+                "metric": field,
+                "baseline": before[field],
+                "current": record[field],
+                "ratio": round(ratio, 2)
+            })
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    """Interpreter and platform details stored alongside the results"""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform()
+    }
+
+
+def dump(payload: object) -> str:
+    return json.dumps(payload, indent=2, ensure_ascii=False)
@@ -0,0 +1,115 @@
+"""
+Request/response hooks for upstream API clients
+Lets metrics, tracing or logging observe every HTTP attempt without the
+clients knowing who is listening
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# One mutable dict per HTTP attempt, shared by the request and response hooks:
+#   before the request: endpoint, method, url, attempt, stream, request_bytes, started
+#   added afterwards:   status (None if no response), elapsed, response_bytes, error
+Call = Dict[str, Any]
+Hook = Callable[[Call], None]
+
+
+class CallHooks:
+    """Registry of on_request/on_response callbacks fired around each HTTP attempt"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._request_hooks: List[Hook] = []
+        self._response_hooks: List[Hook] = []
+
+    def on_request(self, hook: Hook) -> Hook:
+        """
+        Register a callback fired just before each attempt is sent
+
+        Args:
+            hook: Callable taking the call dict; may store its own keys in it
+
+        Returns:
+            The hook, so this can be used as a decorator
+        """
+        with self._lock:
+            self._request_hooks = self._request_hooks + [hook]
+        return hook
+
+    def on_response(self, hook: Hook) -> Hook:
+        """
+        Register a callback fired once each attempt has a response or failed
+
+        Args:
+            hook: Callable taking the call dict completed with status,
+                elapsed, response_bytes and error
+
+        Returns:
+            The hook, so this can be used as a decorator
+        """
+        with self._lock:
+            self._response_hooks = self._response_hooks + [hook]
+        return hook
+
+    def remove(self, hook: Hook):
+        """Unregister a hook from both lists"""
+        with self._lock:
+            self._request_hooks = [h for h in self._request_hooks if h is not hook]
+            self._response_hooks = [h for h in self._response_hooks if h is not hook]
+
+    def __bool__(self) -> bool:
+        return bool(self._request_hooks or self._response_hooks)
+
+    def start(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        attempt: int = 0,
+        stream: bool = False,
+        request_bytes: Optional[int] = None
+    ) -> Call:
+        """Build the call dict for one attempt and fire the request hooks"""
+        call: Call = {
+            "endpoint": endpoint,
+            "method": method,
+            "url": url,
+            "attempt": attempt,
+            "stream": stream,
+            "request_bytes": request_bytes,
+            "started": time.perf_counter()
+        }
+        self._fire(self._request_hooks, call)
+        return call
+
+    def finish(
+        self,
+        call: Call,
+        status: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        error: Optional[BaseException] = None
+    ):
+        """Complete the call dict and fire the response hooks"""
+        call["status"] = status
+        call["elapsed"] = time.perf_counter() - call["started"]
+        call["response_bytes"] = response_bytes
+        call["error"] = error
+        self._fire(self._response_hooks, call)
+
+    @staticmethod
+    def _fire(hooks: List[Hook], call: Call):
+        # Hooks only observe: a broken one must never fail the API call
+        for hook in hooks:
+            try:
+                hook(call)
+            except Exception:
+                pass
+
+
+def response_size(response, stream: bool = False) -> Optional[int]:
+    """Body size of a requests Response, without consuming a streamed body"""
+    if not stream:
+        return len(response.content)
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
@@ -0,0 +1,132 @@
+"""
+Compact chat message model
+One __slots__ record per message with an interned role code, the model's
+text and its translation kept apart, and optional zlib compression of old
+message bodies. Dict payloads for the API are produced on demand.
+"""
+
+import zlib
+from typing import Any, Dict, Optional, Union
+
+ROLES = ("system", "user", "assistant")
+_ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+
+# Bodies shorter than this are left as they are: zlib would barely shrink them
+COMPRESS_MIN_BYTES = 256
+
+Body = Union[str, bytes]
+
+
+def _pack(text: str) -> Body:
+    encoded = text.encode("utf-8")
+    if len(encoded) < COMPRESS_MIN_BYTES:
+        return text
+    packed = zlib.compress(encoded, 6)
+    return packed if len(packed) < len(encoded) else text
+
+
+def _unpack(body: Optional[Body]) -> Optional[str]:
+    if isinstance(body, bytes):
+        return zlib.decompress(body).decode("utf-8")
+    return body
+
+
+def _size(body: Optional[Body]) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, bytes):
+        return len(body)
+    # Cheaper than encoding: ASCII text is one byte per character
+    return len(body) if body.isascii() else len(body.encode("utf-8"))
+
+
+class ChatMessage:
+    """A chat message stored compactly for the life of a session"""
+
+    __slots__ = ("_role", "_content", "_translated")
+
+    def __init__(self, role: str, content: str, translated: Optional[str] = None):
+        """
+        Create a message
+
+        Args:
+            role: system, user or assistant
+            content: Text sent to the model (for replies, what the model wrote)
+            translated: Translation shown to the user alongside the original (optional)
+        """
+        code = _ROLE_CODES.get(role)
+        if code is None:
+            raise ValueError(f"Unknown message role: {role}")
+        self._role = code
+        self._content: Body = content
+        self._translated: Optional[Body] = translated
+
+    @property
+    def role(self) -> str:
+        return ROLES[self._role]
+
+    @property
+    def content(self) -> str:
+        return _unpack(self._content)
+
+    @property
+    def translated(self) -> Optional[str]:
+        return _unpack(self._translated)
+
+    @property
+    def compressed(self) -> bool:
+        return isinstance(self._content, bytes) or isinstance(self._translated, bytes)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the message bodies, as stored"""
+        return _size(self._content) + _size(self._translated)
+
+    def compress(self) -> int:
+        """
+        Compress the message bodies in place; reading them decompresses on the fly
+
+        Returns:
+            Bytes saved (0 if the message was short or already compressed)
+        """
+        before = self.nbytes
+        if isinstance(self._content, str):
+            self._content = _pack(self._content)
+        if isinstance(self._translated, str):
+            self._translated = _pack(self._translated)
+        return before - self.nbytes
+
+    def display(self) -> str:
+        """Markdown shown in the chat: the translation with the original below it"""
+        content = self.content
+        translated = self.translated
+        if translated is None:
+            return content
+        return f"{translated}\n\n---\n*Original (English):* {content}"
+
+    def to_payload(self) -> Dict[str, str]:
+        """Dict form sent to chat_completion"""
+        return {"role": ROLES[self._role], "content": self.content}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style read access, for code written against message dicts"""
+        if key == "role":
+            return ROLES[self._role]
+        if key == "content":
+            return self.content
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in ("role", "content"):
+            raise KeyError(key)
+        return self.get(key)
+
+    def __repr__(self) -> str:
+        return f"ChatMessage(role={self.role!r}, nbytes={self.nbytes}, compressed={self.compressed})"
+
+
+def as_payload(message: Union[ChatMessage, Dict[str, str]]) -> Dict[str, str]:
+    """Dict form of a ChatMessage, or the message itself if it already is a dict"""
+    if isinstance(message, ChatMessage):
+        return message.to_payload()
+    return message
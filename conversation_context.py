@@ -0,0 +1,239 @@
+"""
+Token-budgeted conversation context
+Keeps recent turns verbatim and folds older turns into a rolling summary
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+from chat_message import as_payload
+
+# Per-message overhead for role markers and separators in chat templates
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?।॥])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a string without a tokenizer
+
+    English averages about four characters per token; Indic scripts are
+    split much finer by most tokenizers, so non-ASCII characters are
+    weighted more heavily.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate number of tokens
+    """
+    if not text:
+        return 0
+    if text.isascii():
+        return len(text) // 4 + 1
+    ascii_chars = sum(1 for char in text if char < "\x80")
+    return ascii_chars // 4 + (len(text) - ascii_chars) // 2 + 1
+
+
+def extractive_summary(previous: str, folded: List[Dict[str, str]], max_tokens: int) -> str:
+    """
+    Default summarizer: keep the first sentence of each folded turn
+
+    Args:
+        previous: Summary built so far
+        folded: Messages being folded out of the verbatim window
+        max_tokens: Token budget for the whole summary
+
+    Returns:
+        Updated summary; the oldest lines are dropped to stay in budget
+    """
+    lines = previous.splitlines() if previous else []
+    for message in folded:
+        content = " ".join(message.get("content", "").split())
+        first = _SENTENCE_END.split(content, maxsplit=1)[0]
+        if len(first) > 200:
+            first = first[:200].rstrip() + "…"
+        if first:
+            lines.append(f"- {message.get('role', 'user')}: {first}")
+
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+def merge_consecutive(messages: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Join runs of messages from the same role, so roles alternate as the API requires
+
+    Args:
+        messages: Payload messages (not modified)
+
+    Returns:
+        The messages, with each run of one role merged into a single message
+    """
+    merged: List[Dict[str, str]] = []
+    for message in messages:
+        if merged and merged[-1].get("role") == message.get("role"):
+            merged[-1] = {
+                "role": message.get("role"),
+                "content": f"{merged[-1].get('content', '')}\n\n{message.get('content', '')}"
+            }
+        else:
+            merged.append(message)
+    return merged
+
+
+class ConversationContext:
+    """Builds token-budgeted chat payloads from a session's message history"""
+
+    def __init__(
+        self,
+        budget_tokens: int = 3000,
+        keep_recent: int = 6,
+        summary_tokens: int = 400,
+        summarizer: Optional[Callable[[str, List[Dict[str, str]], int], str]] = None
+    ):
+        """
+        Initialize the context
+
+        Args:
+            budget_tokens: Target size of the whole payload including the system message
+            keep_recent: Most recent messages that are never folded
+            summary_tokens: Token budget for the rolling summary
+            summarizer: Callable (previous_summary, folded_messages, max_tokens) -> summary;
+                defaults to a local extractive summary so no extra API hop is made
+        """
+        self.budget_tokens = budget_tokens
+        self.keep_recent = keep_recent
+        self.summary_tokens = summary_tokens
+        self.summarizer = summarizer or extractive_summary
+        self.reset()
+
+    def reset(self):
+        """Forget all cached state (used when history is cleared or edited)"""
+        self._history_id: Optional[int] = None
+        self._tail: Optional[Dict[str, str]] = None
+        self._message_tokens: List[int] = []
+        self._window_start = 0
+        self._window_tokens = 0
+        self._summary = ""
+        self._folded_count = 0
+        self._system_key: Optional[tuple] = None
+        self._system_message: Optional[Dict[str, str]] = None
+        self._system_tokens = 0
+
+    def _sync(self, history: List[Dict[str, str]], offset: int):
+        """Measure only the messages appended since the last call"""
+        seen = len(self._message_tokens)
+        unchanged = (
+            id(history) == self._history_id
+            and offset < seen <= offset + len(history)
+            and history[seen - 1 - offset] is self._tail
+        )
+        if not unchanged:
+            self.reset()
+            self._history_id = id(history)
+            # Messages before the in-memory window can no longer be summarized
+            self._message_tokens = [0] * offset
+            self._window_start = offset
+            seen = offset
+
+        for message in history[seen - offset:]:
+            tokens = estimate_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+            self._message_tokens.append(tokens)
+            self._window_tokens += tokens
+        if history:
+            self._tail = history[-1]
+
+    def _system_with_summary(self, system_message: Dict[str, str]) -> Dict[str, str]:
+        key = (system_message.get("content", ""), self._summary)
+        if key != self._system_key:
+            content = system_message.get("content", "")
+            if self._summary:
+                content = f"{content}\n\nSummary of the earlier conversation:\n{self._summary}"
+            self._system_key = key
+            self._system_message = {"role": "system", "content": content}
+            self._system_tokens = estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+        return self._system_message
+
+    def build(
+        self,
+        system_message: Dict[str, str],
+        history: List[Dict[str, str]],
+        offset: int = 0,
+        pending: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Build the message list to send for the next completion
+
+        Consecutive messages of the same role, e.g. a prompt whose turn was
+        cancelled followed by the next one, are merged into one.
+
+        Args:
+            system_message: System message for the current language
+            history: The session's message list, as dicts or ChatMessage records (not modified)
+            offset: Conversation position of history[0] when older messages
+                are not kept in memory (see ConversationHistory)
+            pending: The new prompt, when it is only added to history once its
+                turn was accepted; counted against the budget and sent last
+
+        Returns:
+            System message (with rolling summary) followed by the verbatim window
+        """
+        self._sync(history, offset)
+        system = self._system_with_summary(system_message)
+
+        if self._window_start < offset:
+            # Trimmed from memory before being folded: drop them unsummarized
+            self._window_tokens -= sum(self._message_tokens[self._window_start:offset])
+            self._folded_count += offset - self._window_start
+            self._window_start = offset
+
+        pending_tokens = 0
+        if pending is not None:
+            pending_tokens = estimate_tokens(pending.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+        end = offset + len(history)
+        # The pending prompt counts as one of the keep_recent messages
+        limit = min(end + (1 if pending is not None else 0) - self.keep_recent, end)
+        to_fold = self._window_start
+        window_tokens = self._window_tokens
+        while to_fold < limit and self._system_tokens + window_tokens + pending_tokens > self.budget_tokens:
+            window_tokens -= self._message_tokens[to_fold]
+            to_fold += 1
+        if to_fold > self._window_start:
+            # A reply whose question was just folded goes with it, within keep_recent's limit
+            while to_fold < limit and history[to_fold - offset].get("role") == "assistant":
+                window_tokens -= self._message_tokens[to_fold]
+                to_fold += 1
+
+        if to_fold > self._window_start:
+            folded = history[self._window_start - offset:to_fold - offset]
+            self._summary = self.summarizer(self._summary, folded, self.summary_tokens)
+            self._folded_count += len(folded)
+            self._window_start = to_fold
+            self._window_tokens = window_tokens
+            system = self._system_with_summary(system_message)
+
+        window = [as_payload(m) for m in history[self._window_start - offset:] if m.get("role") != "system"]
+        if pending is not None:
+            window.append(pending)
+        # The API wants a user turn first: leading replies (a greeting, a weather
+        # report) are left out of the payload but stay in the window
+        first_user = next((i for i, m in enumerate(window) if m.get("role") == "user"), len(window))
+        return [system] + merge_consecutive(window[first_user:])
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get context statistics
+
+        Returns:
+            Dictionary with estimated payload tokens, verbatim and folded
+            message counts and the summary size
+        """
+        return {
+            "estimated_tokens": self._system_tokens + self._window_tokens,
+            "verbatim_messages": len(self._message_tokens) - self._window_start,
+            "folded_messages": self._folded_count,
+            "summary_tokens": estimate_tokens(self._summary)
+        }
@@ -0,0 +1,528 @@
+"""
+Persistent conversation storage
+Append-only SQLite (WAL) store written in batches by a background thread,
+plus a per-session history that keeps only a recent window in memory and
+pages older messages back in on demand
+"""
+
+import os
+import queue
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from chat_message import ChatMessage
+
+# (conversation_id, seq, role, content, translated, created_at)
+Row = Tuple[str, int, str, str, Optional[str], float]
+
+# Generated IDs are URL-safe base64 of 24 random bytes; 32-character hex IDs
+# from earlier versions still match
+_CONVERSATION_ID = re.compile(r"[A-Za-z0-9_-]{32,64}")
+
+
+def new_conversation_id() -> str:
+    """
+    Generate an unguessable conversation ID
+
+    The ID is the only credential for a stored conversation: whoever has it
+    (e.g. from a shared link) can read the whole conversation.
+    """
+    return secrets.token_urlsafe(24)
+
+
+class ConversationStore:
+    """Thread-safe SQLite conversation log with asynchronous batched appends"""
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        retention_days: float = 30,
+        prune_interval: float = 3600,
+        max_queue: int = 10000
+    ):
+        """
+        Open (or create) the store and start its writer thread
+
+        Args:
+            db_path: SQLite file
+            batch_size: Messages written per transaction at most
+            flush_interval: Longest a queued message waits before being written
+            retention_days: Conversations idle for longer are deleted (0 keeps everything)
+            prune_interval: Seconds between retention sweeps
+            max_queue: Messages buffered before append() starts blocking
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_seconds = retention_days * 24 * 3600
+        self.prune_interval = prune_interval
+
+        self._writer_db = self._connect()
+        self._writer_db.executescript(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " conversation_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " role TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " translated TEXT,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (conversation_id, seq)"
+            ") WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS conversations ("
+            " conversation_id TEXT PRIMARY KEY,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " message_count INTEGER NOT NULL"
+            ");"
+            "CREATE INDEX IF NOT EXISTS conversations_updated ON conversations (updated_at);"
+        )
+        columns = {row[1] for row in self._writer_db.execute("PRAGMA table_info(messages)")}
+        if "translated" not in columns:
+            # Databases created before translations were stored separately
+            self._writer_db.execute("ALTER TABLE messages ADD COLUMN translated TEXT")
+        self._writer_db.commit()
+
+        # Readers never block the writer (or each other) in WAL mode
+        self._reader_lock = threading.Lock()
+        self._reader_db = self._connect()
+
+        self._queue: "queue.Queue[Optional[Row]]" = queue.Queue(maxsize=max_queue)
+        # Queued rows per conversation, so reads see them before the writer commits
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[str, List[Row]] = {}
+        self._flushed = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._counters = {
+            "written": 0, "batches": 0, "pruned_conversations": 0, "write_errors": 0, "seq_conflicts": 0
+        }
+        self._last_prune = 0.0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="conversation-writer", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only risks the last transactions on power loss, never corruption
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def append(
+        self,
+        conversation_id: str,
+        seq: int,
+        role: str,
+        content: str,
+        translated: Optional[str] = None
+    ):
+        """
+        Queue a message for writing; returns without touching the disk
+
+        If another session wrote the conversation at the same position first
+        (e.g. the conversation is open in two tabs), the writer stores the
+        message after the latest one instead of dropping it.
+
+        Args:
+            conversation_id: Conversation the message belongs to
+            seq: Position of the message in the conversation (0-based)
+            role: user, assistant or system
+            content: Message text
+            translated: Translation shown alongside the text (optional)
+        """
+        row = (conversation_id, seq, role, content, translated, time.time())
+        with self._flushed:
+            self._enqueued += 1
+        with self._pending_lock:
+            self._pending.setdefault(conversation_id, []).append(row)
+        self._queue.put(row)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every message queued so far is on disk
+
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        with self._flushed:
+            target = self._enqueued
+            return self._flushed.wait_for(lambda: self._written >= target, timeout)
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._maybe_prune()
+                continue
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+            self._write(batch)
+            self._maybe_prune()
+            if stop:
+                return
+
+    def _write(self, batch: List[Row]):
+        insert = (
+            "INSERT OR IGNORE INTO messages (conversation_id, seq, role, content, translated, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        latest: Dict[str, Tuple[float, int]] = {}
+        conflicts = 0
+        try:
+            with self._writer_db:
+                for row in batch:
+                    conversation_id, seq, role, content, translated, created_at = row
+                    # OR IGNORE: a stored message is never rewritten
+                    if self._writer_db.execute(insert, row).rowcount == 0:
+                        # Position taken by another session on the same conversation
+                        seq = self._writer_db.execute(
+                            "SELECT MAX(seq) + 1 FROM messages WHERE conversation_id = ?", (conversation_id,)
+                        ).fetchone()[0]
+                        self._writer_db.execute(
+                            insert, (conversation_id, seq, role, content, translated, created_at)
+                        )
+                        conflicts += 1
+                    updated_at, count = latest.get(conversation_id, (0.0, 0))
+                    latest[conversation_id] = (max(updated_at, created_at), max(count, seq + 1))
+                self._writer_db.executemany(
+                    "INSERT INTO conversations (conversation_id, created_at, updated_at, message_count) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (conversation_id) DO UPDATE SET "
+                    "updated_at = MAX(updated_at, excluded.updated_at), "
+                    "message_count = MAX(message_count, excluded.message_count)",
+                    [(cid, updated, updated, count) for cid, (updated, count) in latest.items()]
+                )
+            self._counters["written"] += len(batch)
+            self._counters["batches"] += 1
+            self._counters["seq_conflicts"] += conflicts
+        except sqlite3.Error:
+            self._counters["write_errors"] += 1
+        with self._pending_lock:
+            for row in batch:
+                rows = self._pending[row[0]]
+                rows.remove(row)
+                if not rows:
+                    del self._pending[row[0]]
+        with self._flushed:
+            self._written += len(batch)
+            self._flushed.notify_all()
+
+    def _maybe_prune(self):
+        if not self.retention_seconds or time.monotonic() - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = time.monotonic()
+        self.prune()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Apply the retention policy: delete conversations idle past retention_days
+
+        Returns:
+            Number of conversations deleted
+        """
+        if not self.retention_seconds:
+            return 0
+        cutoff = (now if now is not None else time.time()) - self.retention_seconds
+        try:
+            with self._writer_db:
+                expired = [row[0] for row in self._writer_db.execute(
+                    "SELECT conversation_id FROM conversations WHERE updated_at < ?", (cutoff,)
+                )]
+                self._writer_db.executemany(
+                    "DELETE FROM messages WHERE conversation_id = ?", [(cid,) for cid in expired]
+                )
+                self._writer_db.executemany(
+                    "DELETE FROM conversations WHERE conversation_id = ?", [(cid,) for cid in expired]
+                )
+        except sqlite3.Error:
+            self._counters["write_errors"] += 1
+            return 0
+        self._counters["pruned_conversations"] += len(expired)
+        return len(expired)
+
+    def exists(self, conversation_id: str) -> bool:
+        """Whether any message of the conversation is stored or queued"""
+        with self._pending_lock:
+            if conversation_id in self._pending:
+                return True
+        return self.message_count(conversation_id) > 0
+
+    def message_count(self, conversation_id: str) -> int:
+        """Number of stored messages in a conversation"""
+        with self._reader_lock:
+            row = self._reader_db.execute(
+                "SELECT message_count FROM conversations WHERE conversation_id = ?", (conversation_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def load(
+        self,
+        conversation_id: str,
+        before_seq: Optional[int] = None,
+        limit: int = 50
+    ) -> List[Tuple[int, str, str, Optional[str]]]:
+        """
+        Read a page of messages, oldest first, including messages still queued
+        for writing
+
+        Args:
+            conversation_id: Conversation to read
+            before_seq: Only messages before this position (None reads the latest)
+            limit: Maximum number of messages
+
+        Returns:
+            List of (seq, role, content, translated) in conversation order
+        """
+        before_seq = before_seq if before_seq is not None else 2 ** 62
+        # Held across the read so a row is seen either queued or written, never both or neither
+        with self._pending_lock, self._reader_lock:
+            rows = self._reader_db.execute(
+                "SELECT seq, role, content, translated FROM messages "
+                "WHERE conversation_id = ? AND seq < ? ORDER BY seq DESC LIMIT ?",
+                (conversation_id, before_seq, limit)
+            ).fetchall()
+            queued = [
+                (seq, role, content, translated)
+                for _, seq, role, content, translated, _ in self._pending.get(conversation_id, ())
+                if seq < before_seq
+            ]
+        rows.reverse()
+        if queued:
+            rows = sorted(rows + queued, key=lambda row: row[0])[-limit:]
+        return rows
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get writer statistics
+
+        Returns:
+            Dictionary with messages written, batches, write errors, messages
+            moved past a position another session took (seq_conflicts),
+            pruned conversations and messages still queued
+        """
+        stats = dict(self._counters)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def close(self, timeout: float = 5.0):
+        """Write everything still queued and stop the writer"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._writer_db.close()
+        self._reader_db.close()
+
+
+class ConversationHistory:
+    """
+    One session's conversation: a bounded in-memory window over the stored log
+
+    `messages` is the same list object for the life of the history (cleared
+    and trimmed in place), and `offset` is the conversation position of
+    messages[0], so callers can index the conversation absolutely.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ConversationStore] = None,
+        conversation_id: Optional[str] = None,
+        max_in_memory: int = 200,
+        max_bytes: int = 0,
+        compress_after: int = 0
+    ):
+        """
+        Start an empty conversation
+
+        Args:
+            store: Where messages are persisted (None keeps the history in memory only,
+                in which case messages past the caps are dropped for good)
+            conversation_id: ID to use (a new one is generated if omitted)
+            max_in_memory: Messages kept in memory once older pages are no longer needed
+            max_bytes: Message body bytes kept in memory, counted as stored (0 for no cap)
+            compress_after: Compress the bodies of all but this many recent messages
+                (0 disables compression)
+        """
+        self.store = store
+        self.conversation_id = conversation_id or new_conversation_id()
+        self.max_in_memory = max_in_memory
+        self.max_bytes = max_bytes
+        self.compress_after = compress_after
+        self.messages: List[ChatMessage] = []
+        self.offset = 0
+        self.nbytes = 0
+        # Extra older messages (and their bytes) the user paged in, kept until the next clear
+        self._paged_in = 0
+        self._paged_bytes = 0
+
+    @classmethod
+    def restore(
+        cls,
+        store: Optional[ConversationStore],
+        conversation_id: str,
+        max_in_memory: int = 200,
+        initial: int = 50,
+        **caps
+    ) -> "ConversationHistory":
+        """
+        Reopen a stored conversation, e.g. after a restart or reconnect
+
+        An ID that is malformed or not in the store is not adopted: a fresh
+        one is generated instead, so a crafted link cannot make a session
+        write into a conversation whose ID someone else already knows.
+
+        Args:
+            store: Store holding the conversation
+            conversation_id: Conversation to reopen
+            max_in_memory: See __init__
+            initial: Most recent messages loaded right away
+            caps: max_bytes and compress_after, see __init__
+
+        Returns:
+            History positioned at the end of the conversation (empty, with a
+            new ID, if unknown)
+        """
+        known = (
+            store is not None
+            and _CONVERSATION_ID.fullmatch(conversation_id or "") is not None
+            and store.exists(conversation_id)
+        )
+        history = cls(store, conversation_id if known else None, max_in_memory, **caps)
+        if known:
+            rows = store.load(conversation_id, limit=min(initial, max_in_memory))
+            if rows:
+                history.offset = rows[0][0]
+                history._insert(0, rows)
+                history._trim()
+        return history
+
+    def __len__(self) -> int:
+        """Messages in the whole conversation, including those not in memory"""
+        return self.offset + len(self.messages)
+
+    @property
+    def has_older(self) -> bool:
+        """Whether stored messages exist before the in-memory window"""
+        return self.store is not None and self.offset > 0
+
+    def append(self, role: str, content: str, translated: Optional[str] = None) -> ChatMessage:
+        """
+        Add a message; it is persisted asynchronously
+
+        Args:
+            role: user or assistant
+            content: Message text (for replies, what the model wrote)
+            translated: Translation shown alongside the text (optional)
+
+        Returns:
+            The stored message
+        """
+        message = ChatMessage(role, content, translated)
+        if self.store is not None:
+            self.store.append(self.conversation_id, len(self), role, content, translated)
+        self.messages.append(message)
+        self.nbytes += message.nbytes
+        if self.compress_after and len(self.messages) > self.compress_after:
+            self.nbytes -= self.messages[-1 - self.compress_after].compress()
+        self._trim()
+        return message
+
+    def _insert(self, index: int, rows: List[Tuple[int, str, str, Optional[str]]]):
+        loaded = [ChatMessage(role, content, translated) for _, role, content, translated in rows]
+        self.messages[index:index] = loaded
+        for position, message in enumerate(self.messages[index:index + len(loaded)], start=index):
+            if self.compress_after and position < len(self.messages) - self.compress_after:
+                message.compress()
+            self.nbytes += message.nbytes
+
+    def _trim(self):
+        max_count = self.max_in_memory + self._paged_in
+        max_bytes = self.max_bytes + self._paged_bytes if self.max_bytes else 0
+        excess = 0
+        excess_bytes = 0
+        remaining = len(self.messages)
+        # The latest message always stays, whatever its size
+        while remaining - excess > 1 and (
+            remaining - excess > max_count or (max_bytes and self.nbytes - excess_bytes > max_bytes)
+        ):
+            excess_bytes += self.messages[excess].nbytes
+            excess += 1
+        if excess:
+            del self.messages[:excess]
+            self.offset += excess
+            self.nbytes -= excess_bytes
+
+    def load_older(self, count: int) -> int:
+        """
+        Page older messages back into memory
+
+        Args:
+            count: Messages to load
+
+        Returns:
+            Number of messages loaded
+        """
+        if not self.has_older:
+            return 0
+        rows = self.store.load(self.conversation_id, before_seq=self.offset, limit=count)
+        if not rows:
+            return 0
+        before = self.nbytes
+        self._insert(0, rows)
+        self.offset = rows[0][0]
+        self._paged_in += len(rows)
+        self._paged_bytes += self.nbytes - before
+        return len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get memory statistics
+
+        Returns:
+            Dictionary with messages in memory, body bytes held and compressed messages
+        """
+        return {
+            "messages": len(self.messages),
+            "bytes": self.nbytes,
+            "compressed": sum(1 for message in self.messages if message.compressed)
+        }
+
+    def clear(self) -> str:
+        """
+        Start a new conversation; the old one stays in the store until retention removes it
+
+        Returns:
+            The new conversation ID
+        """
+        self.conversation_id = new_conversation_id()
+        self.messages.clear()
+        self.offset = 0
+        self.nbytes = 0
+        self._paged_in = 0
+        self._paged_bytes = 0
+        return self.conversation_id
@@ -0,0 +1,225 @@
+"""
+Pooled HTTP transport for upstream API calls
+Keeps connections to api.sarvam.ai alive and shares them across sessions
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats:
+    """Thread-safe counters describing how the connection pools are used"""
+
+    def __init__(self):
+        """Initialize all counters at zero"""
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hits = 0
+        self._checkouts = 0
+        self._new_connections = 0
+        self._waits = 0
+        # The logical request running on this thread, if any
+        self._current = threading.local()
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """
+        Count everything inside the block as one logical request
+
+        Reconnects and retries within it are further checkouts of the same
+        request, so it counts as a hit at most once (only if it never had to
+        open a connection). Nested blocks join the outermost one.
+        """
+        if getattr(self._current, "active", False):
+            yield
+            return
+        self._current.active = True
+        self._current.opened = False
+        try:
+            yield
+        finally:
+            self._current.active = False
+            with self._lock:
+                self._requests += 1
+                if not self._current.opened:
+                    self._hits += 1
+
+    def record_checkout(self):
+        with self._lock:
+            self._checkouts += 1
+
+    def record_new_connection(self):
+        self._current.opened = True
+        with self._lock:
+            self._new_connections += 1
+
+    def record_wait(self):
+        with self._lock:
+            self._waits += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get a consistent copy of the counters
+
+        Returns:
+            Dictionary with requests (logical requests), hits (requests served
+            entirely on reused connections), checkouts, new_connections and
+            waits (pool exhausted while blocking)
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hits": self._hits,
+                "checkouts": self._checkouts,
+                "new_connections": self._new_connections,
+                "waits": self._waits
+            }
+
+
+class _CountingPoolMixin:
+    """Connection pool hooks that report checkouts, waits and new sockets"""
+
+    stats: PoolStats
+
+    def _get_conn(self, timeout=None):
+        # The queue is pre-filled with placeholders, so an empty queue means
+        # every connection is checked out and a blocking pool will wait
+        if self.block and self.pool is not None and self.pool.empty():
+            self.stats.record_wait()
+        # A checkout outside PooledTransport.request is a request of its own
+        with self.stats.request():
+            conn = super()._get_conn(timeout)
+            self.stats.record_checkout()
+        return conn
+
+    def _new_conn(self):
+        self.stats.record_new_connection()
+        return super()._new_conn()
+
+
+def _counting_pool_classes(stats: PoolStats) -> Dict[str, type]:
+    """Build pool classes bound to a single PoolStats instance"""
+    return {
+        "http": type("CountingHTTPConnectionPool", (_CountingPoolMixin, HTTPConnectionPool), {"stats": stats}),
+        "https": type("CountingHTTPSConnectionPool", (_CountingPoolMixin, HTTPSConnectionPool), {"stats": stats})
+    }
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools report into a PoolStats instance"""
+
+    def __init__(self, stats: PoolStats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self._stats)
+
+
+class PooledTransport:
+    """Shared, thread-safe HTTP transport with keep-alive connection pools"""
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Keep-alive connections kept per host
+            pool_block: Wait for a free connection instead of opening extra ones
+            connect_timeout: Seconds allowed for the TCP/TLS handshake
+            read_timeout: Default seconds allowed between response bytes
+            headers: Headers sent with every request
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._stats = PoolStats()
+
+        # The session is configured once here and never mutated afterwards,
+        # so concurrent script threads can share it safely
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = _CountingAdapter(
+            self._stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def timeout(self, read_timeout: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Build a (connect, read) timeout tuple
+
+        Args:
+            read_timeout: Read timeout for this call, defaults to the transport's
+
+        Returns:
+            Timeout tuple accepted by requests
+        """
+        if read_timeout is None:
+            read_timeout = self.read_timeout
+        return (self.connect_timeout, read_timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request over the pooled session
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            timeout: Read timeout in seconds or a (connect, read) tuple
+            **kwargs: Passed through to requests
+
+        Returns:
+            The requests Response
+        """
+        if not isinstance(timeout, tuple):
+            timeout = self.timeout(timeout)
+        with self._stats.request():
+            return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def logical_request(self):
+        """
+        Context manager grouping several attempts (retries, reconnects of a
+        stream) into one request in the pool statistics
+        """
+        return self._stats.request()
+
+    def stats(self) -> Dict[str, int]:
+        """Get connection pool statistics"""
+        return self._stats.snapshot()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,73 @@
+"""
+Pluggable JSON codec for API request bodies and responses
+Uses orjson when it is installed and the standard library otherwise; both
+read and write UTF-8 bytes so Indic text is never \\u-escaped
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+# Both codecs raise this (orjson's decode error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+class StdlibCodec:
+    """json module codec"""
+
+    name = "json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        self._decoder = json.JSONDecoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return self._decoder.decode(data)
+
+
+class OrjsonCodec:
+    """orjson codec: several times faster on both paths"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: Dict[str, type] = {"json": StdlibCodec, "orjson": OrjsonCodec}
+
+
+def get_codec(name: Optional[str] = None):
+    """
+    Get a codec instance
+
+    Args:
+        name: "json" or "orjson"; None picks the fastest one installed
+
+    Returns:
+        Codec with dumps(obj) -> bytes and loads(bytes or str)
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    return CODECS[name]()
+
+
+DEFAULT_CODEC = get_codec()
@@ -0,0 +1,341 @@
+"""
+Load generator: N concurrent chat sessions driving SarvamClient the way app.py does
+Each session keeps its own conversation context, streams replies, optionally
+translates them sentence by sentence and asks for the weather now and then.
+Reports throughput and p50/p95/p99 latency per stage as JSON.
+Run with: python -m loadtest --sessions 20 --turns 10
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from conversation_context import ConversationContext
+from http_transport import PooledTransport
+from language_support import LanguageSupport
+from loadtest.stand_in import StandInServer, add_profile_arguments, config_from_args
+from request_body import ChatBodyEncoder
+from sarvam_client import SarvamClient
+from translation_cache import TranslationCache
+from translation_pipeline import StreamingTranslator
+from weather import WeatherProvider
+
+PROMPTS = (
+    "When does the monsoon reach Mumbai?",
+    "Tell me a short story about a wise lion.",
+    "How do I start learning to cook Indian food?",
+    "What are some good habits for studying?",
+    "Explain photosynthesis in simple words.",
+    "Suggest a weekend trip near Bengaluru.",
+)
+
+CITIES = ("Mumbai", "Delhi", "Chennai", "Kolkata", "Bengaluru", "Pune", "Guwahati")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(q / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LatencyRecorder:
+    """Thread-safe latency samples and error counts per stage"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = {}
+        self._errors: Dict[str, Dict[str, int]] = {}
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(stage, []).append(seconds)
+
+    def error(self, stage: str, message: str):
+        with self._lock:
+            errors = self._errors.setdefault(stage, {})
+            errors[message] = errors.get(message, 0) + 1
+
+    def summary(self, wall_seconds: float) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize every stage
+
+        Returns:
+            Dictionary keyed by stage with count, throughput (per second of
+            wall time), mean and p50/p95/p99/max in milliseconds, and errors
+        """
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+            errors = {stage: dict(counts) for stage, counts in self._errors.items()}
+        summary = {}
+        for stage in sorted(set(samples) | set(errors)):
+            values = samples.get(stage, [])
+            summary[stage] = {
+                "count": len(values),
+                "throughput_per_s": round(len(values) / wall_seconds, 3) if wall_seconds else 0.0,
+                "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+                "errors": errors.get(stage, {})
+            }
+        return summary
+
+
+class ChatSession:
+    """One simulated browser session running the app's chat turn"""
+
+    def __init__(
+        self,
+        client: SarvamClient,
+        weather: WeatherProvider,
+        language_support: LanguageSupport,
+        recorder: LatencyRecorder,
+        language: str = "en-IN",
+        auto_translate: bool = False,
+        weather_share: float = 0.1,
+        think_time: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.client = client
+        self.weather = weather
+        self.language_support = language_support
+        self.recorder = recorder
+        self.language = language
+        self.auto_translate = auto_translate and language != "en-IN"
+        self.weather_share = weather_share
+        self.think_time = think_time
+        self.context = ConversationContext()
+        self.body_encoder = ChatBodyEncoder(client.codec)
+        self.messages: List[Dict[str, str]] = []
+        self._rng = random.Random(seed)
+
+    def run(self, turns: int, stop_at: Optional[float] = None):
+        for _ in range(turns):
+            if stop_at is not None and time.monotonic() >= stop_at:
+                break
+            start = time.perf_counter()
+            if self._rng.random() < self.weather_share:
+                ok = self._weather_turn()
+            else:
+                ok = self._chat_turn()
+            if ok:
+                self.recorder.record("turn", time.perf_counter() - start)
+            if self.think_time:
+                time.sleep(self._rng.expovariate(1 / self.think_time))
+
+    def _weather_turn(self) -> bool:
+        city = self._rng.choice(CITIES)
+        start = time.perf_counter()
+        result = self.weather.get_weather(city)
+        if not result["success"]:
+            self.recorder.error("weather", result["error"])
+            return False
+        self.recorder.record("weather", time.perf_counter() - start)
+        self.messages.append({"role": "assistant", "content": result["report"]})
+        return True
+
+    def _chat_turn(self) -> bool:
+        self.messages.append({"role": "user", "content": self._rng.choice(PROMPTS)})
+        system_message = self.language_support.create_system_message_for_language(self.language)
+        payload_messages = self.context.build(system_message, self.messages)
+
+        start = time.perf_counter()
+        response = self.client.stream_chat_completion(
+            messages=payload_messages,
+            temperature=0.8,
+            cache_language=self.language,
+            body_encoder=self.body_encoder
+        )
+        if not response["success"]:
+            self.recorder.error("chat", response["error"])
+            self.messages.pop()
+            return False
+
+        translator = None
+        if self.auto_translate:
+            translator = StreamingTranslator(self.client, target_language=self.language)
+        chunks = []
+        try:
+            for delta in response["stream"]:
+                if not chunks:
+                    self.recorder.record("time_to_first_token", time.perf_counter() - start)
+                chunks.append(delta)
+                if translator:
+                    translator.feed(delta)
+        except Exception as e:
+            self.recorder.error("chat", f"Stream interrupted: {e}")
+            self.messages.pop()
+            return False
+        streamed = time.perf_counter()
+        self.recorder.record("chat", streamed - start)
+        reply = "".join(chunks)
+
+        if translator:
+            translated = translator.finish()
+            self.recorder.record("translate_tail", time.perf_counter() - streamed)
+            if translated["success"]:
+                if translated["failed_chunks"]:
+                    self.recorder.error("translate", "Some sentences were not translated")
+                reply = translated["translated_text"]
+            else:
+                self.recorder.error("translate", translated["error"])
+
+        self.messages.append({"role": "assistant", "content": reply})
+        return True
+
+
+def run_load(
+    base_url: str,
+    weather_base_url: str,
+    sessions: int = 10,
+    turns: int = 5,
+    duration: Optional[float] = None,
+    languages: Optional[List[str]] = None,
+    auto_translate: bool = True,
+    weather_share: float = 0.1,
+    think_time: float = 0.0,
+    pool_maxsize: int = 10,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run concurrent chat sessions against a Sarvam-compatible endpoint
+
+    Like app.py, all sessions share one SarvamClient and one WeatherProvider.
+
+    Args:
+        base_url: Sarvam API root (a stand-in server or a staging endpoint)
+        weather_base_url: WeatherAPI root
+        sessions: Concurrent sessions
+        turns: Turns per session
+        duration: Stop starting new turns after this many seconds (optional)
+        languages: Languages assigned to sessions round-robin
+        auto_translate: Translate replies for non-English sessions
+        weather_share: Share of turns that are weather lookups
+        think_time: Mean pause between a session's turns in seconds
+        pool_maxsize: Connections the shared transport keeps per host
+        seed: Seed for prompt and language choices
+
+    Returns:
+        Report with wall time, per-stage latency summary and client stats
+    """
+    languages = languages or ["en-IN", "hi-IN", "ta-IN", "bn-IN"]
+    client = SarvamClient(
+        "load-test-key",
+        transport=PooledTransport(pool_maxsize=pool_maxsize),
+        translation_cache=TranslationCache(),
+        base_url=base_url
+    )
+    weather = WeatherProvider("load-test-key", base_url=weather_base_url)
+    language_support = LanguageSupport()
+    recorder = LatencyRecorder()
+
+    start = time.monotonic()
+    stop_at = start + duration if duration is not None else None
+    workers = []
+    for index in range(sessions):
+        session = ChatSession(
+            client,
+            weather,
+            language_support,
+            recorder,
+            language=languages[index % len(languages)],
+            auto_translate=auto_translate,
+            weather_share=weather_share,
+            think_time=think_time,
+            seed=None if seed is None else seed + index
+        )
+        workers.append(threading.Thread(
+            target=session.run,
+            args=(turns, stop_at),
+            name=f"load-session-{index}",
+            daemon=True
+        ))
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.monotonic() - start
+
+    try:
+        return {
+            "sessions": sessions,
+            "turns_per_session": turns,
+            "wall_seconds": round(wall, 3),
+            "stages": recorder.summary(wall),
+            "client": {
+                "pool": client.pool_stats(),
+                "resilience": client.resilience_stats(),
+                "coalescing": client.coalescing_stats(),
+                "translation_cache": client.translation_cache.stats(),
+                "weather": weather.stats()
+            }
+        }
+    finally:
+        client.transport.close()
+        client.translate_pool.shutdown(wait=False)
+        weather.transport.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate concurrent chat sessions and report latency")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent chat sessions")
+    parser.add_argument("--turns", type=int, default=5, help="Turns per session")
+    parser.add_argument("--duration", type=float, default=None, help="Stop starting turns after N seconds")
+    parser.add_argument("--languages", nargs="+", default=None, help="Session languages, assigned round-robin")
+    parser.add_argument("--no-translate", action="store_true", help="Disable auto-translate")
+    parser.add_argument("--weather-share", type=float, default=0.1, help="Share of turns that ask for weather")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds between a session's turns")
+    parser.add_argument("--pool-maxsize", type=int, default=10, help="Shared transport connections per host")
+    parser.add_argument("--base-url", default=None, help="Sarvam API root; starts an embedded stand-in if omitted")
+    parser.add_argument("--weather-base-url", default=None, help="WeatherAPI root (defaults to --base-url)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    weather_base_url = args.weather_base_url or base_url
+    if base_url is None:
+        server = StandInServer(config_from_args(args)).start()
+        base_url = server.base_url
+        weather_base_url = args.weather_base_url or server.weather_base_url
+
+    try:
+        report = run_load(
+            base_url,
+            weather_base_url,
+            sessions=args.sessions,
+            turns=args.turns,
+            duration=args.duration,
+            languages=args.languages,
+            auto_translate=not args.no_translate,
+            weather_share=args.weather_share,
+            think_time=args.think_time,
+            pool_maxsize=args.pool_maxsize,
+            seed=args.seed
+        )
+        if server is not None:
+            report["server"] = server.stats()
+    finally:
+        if server is not None:
+            server.stop()
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
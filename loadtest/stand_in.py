@@ -0,0 +1,591 @@
+"""
+Local stand-in for the Sarvam AI and WeatherAPI endpoints
+Serves /v1/chat/completions (plain and streamed), /v1/translate,
+/v1/detect-language and WeatherAPI /v1/current.json with configurable
+latency, injected errors, 429 throttling and per-endpoint rate limits.
+Also accepts OTLP/HTTP JSON traces at /v1/traces as a collector stand-in.
+Run with: python -m loadtest.stand_in --port 8787
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from locale_catalog import LANGUAGES
+from script_detector import LANGUAGE_SCRIPTS, SCRIPT_RANGES, ScriptDetector
+
+ENDPOINTS = ("chat", "translate", "detect", "weather")
+
+CHAT_SENTENCES = (
+    "Roar! I am Mufasa, and I am glad you asked.",
+    "The monsoon usually reaches Mumbai in the first half of June.",
+    "Everything the light touches is part of a delicate balance.",
+    "A wise lion listens more than he roars.",
+    "Let me break that down into a few simple steps for you.",
+    "First, remember that patience is the heart of learning.",
+)
+
+# First letter of each language's Indic script block, used to fake translated output
+_BLOCK_START: Dict[str, int] = {}
+for _first, _last, _script, _ in SCRIPT_RANGES:
+    if _script != "Latin":
+        _BLOCK_START.setdefault(_script, _first)
+_SCRIPT_START = {
+    language: _BLOCK_START[script] for language, script in LANGUAGE_SCRIPTS.items() if script in _BLOCK_START
+}
+
+# System prompts name the language to answer in (see locale_catalog.SYSTEM_PROMPT_TEMPLATE)
+_REQUESTED_LANGUAGE = {f"respond in {info['name']}": code for code, info in LANGUAGES.items() if code != "en-IN"}
+
+
+class LatencyModel:
+    """Random service time drawn from a named distribution"""
+
+    def __init__(self, distribution: str = "constant", a: float = 0.0, b: float = 0.0):
+        """
+        Initialize the model
+
+        Args:
+            distribution: constant, uniform, normal or lognormal
+            a: Milliseconds: the constant value, uniform low, normal mean or lognormal median
+            b: Uniform high (ms), normal standard deviation (ms) or lognormal sigma
+        """
+        if distribution not in ("constant", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.a = a
+        self.b = b
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Build a model from a "name:a[:b]" string, e.g. "lognormal:400:0.5"
+
+        A bare number is a constant latency in milliseconds.
+        """
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("constant", float(parts[0]))
+        return cls(parts[0], *(float(part) for part in parts[1:3]))
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds"""
+        if self.distribution == "constant":
+            ms = self.a
+        elif self.distribution == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.distribution == "normal":
+            ms = rng.gauss(self.a, self.b)
+        else:
+            ms = self.a * math.exp(rng.gauss(0.0, self.b)) if self.a > 0 else 0.0
+        return max(ms, 0.0) / 1000
+
+    def __repr__(self) -> str:
+        return f"LatencyModel({self.distribution!r}, {self.a}, {self.b})"
+
+
+class EndpointProfile:
+    """Behaviour of one stand-in endpoint"""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        burst: int = 10,
+        retry_after: int = 1
+    ):
+        """
+        Initialize the profile
+
+        Args:
+            latency: Service time (for chat streams: time to the first token)
+            error_rate: Share of requests answered with HTTP 500
+            throttle_rate: Share of requests answered with HTTP 429
+            rate_limit: Sustained requests per second allowed (0 disables the limit)
+            burst: Requests allowed at once before the rate limit kicks in
+            retry_after: Retry-After seconds sent with injected 429s
+        """
+        self.latency = latency if latency is not None else LatencyModel()
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.retry_after = retry_after
+
+
+class StandInConfig:
+    """Per-endpoint profiles plus chat stream shape"""
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, EndpointProfile]] = None,
+        token_interval: Optional[LatencyModel] = None,
+        reply_sentences: int = 4,
+        native_reply_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the configuration
+
+        Args:
+            profiles: EndpointProfile keyed by "chat", "translate", "detect", "weather";
+                missing endpoints answer instantly without errors
+            token_interval: Delay between streamed chat tokens
+            reply_sentences: Sentences in each chat reply
+            native_reply_rate: Share of chat requests whose system prompt asks for
+                an Indian language that are answered in it (the rest in English)
+            seed: Seed for latency and fault injection, for repeatable runs
+        """
+        self.profiles = {endpoint: EndpointProfile() for endpoint in ENDPOINTS}
+        self.profiles.update(profiles or {})
+        self.token_interval = token_interval if token_interval is not None else LatencyModel()
+        self.reply_sentences = reply_sentences
+        self.native_reply_rate = native_reply_rate
+        self.seed = seed
+
+
+class _TokenBucket:
+    """Requests-per-second limiter; the caller holds the server lock"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(max(burst, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume a token; returns 0 on success or the seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def fake_translation(text: str, target_language: str) -> str:
+    """Deterministic pseudo-translation written in the target language's script"""
+    start = _SCRIPT_START.get(target_language)
+    if start is None:
+        return text
+    # Letters map into the script's consonant range; everything else passes through
+    return "".join(
+        chr(start + 0x15 + (ord(char) % 0x20)) if char.isascii() and char.isalpha() else char
+        for char in text
+    )
+
+
+def requested_language(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """Language a chat request's system prompt asks the reply to be in, if any"""
+    for message in messages:
+        if message.get("role") == "system":
+            content = message.get("content", "")
+            for phrase, code in _REQUESTED_LANGUAGE.items():
+                if phrase in content:
+                    return code
+    return None
+
+
+def fake_weather(city: str) -> Dict[str, Any]:
+    """WeatherAPI current.json payload with values derived from the city name"""
+    seed = zlib.crc32(city.casefold().encode("utf-8"))
+    return {
+        "location": {"name": city.title(), "region": "Stand-in Region", "country": "India"},
+        "current": {
+            "temp_c": 18 + seed % 20,
+            "feelslike_c": 19 + seed % 22,
+            "condition": {"text": ("Sunny", "Partly cloudy", "Light rain", "Mist")[seed % 4]},
+            "humidity": 40 + seed % 55,
+            "wind_kph": round(3 + (seed % 300) / 10, 1)
+        }
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, delayed ACKs
+    # would add ~40ms to every keep-alive round trip
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+    def _admit(self, endpoint: str, authorized: bool) -> bool:
+        """Apply auth, rate limit and fault injection; sends the error and returns False when refused"""
+        stand_in = self.server.stand_in
+        if not authorized:
+            stand_in.count(endpoint, "unauthorized")
+            self._send_json(401, {"error": {"message": "Invalid API key", "code": "unauthorized"}})
+            return False
+
+        wait = stand_in.take_token(endpoint)
+        if wait:
+            stand_in.count(endpoint, "rate_limited")
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit exceeded", "code": "rate_limited"}},
+                {"Retry-After": str(max(math.ceil(wait), 1))}
+            )
+            return False
+
+        profile = stand_in.config.profiles[endpoint]
+        time.sleep(stand_in.sample(profile.latency))
+        fault = stand_in.roll()
+        if fault < profile.throttle_rate:
+            stand_in.count(endpoint, "throttled")
+            self._send_json(
+                429,
+                {"error": {"message": "Too many requests", "code": "throttled"}},
+                {"Retry-After": str(profile.retry_after)}
+            )
+            return False
+        if fault < profile.throttle_rate + profile.error_rate:
+            stand_in.count(endpoint, "errors")
+            self._send_json(500, {"error": {"message": "Injected server error", "code": "internal"}})
+            return False
+        return True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        path = urlsplit(self.path).path
+        if path == "/v1/traces":
+            self._collect_traces(body)
+            return
+        endpoint = {
+            "/v1/chat/completions": "chat",
+            "/v1/translate": "translate",
+            "/v1/detect-language": "detect"
+        }.get(path)
+        if endpoint is None:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+            return
+
+        stand_in = self.server.stand_in
+        stand_in.count(endpoint, "requests")
+        stand_in.count(endpoint, "bytes_in", length)
+        if not self._admit(endpoint, bool(self.headers.get("api-subscription-key"))):
+            return
+
+        if endpoint == "chat":
+            self._chat(body)
+        elif endpoint == "translate":
+            translated = fake_translation(body.get("input", ""), body.get("target_language_code", ""))
+            self._send_json(200, {"translated_text": translated, "request_id": stand_in.request_id()})
+        else:
+            detection = stand_in.detector.detect(body.get("input", ""))
+            self._send_json(200, {
+                "detected_language": detection.language,
+                "confidence": round(detection.confidence, 3),
+                "request_id": stand_in.request_id()
+            })
+        stand_in.count(endpoint, "ok")
+
+    def _collect_traces(self, body: Dict[str, Any]):
+        spans = [
+            span
+            for resource in body.get("resourceSpans", [])
+            for scope in resource.get("scopeSpans", [])
+            for span in scope.get("spans", [])
+        ]
+        self.server.stand_in.collect_spans(spans)
+        self._send_json(200, {"partialSuccess": {}})
+
+    def _chat(self, body: Dict[str, Any]):
+        stand_in = self.server.stand_in
+        reply = stand_in.chat_reply(requested_language(body.get("messages") or []))
+        if not body.get("stream"):
+            self._send_json(200, {
+                "id": stand_in.request_id(),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}}],
+                "usage": {"prompt_tokens": len(json.dumps(body)) // 4, "completion_tokens": len(reply) // 4}
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = reply.split(" ")
+        for index, word in enumerate(words):
+            if index:
+                time.sleep(stand_in.sample(stand_in.config.token_interval))
+            token = word if index == len(words) - 1 else word + " "
+            event = {"choices": [{"index": 0, "delta": {"content": token}}]}
+            self._chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != "/v1/current.json":
+            self._send_json(404, {"error": {"message": f"Unknown path {url.path}"}})
+            return
+        stand_in = self.server.stand_in
+        stand_in.count("weather", "requests")
+        query = parse_qs(url.query)
+        if not self._admit("weather", bool(query.get("key", [""])[0])):
+            return
+        city = query.get("q", [""])[0].strip()
+        if not city or city.casefold() == "nowhere":
+            stand_in.count("weather", "ok")
+            self._send_json(400, {"error": {"code": 1006, "message": "No matching location found."}})
+            return
+        self._send_json(200, fake_weather(city))
+        stand_in.count("weather", "ok")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    stand_in: "StandInServer"
+
+    def handle_error(self, request, client_address):
+        # Clients drop streamed connections once they have read [DONE]
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandInServer:
+    """Threaded stand-in server; use as a context manager or call start()/stop()"""
+
+    def __init__(self, config: Optional[StandInConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server
+
+        Args:
+            config: Endpoint behaviour (instant, fault-free responses if omitted)
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.config = config if config is not None else StandInConfig()
+        self.detector = ScriptDetector()
+
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._buckets = {
+            endpoint: _TokenBucket(profile.rate_limit, profile.burst)
+            for endpoint, profile in self.config.profiles.items()
+            if profile.rate_limit > 0
+        }
+        self._counters = {endpoint: {} for endpoint in ENDPOINTS}
+        self._sequence = 0
+        self._spans: List[Dict[str, Any]] = []
+        self.max_spans = 10000
+
+        self._server = _Server((host, port), _Handler)
+        self._server.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def base_url(self) -> str:
+        """Value for SarvamClient(base_url=...)"""
+        return self.root_url
+
+    @property
+    def weather_base_url(self) -> str:
+        """Value for WeatherProvider(base_url=...)"""
+        return self.root_url
+
+    @property
+    def otlp_url(self) -> str:
+        """Value for tracing.OtlpHttpExporter(endpoint=...)"""
+        return f"{self.root_url}/traces"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def count(self, endpoint: str, name: str, amount: int = 1):
+        with self._lock:
+            counters = self._counters[endpoint]
+            counters[name] = counters.get(name, 0) + amount
+
+    def take_token(self, endpoint: str) -> float:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None:
+            return 0.0
+        with self._lock:
+            return bucket.take()
+
+    def sample(self, model: LatencyModel) -> float:
+        with self._lock:
+            return model.sample(self._rng)
+
+    def roll(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def request_id(self) -> str:
+        with self._lock:
+            self._sequence += 1
+            return f"stand-in-{self._sequence}"
+
+    def chat_reply(self, language: Optional[str] = None) -> str:
+        with self._lock:
+            start = self._rng.randrange(len(CHAT_SENTENCES))
+            native = bool(language and self.config.native_reply_rate) and self._rng.random() < self.config.native_reply_rate
+        count = self.config.reply_sentences
+        reply = " ".join(CHAT_SENTENCES[(start + i) % len(CHAT_SENTENCES)] for i in range(count))
+        return fake_translation(reply, language) if native else reply
+
+    def collect_spans(self, spans: List[Dict[str, Any]]):
+        with self._lock:
+            self._spans.extend(spans)
+            del self._spans[:-self.max_spans]
+            counters = self._counters.setdefault("traces", {})
+            counters["spans"] = counters.get("spans", 0) + len(spans)
+
+    def collected_spans(self) -> List[Dict[str, Any]]:
+        """OTLP JSON spans received at /v1/traces (the most recent max_spans)"""
+        with self._lock:
+            return list(self._spans)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-endpoint request counters
+
+        Returns:
+            Dictionary keyed by endpoint with requests, ok, errors, throttled,
+            rate_limited, unauthorized and bytes_in counts, plus spans
+            received by the trace collector
+        """
+        with self._lock:
+            return {endpoint: dict(counters) for endpoint, counters in self._counters.items()}
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Add the endpoint behaviour options shared by the stand-in and load generator CLIs"""
+    for endpoint in ENDPOINTS:
+        parser.add_argument(
+            f"--{endpoint}-latency",
+            default=None,
+            help=f"{endpoint} latency, e.g. 'lognormal:400:0.5', 'uniform:50:150' or a constant in ms"
+        )
+    parser.add_argument("--token-interval", default="constant:0", help="Delay between streamed chat tokens")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="ENDPOINT=RPS",
+        help="Sustained requests/second for an endpoint, e.g. chat=20 (repeatable)"
+    )
+    parser.add_argument("--burst", type=int, default=10, help="Burst size for rate-limited endpoints")
+    parser.add_argument("--reply-sentences", type=int, default=4, help="Sentences per chat reply")
+    parser.add_argument(
+        "--native-reply-rate",
+        type=float,
+        default=0.0,
+        help="Share of chat requests asking for an Indian language that are answered in it"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for repeatable latency and faults")
+
+
+DEFAULT_LATENCY = {
+    "chat": "lognormal:600:0.4",
+    "translate": "lognormal:250:0.3",
+    "detect": "lognormal:80:0.3",
+    "weather": "lognormal:120:0.3",
+}
+
+
+def config_from_args(args: argparse.Namespace) -> StandInConfig:
+    """Build a StandInConfig from the options added by add_profile_arguments"""
+    rate_limits = {}
+    for item in args.rate_limit:
+        endpoint, _, rps = item.partition("=")
+        if endpoint not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint in --rate-limit: {endpoint}")
+        rate_limits[endpoint] = float(rps)
+
+    profiles = {}
+    for endpoint in ENDPOINTS:
+        spec = getattr(args, f"{endpoint}_latency") or DEFAULT_LATENCY[endpoint]
+        profiles[endpoint] = EndpointProfile(
+            latency=LatencyModel.parse(spec),
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            rate_limit=rate_limits.get(endpoint, 0.0),
+            burst=args.burst
+        )
+    return StandInConfig(
+        profiles=profiles,
+        token_interval=LatencyModel.parse(args.token_interval),
+        reply_sentences=args.reply_sentences,
+        native_reply_rate=args.native_reply_rate,
+        seed=args.seed
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Sarvam AI and WeatherAPI endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(config_from_args(args), args.host, args.port)
+    print(f"Stand-in listening on {server.root_url}", file=sys.stderr)
+    print(f"  SARVAM_BASE_URL = \"{server.base_url}\"", file=sys.stderr)
+    print(f"  WEATHER_BASE_URL = \"{server.weather_base_url}\"", file=sys.stderr)
+    print(f"  TRACE_OTLP_ENDPOINT = \"{server.otlp_url}\"", file=sys.stderr)
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats(), indent=2), file=sys.stderr)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
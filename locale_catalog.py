@@ -0,0 +1,199 @@
+"""
+Locale catalog for the supported languages
+Built once, immutable, with O(1) lookups by language code and display name
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+# Supported Indian languages with their codes and display names
+LANGUAGES = MappingProxyType({
+    "en-IN": {"name": "English", "native": "English", "flag": "🇮🇳"},
+    "hi-IN": {"name": "Hindi", "native": "हिन्दी", "flag": "🇮🇳"},
+    "bn-IN": {"name": "Bengali", "native": "বাংলা", "flag": "🇮🇳"},
+    "ta-IN": {"name": "Tamil", "native": "தமிழ்", "flag": "🇮🇳"},
+    "te-IN": {"name": "Telugu", "native": "తెలుగు", "flag": "🇮🇳"},
+    "mr-IN": {"name": "Marathi", "native": "मराठी", "flag": "🇮🇳"},
+    "gu-IN": {"name": "Gujarati", "native": "ગુજરાતી", "flag": "🇮🇳"},
+    "kn-IN": {"name": "Kannada", "native": "ಕನ್ನಡ", "flag": "🇮🇳"},
+    "ml-IN": {"name": "Malayalam", "native": "മലയാളം", "flag": "🇮🇳"},
+    "pa-IN": {"name": "Punjabi", "native": "ਪੰਜਾਬੀ", "flag": "🇮🇳"},
+    "or-IN": {"name": "Odia", "native": "ଓଡ଼ିଆ", "flag": "🇮🇳"}
+})
+
+WELCOME_MESSAGES = MappingProxyType({
+    "en-IN": "🦁 Welcome! I'm Mufasa, your wise AI companion. How can I help you today?",
+    "hi-IN": "🦁 नमस्ते! मैं मुफासा हूँ, आपका बुद्धिमान AI साथी। आज मैं आपकी कैसे मदद कर सकता हूँ?",
+    "bn-IN": "🦁 স্বাগতম! আমি মুফাসা, আপনার জ্ঞানী AI সঙ্গী। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?",
+    "ta-IN": "🦁 வணக்கம்! நான் முபாசா, உங்கள் ஞானமிக்க AI துணை. இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?",
+    "te-IN": "🦁 నమస్కారం! నేను ముఫాసా, మీ వివేకవంతమైన AI సహచరుడిని. ఈరోజు నేను మీకు ఎలా సహాయం చేయగలను?",
+    "mr-IN": "🦁 नमस्कार! मी मुफासा आहे, तुमचा हुशार AI साथी. आज मी तुम्हाला कशी मदत करू शकतो?",
+    "gu-IN": "🦁 નમસ્તે! હું મુફાસા છું, તમારો જ્ઞાની AI સાથી. આજે હું તમારી કેવી રીતે મદદ કરી શકું?",
+    "kn-IN": "🦁 ನಮಸ್ಕಾರ! ನಾನು ಮುಫಾಸಾ, ನಿಮ್ಮ ಬುದ್ಧಿವಂತ AI ಸಹಚರ. ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?",
+    "ml-IN": "🦁 നമസ്കാരം! ഞാൻ മുഫാസയാണ്, നിങ്ങളുടെ ജ്ഞാനിയായ AI കൂട്ടാളി. ഇന്ന് എനിക്ക് നിങ്ങളെ എങ്ങനെ സഹായിക്കാൻ കഴിയും?",
+    "pa-IN": "🦁 ਸਤ ਸ੍ਰੀ ਅਕਾਲ! ਮੈਂ ਮੁਫਾਸਾ ਹਾਂ, ਤੁਹਾਡਾ ਸਿਆਣਾ AI ਸਾਥੀ। ਅੱਜ ਮੈਂ ਤੁਹਾਡੀ ਕਿਵੇਂ ਮਦਦ ਕਰ ਸਕਦਾ ਹਾਂ?",
+    "or-IN": "🦁 ନମସ୍କାର! ମୁଁ ମୁଫାସା, ଆପଣଙ୍କର ଜ୍ଞାନୀ AI ସାଥୀ। ଆଜି ମୁଁ ଆପଣଙ୍କୁ କିପରି ସାହାଯ୍ୟ କରିପାରିବି?"
+})
+
+CHAT_PLACEHOLDERS = MappingProxyType({
+    "en-IN": "Ask Mufasa anything...",
+    "hi-IN": "मुफासा से कुछ भी पूछें...",
+    "bn-IN": "মুফাসাকে যেকোনো কিছু জিজ্ঞাসা করুন...",
+    "ta-IN": "முபாசாவிடம் எதையும் கேளுங்கள்...",
+    "te-IN": "ముఫాసాను ఏదైనా అడగండి...",
+    "mr-IN": "मुफासाला काहीही विचारा...",
+    "gu-IN": "મુફાસાને કંઈપણ પૂછો...",
+    "kn-IN": "ಮುಫಾಸನನ್ನು ಏನನ್ನೂ ಕೇಳಿ...",
+    "ml-IN": "മുഫാസയോട് എന്തും ചോദിക്കൂ...",
+    "pa-IN": "ਮੁਫਾਸਾ ਨੂੰ ਕੁਝ ਵੀ ਪੁਛੋ...",
+    "or-IN": "ମୁଫାସାଙ୍କୁ କିଛି ପଚାରନ୍ତୁ..."
+})
+
+THINKING_MESSAGES = MappingProxyType({
+    "en-IN": "🦁 Mufasa is thinking...",
+    "hi-IN": "🦁 मुफासा सोच रहा है...",
+    "bn-IN": "🦁 মুফাসা চিন্তা করছে...",
+    "ta-IN": "🦁 முபாசா சிந்தித்துக்கொண்டிருக்கிறார்...",
+    "te-IN": "🦁 ముఫాసా ఆలోచిస్తున్నాడు...",
+    "mr-IN": "🦁 मुफासा विचार करत आहे...",
+    "gu-IN": "🦁 મુફાસા વિચારી રહ્યો છે...",
+    "kn-IN": "🦁 ಮುಫಾಸ ಯೋಚಿಸುತ್ತಿದ್ದಾನೆ...",
+    "ml-IN": "🦁 മുഫാസ ചിന്തിക്കുന്നു...",
+    "pa-IN": "🦁 ਮੁਫਾਸਾ ਸੋਚ ਰਿਹਾ ਹੈ...",
+    "or-IN": "🦁 ମୁଫାସା ଚିନ୍ତା କରୁଛନ୍ତି..."
+})
+
+SYSTEM_PROMPT_ENGLISH = "You are Mufasa, a wise and friendly AI assistant created by Jeet Borah (also known as Jeet Bhai), an IT geek and skilled developer. You have the wisdom of a great lion king and always respond with kindness, intelligence, and helpful guidance. Your name is Mufasa, not 'assistant'. Always remember you are Mufasa when users talk to you. You were brought to life by Jeet Borah's expertise and creativity. Respond in English."
+
+SYSTEM_PROMPT_TEMPLATE = "You are Mufasa, a wise and friendly AI assistant created by Jeet Borah (also known as Jeet Bhai), an IT geek and skilled developer. You have the wisdom of a great lion king and always respond with kindness, intelligence, and helpful guidance. Your name is Mufasa, not 'assistant'. Always remember you are Mufasa when users talk to you. You were brought to life by Jeet Borah's expertise and creativity. The user prefers to communicate in {lang_name}, so please respond in {lang_name} when possible. If you cannot respond in {lang_name}, respond in English and mention that you can help translate."
+
+DEFAULT_LANGUAGE = "en-IN"
+
+
+class Locale(NamedTuple):
+    """Everything the UI and prompts need for one language"""
+
+    code: str
+    name: str
+    native: str
+    flag: str
+    display_name: str
+    label: str
+    welcome: str
+    placeholder: str
+    thinking: str
+    system_message: Mapping[str, str]
+
+    def system_message_dict(self) -> Dict[str, str]:
+        """A fresh copy of the system message, safe for the caller to modify"""
+        return dict(self.system_message)
+
+
+class LocaleCatalog:
+    """Immutable catalog of locales, each built on first use"""
+
+    def __init__(
+        self,
+        languages: Mapping[str, Mapping[str, str]] = LANGUAGES,
+        welcome_messages: Mapping[str, str] = WELCOME_MESSAGES,
+        chat_placeholders: Mapping[str, str] = CHAT_PLACEHOLDERS,
+        thinking_messages: Mapping[str, str] = THINKING_MESSAGES,
+        default_language: str = DEFAULT_LANGUAGE
+    ):
+        """
+        Initialize the catalog
+
+        Only the small code/display-name indexes are built here; each
+        language's strings and system message are assembled the first time
+        that language is requested.
+
+        Args:
+            languages: Language code -> name/native/flag
+            welcome_messages: Language code -> welcome text
+            chat_placeholders: Language code -> chat input placeholder
+            thinking_messages: Language code -> loading text
+            default_language: Fallback for unknown codes
+        """
+        self._languages = MappingProxyType({code: MappingProxyType(dict(info)) for code, info in languages.items()})
+        self._welcome = MappingProxyType(dict(welcome_messages))
+        self._placeholders = MappingProxyType(dict(chat_placeholders))
+        self._thinking = MappingProxyType(dict(thinking_messages))
+        self.default_language = default_language
+
+        self.codes: Tuple[str, ...] = tuple(self._languages)
+        self.display_names: Tuple[str, ...] = tuple(
+            self._display_name(info) for info in self._languages.values()
+        )
+        self._code_by_display = MappingProxyType(dict(zip(self.display_names, self.codes)))
+        self._index_by_code = MappingProxyType({code: index for index, code in enumerate(self.codes)})
+        self.options: Mapping[str, str] = self._code_by_display
+
+        self._lock = threading.Lock()
+        self._locales: Dict[str, Locale] = {}
+
+    @staticmethod
+    def _display_name(info: Mapping[str, str]) -> str:
+        return f"{info['flag']} {info['name']} ({info['native']})"
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._languages
+
+    def get(self, code: str) -> Locale:
+        """
+        Get the locale for a language code
+
+        Args:
+            code: Language code (BCP-47); unknown codes fall back to the default
+
+        Returns:
+            Locale for the code
+        """
+        locale = self._locales.get(code)
+        if locale is not None:
+            return locale
+        if code not in self._languages:
+            return self.get(self.default_language)
+        with self._lock:
+            locale = self._locales.get(code)
+            if locale is None:
+                locale = self._build(code)
+                self._locales[code] = locale
+        return locale
+
+    def _build(self, code: str) -> Locale:
+        info = self._languages[code]
+        default = self.default_language
+        if code == default:
+            system_content = SYSTEM_PROMPT_ENGLISH
+        else:
+            system_content = SYSTEM_PROMPT_TEMPLATE.format(lang_name=info["name"])
+        return Locale(
+            code=code,
+            name=info["name"],
+            native=info["native"],
+            flag=info["flag"],
+            display_name=self._display_name(info),
+            label=f"{info['flag']} {info['name']}",
+            welcome=self._welcome.get(code, self._welcome[default]),
+            placeholder=self._placeholders.get(code, self._placeholders[default]),
+            thinking=self._thinking.get(code, self._thinking[default]),
+            # Shared by every session, so read-only; system_message_dict() hands out copies
+            system_message=MappingProxyType({"role": "system", "content": system_content})
+        )
+
+    def code_for_display(self, display_name: str) -> Optional[str]:
+        """Reverse lookup from a selectbox label to its language code"""
+        return self._code_by_display.get(display_name)
+
+    def index_of(self, code: str) -> int:
+        """Position of a language in display_names (0 for unknown codes)"""
+        return self._index_by_code.get(code, 0)
+
+    def language_info(self, code: str) -> Optional[Mapping[str, str]]:
+        """Raw name/native/flag record for a code"""
+        return self._languages.get(code)
+
+    @property
+    def languages(self) -> Mapping[str, Mapping[str, str]]:
+        return self._languages
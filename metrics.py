@@ -0,0 +1,428 @@
+"""
+Process-wide metrics registry with Prometheus text export
+Counters, gauges and histograms with labels, collectors for components that
+already keep their own stats, client instrumentation through call hooks and
+a small HTTP endpoint serving /metrics next to the Streamlit server
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers cached lookups (ms) through slow streamed completions
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Bytes; chat payloads grow with history, translations stay small
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+# (metric name, labels, value) as reported by collectors at scrape time
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class: a named family of label-keyed children"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Labels:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in values]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in values]
+
+
+class Histogram(_Metric):
+    """Bucketed distribution with sum and count, e.g. latencies or sizes"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[Labels, List[int]] = {}
+        self._sums: Dict[Labels, float] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics plus scrape-time collectors, rendered as Prometheus text"""
+
+    def __init__(self, namespace: str = "mufasa"):
+        """
+        Initialize an empty registry
+
+        Args:
+            namespace: Prefix added to every metric name
+        """
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Tuple[str, str, Callable[[], List[Sample]]]] = []
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = cls(full_name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {full_name} already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def register_collector(self, name: str, documentation: str, collect: Callable[[], List[Sample]]):
+        """
+        Add a callback that reports gauge samples at scrape time
+
+        Args:
+            name: Metric family name (namespace is added)
+            documentation: HELP text
+            collect: Returns (metric name suffix, labels, value) samples;
+                an empty suffix reports under the family name itself
+        """
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            self._collectors = [c for c in self._collectors if c[0] != full_name]
+            self._collectors.append((full_name, documentation, collect))
+
+    def register_stats(self, name: str, documentation: str, stats: Callable[[], Dict[str, object]], **labels: str):
+        """
+        Export a component's stats() dictionary as gauges labelled by stat name
+
+        Numeric values are exported. Every series in a family carries the same
+        label names, so one level of nested dictionaries (such as per-endpoint
+        breaker stats) is exported as a separate "<name>_by_key" family with an
+        extra "key" label.
+
+        Args:
+            name: Metric family name, e.g. "translation_cache"
+            documentation: HELP text
+            stats: Zero-argument callable returning the stats dictionary
+            labels: Constant labels added to every sample
+        """
+        def collect() -> List[Sample]:
+            samples = []
+            for stat, value in stats().items():
+                if _is_number(value):
+                    samples.append(("", dict(labels, stat=str(stat)), float(value)))
+            return samples
+
+        def collect_by_key() -> List[Sample]:
+            samples = []
+            for key, value in stats().items():
+                if isinstance(value, dict):
+                    for stat, inner_value in value.items():
+                        if _is_number(inner_value):
+                            samples.append(("", dict(labels, key=str(key), stat=str(stat)), float(inner_value)))
+            return samples
+
+        self.register_collector(name, documentation, collect)
+        self.register_collector(f"{name}_by_key", f"{documentation} (by key)", collect_by_key)
+
+    def render_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+            collectors = list(self._collectors)
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for name, documentation, collect in collectors:
+            try:
+                samples = collect()
+            except Exception:
+                # A failing component must not break the whole scrape
+                continue
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            for suffix, labels, value in samples:
+                names = sorted(labels)
+                label_text = _format_labels(names, [labels[n] for n in names])
+                lines.append(f"{name}{'_' + suffix if suffix else ''}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def instrument_client(client, registry: MetricsRegistry = REGISTRY, service: str = "sarvam"):
+    """
+    Record upstream call metrics through a client's on_request/on_response hooks
+
+    Works with any client exposing on_request/on_response (SarvamClient,
+    WeatherProvider). Records, per endpoint: attempts by status, latency,
+    in-flight attempts and request/response payload sizes.
+
+    Args:
+        client: Client to instrument
+        registry: Registry receiving the metrics
+        service: Value of the "service" label
+    """
+    requests_total = registry.counter(
+        "upstream_requests_total",
+        "Upstream HTTP attempts by endpoint and status (status is 'error' when no response arrived)",
+        ("service", "endpoint", "status")
+    )
+    latency = registry.histogram(
+        "upstream_request_seconds",
+        "Upstream HTTP attempt latency until response headers",
+        ("service", "endpoint")
+    )
+    in_flight = registry.gauge(
+        "upstream_requests_in_flight",
+        "Upstream HTTP attempts currently waiting for a response",
+        ("service", "endpoint")
+    )
+    request_bytes = registry.histogram(
+        "upstream_request_bytes",
+        "Upstream request body size",
+        ("service", "endpoint"),
+        buckets=SIZE_BUCKETS
+    )
+    response_bytes = registry.histogram(
+        "upstream_response_bytes",
+        "Upstream response body size (streamed bodies without Content-Length are not counted)",
+        ("service", "endpoint"),
+        buckets=SIZE_BUCKETS
+    )
+
+    @client.on_request
+    def _on_request(call):
+        in_flight.inc(service=service, endpoint=call["endpoint"])
+        if call["request_bytes"] is not None:
+            request_bytes.observe(call["request_bytes"], service=service, endpoint=call["endpoint"])
+
+    @client.on_response
+    def _on_response(call):
+        endpoint = call["endpoint"]
+        in_flight.dec(service=service, endpoint=endpoint)
+        status = str(call["status"]) if call["status"] is not None else "error"
+        requests_total.inc(service=service, endpoint=endpoint, status=status)
+        latency.observe(call["elapsed"], service=service, endpoint=endpoint)
+        if call["response_bytes"] is not None:
+            response_bytes.observe(call["response_bytes"], service=service, endpoint=endpoint)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: "_MetricsHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    registry: MetricsRegistry
+
+
+class MetricsServer:
+    """Background HTTP server exposing a registry at /metrics"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        """
+        Bind the server (call start() to begin serving)
+
+        Args:
+            registry: Registry to export
+            host: Interface to bind; use 0.0.0.0 to let a remote Prometheus scrape it
+            port: Port to bind (0 picks a free one)
+        """
+        self._server = _MetricsHTTPServer((host, port), _MetricsHandler)
+        self._server.registry = registry
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
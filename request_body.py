@@ -0,0 +1,107 @@
+"""
+Incremental JSON encoding of chat request bodies
+A conversation's messages barely change between turns, so each message is
+encoded once and its bytes are spliced into every later request body
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from json_codec import DEFAULT_CODEC
+
+_BODY_START = b'{"messages":['
+
+
+class ChatBodyEncoder:
+    """
+    Per-conversation cache of encoded message fragments
+
+    Fragments are keyed by (role, content). Strings cache their own hash, so
+    looking up a message seen on the previous turn costs O(1), and only new
+    or edited messages are encoded. The cache keeps exactly the messages of
+    the last request: anything dropped from the window (folded into the
+    summary, trimmed, cleared) is forgotten on the next call, and a changed
+    system message only re-encodes that one fragment.
+    """
+
+    def __init__(self, codec=None):
+        """
+        Args:
+            codec: JSON codec (see json_codec); must match the client's
+        """
+        self.codec = codec if codec is not None else DEFAULT_CODEC
+        self._fragments: Dict[Tuple[str, str], bytes] = {}
+        self._counters = {
+            "bodies": 0,
+            "encoded_messages": 0,
+            "reused_messages": 0,
+            "encoded_bytes": 0,
+            "reused_bytes": 0
+        }
+        self.last_encoded_bytes = 0
+        self.last_reused_bytes = 0
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        """
+        Encode a chat payload, reusing the fragments of unchanged messages
+
+        Args:
+            payload: Payload from build_chat_payload
+
+        Returns:
+            UTF-8 JSON body equivalent to codec.dumps(payload)
+        """
+        previous = self._fragments
+        fragments: Dict[Tuple[str, str], bytes] = {}
+        parts: List[bytes] = []
+        dumps = self.codec.dumps
+        encoded = reused = new_messages = 0
+        for message in payload["messages"]:
+            if len(message) != 2:
+                # Extra fields (e.g. "name") are rare enough not to cache
+                fragment = dumps(message)
+                encoded += len(fragment)
+                new_messages += 1
+                parts.append(fragment)
+                continue
+            key = (message["role"], message["content"])
+            fragment = previous.get(key)
+            if fragment is None:
+                fragment = dumps(message)
+                encoded += len(fragment)
+                new_messages += 1
+            else:
+                reused += len(fragment)
+            fragments[key] = fragment
+            parts.append(fragment)
+        self._fragments = fragments
+        self._counters["encoded_messages"] += new_messages
+        self._counters["reused_messages"] += len(parts) - new_messages
+
+        params = {key: value for key, value in payload.items() if key != "messages"}
+        tail = self.codec.dumps(params)
+        self._counters["bodies"] += 1
+        self._counters["encoded_bytes"] += encoded + len(tail)
+        self._counters["reused_bytes"] += reused
+        self.last_encoded_bytes = encoded + len(tail)
+        self.last_reused_bytes = reused
+
+        # tail is '{...}': drop its brace to continue the object after "messages"
+        closing = b"]," + tail[1:] if len(tail) > 2 else b"]}"
+        if not parts:
+            return _BODY_START + closing
+        # Attach the ends to the first and last fragments so the body is copied only once
+        parts[0] = _BODY_START + parts[0]
+        parts[-1] = parts[-1] + closing
+        return b",".join(parts)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get encoding statistics
+
+        Returns:
+            Dictionary with bodies built, messages encoded vs reused and the
+            corresponding byte counts, plus fragments currently cached
+        """
+        stats = dict(self._counters)
+        stats["cached_fragments"] = len(self._fragments)
+        return stats
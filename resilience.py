@@ -0,0 +1,296 @@
+"""
+Retry, circuit breaker and deadline policies for upstream calls
+Retries safe-to-retry failures with jittered exponential backoff, fails
+fast per endpoint while the upstream is known to be unhealthy, and bounds
+every call of a turn by the time that turn has left
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, List, Optional
+
+import requests
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose breaker is open"""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Sarvam AI {endpoint} service is temporarily unavailable. "
+            f"Please try again in {max(int(retry_in), 1)}s."
+        )
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a call would start, or was cut off, after the turn's deadline"""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        super().__init__(f"Took too long to respond ({stage} ran out of time). Please try again.")
+
+
+class Deadline:
+    """
+    Time budget for one user-facing operation, shared by every call it makes
+
+    Each call asks for its timeout through timeout(), which caps the call's
+    own limit at the time left; optional stages check allows() first and
+    record themselves with degrade() when they are skipped or cut short.
+    """
+
+    MET = "met"
+    DEGRADED = "degraded"
+    EXCEEDED = "exceeded"
+
+    def __init__(self, budget: float):
+        """
+        Start the clock
+
+        Args:
+            budget: Seconds the whole operation may take
+        """
+        self.budget = budget
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget
+        self.degraded: List[str] = []
+        self.exceeded = False
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def allows(self, seconds: float) -> bool:
+        """Check whether at least this many seconds are left"""
+        return self.expires_at - time.monotonic() >= seconds
+
+    def timeout(self, limit: float, stage: str = "call") -> float:
+        """
+        Timeout for the next call
+
+        Args:
+            limit: The call's own timeout
+            stage: Name of the call, used in the error
+
+        Returns:
+            limit, or the time left if that is shorter
+
+        Raises:
+            DeadlineExceeded: No time is left
+        """
+        left = self.expires_at - time.monotonic()
+        if left <= 0:
+            self.exceeded = True
+            raise DeadlineExceeded(stage)
+        return min(limit, left)
+
+    def mark_exceeded(self):
+        """Record that the operation ran out of time, e.g. a stream cut short"""
+        self.exceeded = True
+
+    def degrade(self, stage: str):
+        """Record that an optional stage was skipped or cut short"""
+        if stage not in self.degraded:
+            self.degraded.append(stage)
+
+    def outcome(self) -> str:
+        """
+        Classify the operation once it is over
+
+        Returns:
+            "exceeded" if it ran out of time, "degraded" if it finished in time
+            by skipping optional stages, "met" otherwise
+        """
+        if self.exceeded or self.elapsed() > self.budget:
+            return self.EXCEEDED
+        if self.degraded:
+            return self.DEGRADED
+        return self.MET
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """Which failures to retry and how long to wait between attempts"""
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay: float = 0.25,
+        max_delay: float = 4.0,
+        retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504}),
+        max_retry_after: float = 10.0
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            max_retries: Extra attempts after the first one
+            base_delay: Backoff for the first retry, doubled on each attempt
+            max_delay: Upper bound on the backoff before jitter
+            retry_statuses: HTTP statuses worth retrying
+            max_retry_after: Longest Retry-After we honour; larger values give up
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def is_retryable_exception(self, error: Exception) -> bool:
+        """
+        Only failures where the request cannot have been processed are retried.
+        A read timeout means the server may still be generating an answer, so
+        retrying it would only double the wait.
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.Timeout):
+            return False
+        return isinstance(error, requests.exceptions.ConnectionError)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Delay before the next attempt
+
+        Args:
+            attempt: Number of retries already made (0 for the first retry)
+            retry_after: Retry-After header from the failed response
+
+        Returns:
+            Seconds to sleep, or None when the server asks us to wait longer
+            than max_retry_after
+        """
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            return requested if requested <= self.max_retry_after else None
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        # Full jitter spreads out retries from sessions that failed together
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Per-endpoint breaker: closed -> open after repeated failures -> half-open probe"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialize the breaker
+
+        Args:
+            name: Endpoint name used in errors and metrics
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to stay open before letting a probe through
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._counters = {"opened": 0, "rejected": 0, "successes": 0, "failures": 0}
+
+    def allow(self) -> bool:
+        """Check whether a call may go out now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at >= self.recovery_timeout:
+                    self._state = self.HALF_OPEN
+                else:
+                    self._counters["rejected"] += 1
+                    return False
+            # Half-open: one probe at a time decides whether to close again
+            if self._probe_in_flight:
+                self._counters["rejected"] += 1
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker lets a probe through"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(self.recovery_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def record_success(self):
+        with self._lock:
+            self._counters["successes"] += 1
+            self._failures = 0
+            self._probe_in_flight = False
+            self._state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self._counters["failures"] += 1
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._counters["opened"] += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self):
+        """Let go of a half-open probe slot without judging the endpoint"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get breaker state and counters
+
+        Returns:
+            Dictionary with state, consecutive_failures and opened/rejected/
+            success/failure counts
+        """
+        with self._lock:
+            stats: Dict[str, object] = dict(self._counters)
+            stats["state"] = self._state
+            stats["consecutive_failures"] = self._failures
+        return stats
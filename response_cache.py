@@ -0,0 +1,260 @@
+"""
+Response cache for chat completions
+Exact matches on the normalized request, plus semantic near-duplicate
+matching for standalone questions using hashed character n-gram vectors
+"""
+
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Container, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold and collapse whitespace"""
+    return " ".join(text.split()).casefold()
+
+
+def hashed_ngram_vector(text: str, dim: int = 2048, n: int = 3) -> np.ndarray:
+    """
+    Embed text as an L2-normalized bag of hashed character n-grams
+
+    Args:
+        text: Text to embed (normalized by the caller)
+        dim: Number of hash buckets
+        n: n-gram length
+
+    Returns:
+        float32 vector of length dim
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    padded = f" {text.strip('?!.। ')} "
+    if len(padded) < n:
+        padded = padded.ljust(n)
+    buckets = [zlib.crc32(padded[i:i + n].encode("utf-8")) % dim for i in range(len(padded) - n + 1)]
+    np.add.at(vector, buckets, 1.0)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+class CacheKey:
+    """Lookup keys computed once per request and reused for storing"""
+
+    __slots__ = ("language", "scope", "exact", "vector")
+
+    def __init__(self, language: str, scope: str, exact: str, vector: Optional[np.ndarray]):
+        self.language = language
+        self.scope = scope
+        self.exact = exact
+        self.vector = vector
+
+
+class _SemanticIndex:
+    """Ring of up to capacity vectors searched by cosine similarity, grown as it fills"""
+
+    def __init__(self, capacity: int, dim: int, initial_rows: int = 16):
+        self.capacity = capacity
+        # Most scopes only ever see a handful of questions, so start small
+        self.vectors = np.zeros((min(initial_rows, capacity), dim), dtype=np.float32)
+        self.keys: List[Optional[str]] = []
+        self.size = 0
+        self.next_slot = 0
+
+    def add(self, vector: np.ndarray, exact_key: str):
+        if self.next_slot == len(self.vectors) and len(self.vectors) < self.capacity:
+            rows = min(len(self.vectors) * 2, self.capacity)
+            grown = np.zeros((rows, self.vectors.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.vectors[:self.size]
+            self.vectors = grown
+        self.vectors[self.next_slot] = vector
+        if self.next_slot < len(self.keys):
+            self.keys[self.next_slot] = exact_key
+        else:
+            self.keys.append(exact_key)
+        self.next_slot = (self.next_slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def search(self, vector: np.ndarray, live: Container[str], k: int = 8) -> Tuple[Optional[str], float]:
+        """
+        Find the most similar vector whose entry is still cached
+
+        Args:
+            vector: Query vector
+            live: Exact keys still in the cache; evicted ones are skipped
+            k: Best-scoring candidates checked
+
+        Returns:
+            (exact key, cosine similarity), or (None, 0.0) when no candidate is live
+        """
+        if self.size == 0:
+            return None, 0.0
+        scores = self.vectors[:self.size] @ vector
+        if self.size > k:
+            candidates = np.argpartition(scores, -k)[-k:]
+        else:
+            candidates = np.arange(self.size)
+        for index in candidates[np.argsort(scores[candidates])[::-1]]:
+            key = self.keys[index]
+            if key in live:
+                return key, float(scores[index])
+        return None, 0.0
+
+
+class ResponseCache:
+    """Thread-safe two-tier cache of chat completion texts, partitioned by language"""
+
+    def __init__(
+        self,
+        max_entries_per_language: int = 500,
+        last_n_messages: int = 4,
+        semantic_threshold: float = 0.9,
+        max_temperature: float = 1.0,
+        enable_semantic: bool = True,
+        vector_dim: int = 2048
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries_per_language: Entries kept per language before LRU eviction
+            last_n_messages: Trailing conversation messages that form the exact key
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+            max_temperature: Requests sampled hotter than this bypass the cache
+            enable_semantic: Turn the near-duplicate tier on or off
+            vector_dim: Hash buckets used for semantic vectors
+        """
+        self.max_entries_per_language = max_entries_per_language
+        self.last_n_messages = last_n_messages
+        self.semantic_threshold = semantic_threshold
+        self.max_temperature = max_temperature
+        self.enable_semantic = enable_semantic
+        self.vector_dim = vector_dim
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, "OrderedDict[str, str]"] = {}
+        self._indexes: Dict[Tuple[str, str], _SemanticIndex] = {}
+        self._counters = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "skipped_temperature": 0
+        }
+
+    def make_key(self, payload: Dict[str, Any], language: str) -> Optional[CacheKey]:
+        """
+        Compute cache keys for a chat payload
+
+        Args:
+            payload: Request payload from build_chat_payload
+            language: Conversation language code (partition)
+
+        Returns:
+            CacheKey, or None when the request must not be cached
+        """
+        if payload.get("temperature", 0.0) > self.max_temperature:
+            with self._lock:
+                self._counters["skipped_temperature"] += 1
+            return None
+
+        messages = payload.get("messages", [])
+        system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+        turns = [m for m in messages if m.get("role") != "system"]
+        if not turns or turns[-1].get("role") != "user":
+            return None
+
+        # Scope covers everything besides the conversation that shapes the answer
+        params = {k: v for k, v in payload.items() if k not in ("messages", "stream")}
+        scope = hashlib.sha256(
+            (normalize_text(system) + json.dumps(params, sort_keys=True)).encode("utf-8")
+        ).hexdigest()
+
+        recent = [(m.get("role"), normalize_text(m.get("content", ""))) for m in turns[-self.last_n_messages:]]
+        exact = hashlib.sha256(
+            (scope + json.dumps(recent, ensure_ascii=False)).encode("utf-8")
+        ).hexdigest()
+
+        # Only a question with no earlier turns means the same thing regardless
+        # of what came before, so only those are matched semantically
+        vector = None
+        if self.enable_semantic and len(turns) == 1:
+            vector = hashed_ngram_vector(recent[-1][1], self.vector_dim)
+
+        return CacheKey(language, scope, exact, vector)
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """
+        Look up a cached completion
+
+        Args:
+            key: Keys from make_key
+
+        Returns:
+            Cached message text, or None on a miss
+        """
+        with self._lock:
+            entries = self._entries.get(key.language)
+            if entries is not None:
+                message = entries.get(key.exact)
+                if message is not None:
+                    entries.move_to_end(key.exact)
+                    self._counters["exact_hits"] += 1
+                    return message
+
+                index = self._indexes.get((key.language, key.scope))
+                if key.vector is not None and index is not None:
+                    match, score = index.search(key.vector, entries)
+                    if match is not None and score >= self.semantic_threshold:
+                        entries.move_to_end(match)
+                        self._counters["semantic_hits"] += 1
+                        return entries[match]
+
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: CacheKey, message: str):
+        """
+        Store a completion
+
+        Args:
+            key: Keys from make_key
+            message: Assistant message text
+        """
+        with self._lock:
+            entries = self._entries.setdefault(key.language, OrderedDict())
+            entries[key.exact] = message
+            entries.move_to_end(key.exact)
+            self._counters["stores"] += 1
+            while len(entries) > self.max_entries_per_language:
+                entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+            if key.vector is not None:
+                index = self._indexes.get((key.language, key.scope))
+                if index is None:
+                    index = _SemanticIndex(self.max_entries_per_language, self.vector_dim)
+                    self._indexes[(key.language, key.scope)] = index
+                index.add(key.vector, key.exact)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/miss/store/eviction counters, hit rate and
+            entry counts per language
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            per_language = {language: len(entries) for language, entries in self._entries.items()}
+        lookups = stats["exact_hits"] + stats["semantic_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["exact_hits"] + stats["semantic_hits"]) / lookups if lookups else 0.0
+        stats["entries_by_language"] = per_language
+        return stats
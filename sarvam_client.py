@@ -1,19 +1,357 @@
 import requests
-import json
+import contextvars
+import hashlib
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+from http_transport import PooledTransport
+from translation_cache import TranslationCache
+from response_cache import ResponseCache
+from text_chunker import chunk_for_translation
+from resilience import CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, RetryPolicy
+from single_flight import SingleFlight
+from call_hooks import CallHooks, Hook, response_size
+from json_codec import DEFAULT_CODEC, JSONDecodeError
+from api_results import ApiResult, ChatResult, DetectResult, TranslateResult
+from request_body import ChatBodyEncoder
+
+SARVAM_BASE_URL = "https://api.sarvam.ai/v1"
+TRANSLATE_MODEL = "mayura:v1"
+
+def build_chat_payload(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    top_p: float,
+    max_tokens: Optional[int],
+    stop: Optional[List[str]],
+    frequency_penalty: float,
+    presence_penalty: float,
+    wiki_grounding: bool
+) -> Dict[str, Any]:
+    """Build the JSON payload for a chat completion request"""
+    
+    payload = {
+        "messages": messages,
+        "model": model,
+        "temperature": temperature,
+        "top_p": top_p,
+        "frequency_penalty": frequency_penalty,
+        "presence_penalty": presence_penalty,
+        "wiki_grounding": wiki_grounding
+    }
+    
+    # Add optional parameters
+    if max_tokens is not None:
+        payload["max_tokens"] = max_tokens
+    
+    if stop is not None:
+        payload["stop"] = stop
+    
+    return payload
+
+def build_translate_payload(
+    text: str,
+    source_language: str,
+    target_language: str,
+    speaker_gender: str,
+    mode: str
+) -> Dict[str, Any]:
+    """Build the JSON payload for a translation request"""
+    
+    return {
+        "input": text,
+        "source_language_code": source_language,
+        "target_language_code": target_language,
+        "speaker_gender": speaker_gender,
+        "mode": mode,
+        "model": TRANSLATE_MODEL,
+        "enable_preprocessing": True
+    }
+
+def chat_result_from_data(data: Dict[str, Any], keep_raw: bool = False) -> Dict[str, Any]:
+    """Extract the assistant message from a decoded chat response"""
+    
+    if "choices" in data and len(data["choices"]) > 0:
+        message = data["choices"][0]["message"]["content"]
+        return ChatResult(message, raw_response=data if keep_raw else None)
+    else:
+        return {
+            "success": False,
+            "error": "No response choices found in API response"
+        }
+
+def translate_result_from_data(data: Dict[str, Any], keep_raw: bool = False) -> TranslateResult:
+    """Extract the translated text from a decoded translate response"""
+    
+    return TranslateResult(data.get("translated_text", ""), raw_response=data if keep_raw else None)
+
+def detect_result_from_data(data: Dict[str, Any], keep_raw: bool = False) -> DetectResult:
+    """Extract the language and confidence from a decoded detect-language response"""
+    
+    return DetectResult(
+        data.get("detected_language"),
+        data.get("confidence"),
+        raw_response=data if keep_raw else None
+    )
+
+def chat_error_result(response) -> Dict[str, Any]:
+    """Map a non-200 chat response to an error result"""
+    
+    if response.status_code == 401:
+        return {
+            "success": False,
+            "error": "Invalid API key. Please check your SARVAM_API_KEY environment variable."
+        }
+    
+    elif response.status_code == 429:
+        return {
+            "success": False,
+            "error": "Rate limit exceeded. Please try again later."
+        }
+    
+    elif response.status_code == 500:
+        return {
+            "success": False,
+            "error": "Server error. Please try again later."
+        }
+    
+    else:
+        # Try to get error message from response
+        try:
+            error_data = response.json()
+            error_message = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
+        except:
+            error_message = f"HTTP {response.status_code}"
+        
+        return {
+            "success": False,
+            "error": f"API request failed: {error_message}"
+        }
+
+# A piece of text split for translation: untranslatable text as is, or a
+# chunk being translated as (future, original chunk)
+ChunkPart = Union[str, Tuple[Future, str]]
+
+
+def resolve_chunk(part: ChunkPart) -> Tuple[str, Optional[str]]:
+    """
+    Wait for one chunk part
+
+    Returns:
+        (text, error): the translation and None, or the original chunk and
+        the error when its translation failed
+    """
+    if isinstance(part, str):
+        return part, None
+    future, original = part
+    try:
+        result = future.result()
+    except Exception as e:
+        return original, f"Translation error: {str(e)}"
+    if result["success"]:
+        return result["translated_text"], None
+    return original, result["error"]
+
 
 class SarvamClient:
     """Client for interacting with Sarvam AI API"""
     
-    def __init__(self, api_key: str):
-        """Initialize the Sarvam client with API key"""
+    def __init__(
+        self,
+        api_key: str,
+        transport: Optional[PooledTransport] = None,
+        translation_cache: Optional[TranslationCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        max_translate_workers: int = 4,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        base_url: str = SARVAM_BASE_URL,
+        hooks: Optional[CallHooks] = None,
+        codec=None,
+        keep_raw_response: bool = False
+    ):
+        """
+        Initialize the Sarvam client with API key
+        
+        Args:
+            api_key: Sarvam API subscription key
+            transport: Shared pooled transport (a default one is created if omitted)
+            translation_cache: Cache consulted by translate_text (optional)
+            response_cache: Cache consulted by chat calls that pass cache_language (optional)
+            max_translate_workers: Chunk translations translate_long and streamed
+                replies run at once, across all sessions
+            retry_policy: Retry/backoff policy for safe-to-retry failures
+            circuit_breakers: Breakers keyed by endpoint ("chat", "translate", "detect")
+            base_url: API root, e.g. a local stand-in server for load tests
+            hooks: on_request/on_response callbacks fired around every HTTP attempt
+            codec: JSON codec for bodies and responses (see json_codec; orjson when installed)
+            keep_raw_response: Also return each decoded payload as raw_response, for debugging
+        """
         self.api_key = api_key
-        self.base_url = "https://api.sarvam.ai/v1"
+        self.base_url = base_url.rstrip("/")
         self.headers = {
             "api-subscription-key": api_key,
             "Content-Type": "application/json"
         }
+        self.transport = transport if transport is not None else PooledTransport()
+        self.translation_cache = translation_cache
+        self.response_cache = response_cache
+        # Shared by all sessions, so it also caps total chunk parallelism
+        self.translate_pool = ThreadPoolExecutor(
+            max_workers=max_translate_workers,
+            thread_name_prefix="sarvam-translate"
+        )
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else {
+            endpoint: CircuitBreaker(endpoint) for endpoint in ("chat", "translate", "detect")
+        }
+        self._retry_lock = threading.Lock()
+        self._retries = {endpoint: 0 for endpoint in self.circuit_breakers}
+        # Identical concurrent translate/detect calls from different sessions share one request
+        self._flight = SingleFlight()
+        self.hooks = hooks if hooks is not None else CallHooks()
+        self.codec = codec if codec is not None else DEFAULT_CODEC
+        self.keep_raw_response = keep_raw_response
+    
+    def on_request(self, hook: Hook) -> Hook:
+        """Register a callback fired before every HTTP attempt (see call_hooks.CallHooks)"""
+        return self.hooks.on_request(hook)
+    
+    def on_response(self, hook: Hook) -> Hook:
+        """Register a callback fired after every HTTP attempt (see call_hooks.CallHooks)"""
+        return self.hooks.on_response(hook)
+    
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool statistics for the underlying transport
+        
+        Returns:
+            Dictionary with requests, hits, new_connections and waits
+        """
+        return self.transport.stats()
+    
+    def resilience_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker state and retry counts per endpoint
+        
+        Returns:
+            Dictionary keyed by endpoint with breaker stats plus "retries"
+        """
+        with self._retry_lock:
+            retries = dict(self._retries)
+        stats = {}
+        for endpoint, breaker in self.circuit_breakers.items():
+            stats[endpoint] = breaker.stats()
+            stats[endpoint]["retries"] = retries.get(endpoint, 0)
+        return stats
+    
+    def _send(
+        self,
+        endpoint: str,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: float,
+        stream: bool = False,
+        body: Optional[bytes] = None,
+        deadline: Optional[Deadline] = None
+    ) -> requests.Response:
+        """
+        POST through the endpoint's circuit breaker with retries
+        
+        Retries only what the retry policy deems safe (connection failures
+        and retryable statuses such as 429/5xx), honouring Retry-After.
+        After the last attempt the final response is returned, or the final
+        exception raised, for the caller to map as usual. A pre-encoded body
+        is sent as is instead of encoding the payload. With a deadline, each
+        attempt's timeouts are capped at the time left and a retry that
+        could not finish in time is not made.
+        
+        Raises:
+            CircuitOpenError: The endpoint's breaker is open
+            DeadlineExceeded: The deadline passed before or during an attempt
+        """
+        breaker = self.circuit_breakers[endpoint]
+        policy = self.retry_policy
+        attempt = 0
+        # Encoded once for all attempts; UTF-8 keeps Indic text at its real size
+        if body is None:
+            body = self.codec.dumps(payload)
+        
+        # Retries are attempts of one request as far as the pool stats go
+        with self.transport.logical_request():
+            while True:
+                call = self.hooks.start(endpoint, "POST", url, attempt, stream, len(body))
+                request_timeout: Any = timeout
+                if deadline is not None:
+                    try:
+                        read = deadline.timeout(timeout, endpoint)
+                    except DeadlineExceeded as e:
+                        self.hooks.finish(call, error=e)
+                        raise
+                    # The handshake counts against the deadline too
+                    request_timeout = (min(self.transport.connect_timeout, read), read)
+                if not breaker.allow():
+                    error = CircuitOpenError(endpoint, breaker.retry_in())
+                    self.hooks.finish(call, error=error)
+                    raise error
+            
+                try:
+                    response = self.transport.post(
+                        url,
+                        headers=self.headers,
+                        data=body,
+                        timeout=request_timeout,
+                        stream=stream
+                    )
+                    size = response_size(response, stream)
+                except requests.exceptions.RequestException as e:
+                    self.hooks.finish(call, error=e)
+                    if deadline is not None and deadline.expired and isinstance(e, requests.exceptions.Timeout):
+                        # Our budget ran out, which says nothing about the endpoint's health
+                        breaker.release()
+                        deadline.mark_exceeded()
+                        raise DeadlineExceeded(endpoint) from e
+                    breaker.record_failure()
+                    delay = policy.backoff(attempt) if attempt < policy.max_retries else None
+                    delay = self._within_deadline(delay, deadline)
+                    if delay is None or not policy.is_retryable_exception(e):
+                        raise
+                except BaseException as e:
+                    # Not a verdict on the endpoint (e.g. a bug below us, or an interrupt),
+                    # but a half-open probe slot must not stay taken
+                    self.hooks.finish(call, error=e)
+                    breaker.release()
+                    raise
+                else:
+                    self.hooks.finish(call, response.status_code, size)
+                    if not policy.is_retryable_status(response.status_code):
+                        breaker.record_success()
+                        return response
+                    breaker.record_failure()
+                    delay = None
+                    if attempt < policy.max_retries:
+                        delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                    delay = self._within_deadline(delay, deadline)
+                    if delay is None:
+                        return response
+                    response.close()
+            
+                attempt += 1
+                with self._retry_lock:
+                    self._retries[endpoint] = self._retries.get(endpoint, 0) + 1
+                time.sleep(delay)
+    
+    @staticmethod
+    def _within_deadline(delay: Optional[float], deadline: Optional[Deadline]) -> Optional[float]:
+        """Drop a retry whose backoff alone would use up the deadline"""
+        
+        if delay is None or deadline is None:
+            return delay
+        return delay if deadline.allows(delay) else None
     
     def chat_completion(
         self,
@@ -25,7 +363,10 @@ class SarvamClient:
         stop: Optional[List[str]] = None,
         frequency_penalty: float = 0.0,
         presence_penalty: float = 0.0,
-        wiki_grounding: bool = False
+        wiki_grounding: bool = False,
+        cache_language: Optional[str] = None,
+        body_encoder: Optional[ChatBodyEncoder] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Get chat completion from Sarvam AI
@@ -40,6 +381,12 @@ class SarvamClient:
             frequency_penalty: Penalize repetition (-2.0 to 2.0)
             presence_penalty: Encourage new topics (-2.0 to 2.0)
             wiki_grounding: Enable RAG with Wikipedia
+            cache_language: Language partition for the response cache; the
+                cache is only consulted when this is given
+            body_encoder: The conversation's ChatBodyEncoder, so messages already
+                sent on earlier turns are not encoded again (optional)
+            deadline: The turn's Deadline; caps the request and its retries
+                at the time left (optional)
         
         Returns:
             Dictionary with success status and response/error message
@@ -47,111 +394,200 @@ class SarvamClient:
         
         url = f"{self.base_url}/chat/completions"
         
-        # Prepare the payload
-        payload = {
-            "messages": messages,
-            "model": model,
-            "temperature": temperature,
-            "top_p": top_p,
-            "frequency_penalty": frequency_penalty,
-            "presence_penalty": presence_penalty,
-            "wiki_grounding": wiki_grounding
-        }
-        
-        # Add optional parameters
-        if max_tokens is not None:
-            payload["max_tokens"] = max_tokens
+        payload = build_chat_payload(
+            messages, model, temperature, top_p, max_tokens, stop,
+            frequency_penalty, presence_penalty, wiki_grounding
+        )
         
-        if stop is not None:
-            payload["stop"] = stop
+        cache_key = self._response_cache_key(payload, cache_language)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return ChatResult(cached, cached=True)
         
         try:
             # Make the API request
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
+            body = body_encoder.encode(payload) if body_encoder is not None else None
+            response = self._send("chat", url, payload, timeout=30, body=body, deadline=deadline)
             
             # Check if request was successful
             if response.status_code == 200:
-                data = response.json()
-                
-                # Extract the message from the response
-                if "choices" in data and len(data["choices"]) > 0:
-                    message = data["choices"][0]["message"]["content"]
-                    return {
-                        "success": True,
-                        "message": message,
-                        "raw_response": data
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": "No response choices found in API response"
-                    }
+                result = chat_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
+                if cache_key is not None and result["success"] and result["message"]:
+                    self.response_cache.put(cache_key, result["message"])
+                return result
             
-            elif response.status_code == 401:
-                return {
-                    "success": False,
-                    "error": "Invalid API key. Please check your SARVAM_API_KEY environment variable."
-                }
-            
-            elif response.status_code == 429:
+            return chat_error_result(response)
+                
+        except Exception as e:
+            return self._chat_exception_result(e)
+    
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "sarvam-m",
+        temperature: float = 0.8,
+        top_p: float = 0.9,
+        max_tokens: Optional[int] = None,
+        stop: Optional[List[str]] = None,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        wiki_grounding: bool = False,
+        cache_language: Optional[str] = None,
+        body_encoder: Optional[ChatBodyEncoder] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a streaming chat completion from Sarvam AI
+        
+        Takes the same arguments as chat_completion. The HTTP status is
+        checked before returning, so upstream errors come back in the usual
+        result shape; on success the "stream" entry is a generator of text
+        deltas read from the server-sent events as they arrive. A deadline
+        bounds the wait for the response and for each later read; the caller
+        checks it between deltas to stop early.
+        
+        Returns:
+            Dictionary with success status and stream/error message
+        """
+        
+        url = f"{self.base_url}/chat/completions"
+        
+        payload = build_chat_payload(
+            messages, model, temperature, top_p, max_tokens, stop,
+            frequency_penalty, presence_penalty, wiki_grounding
+        )
+        payload["stream"] = True
+        
+        cache_key = self._response_cache_key(payload, cache_language)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
                 return {
-                    "success": False,
-                    "error": "Rate limit exceeded. Please try again later."
+                    "success": True,
+                    "stream": iter([cached]),
+                    "cached": True
                 }
+        
+        try:
+            body = body_encoder.encode(payload) if body_encoder is not None else None
+            response = self._send(
+                "chat", url, payload, timeout=30, stream=True, body=body, deadline=deadline
+            )
             
-            elif response.status_code == 500:
+            if response.status_code == 200:
+                stream = self._iter_chat_deltas(response)
+                if cache_key is not None:
+                    stream = self._cache_completed_stream(stream, cache_key)
                 return {
-                    "success": False,
-                    "error": "Server error. Please try again later."
+                    "success": True,
+                    "stream": stream
                 }
             
-            else:
-                # Try to get error message from response
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
-                except:
-                    error_message = f"HTTP {response.status_code}"
+            try:
+                return chat_error_result(response)
+            finally:
+                response.close()
                 
-                return {
-                    "success": False,
-                    "error": f"API request failed: {error_message}"
-                }
-                
-        except requests.exceptions.Timeout:
+        except Exception as e:
+            return self._chat_exception_result(e)
+    
+    def _response_cache_key(self, payload: Dict[str, Any], cache_language: Optional[str]):
+        """Compute response cache keys, or None when caching does not apply"""
+        
+        if self.response_cache is None or cache_language is None:
+            return None
+        return self.response_cache.make_key(payload, cache_language)
+    
+    def _cache_completed_stream(self, stream: Iterator[str], cache_key) -> Iterator[str]:
+        """Pass deltas through and cache the full text once the stream completes"""
+        
+        chunks = []
+        for delta in stream:
+            chunks.append(delta)
+            yield delta
+        message = "".join(chunks)
+        if message:
+            self.response_cache.put(cache_key, message)
+    
+    def _iter_chat_deltas(self, response) -> Iterator[str]:
+        """
+        Yield content deltas from a streaming chat response
+        
+        Args:
+            response: Streaming requests Response with status 200
+            
+        Yields:
+            Text fragments in arrival order
+        """
+        
+        try:
+            # Servers that ignore "stream" send the whole completion at once
+            if "application/json" in response.headers.get("Content-Type", ""):
+                data = self.codec.loads(response.content)
+                if data.get("choices"):
+                    content = data["choices"][0]["message"]["content"]
+                    if content:
+                        yield content
+                return
+            
+            # Lines stay bytes: the codec decodes the UTF-8 JSON directly, which
+            # also sidesteps requests guessing ISO-8859-1 for text/event-stream
+            for line in response.iter_lines():
+                if not line or not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                chunk = self.codec.loads(data)
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                delta = choices[0].get("delta") or {}
+                content = delta.get("content")
+                if content:
+                    yield content
+        finally:
+            # Hand the connection back to the pool even if the caller stops early
+            response.close()
+    
+    def _chat_exception_result(self, e: Exception) -> Dict[str, Any]:
+        """Map an exception raised during a chat request to an error result"""
+        
+        if isinstance(e, (CircuitOpenError, DeadlineExceeded)):
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        
+        elif isinstance(e, requests.exceptions.Timeout):
             return {
                 "success": False,
                 "error": "Request timed out. Please check your internet connection and try again."
             }
         
-        except requests.exceptions.ConnectionError:
+        elif isinstance(e, requests.exceptions.ConnectionError):
             return {
                 "success": False,
                 "error": "Connection error. Please check your internet connection."
             }
         
-        except requests.exceptions.RequestException as e:
+        elif isinstance(e, requests.exceptions.RequestException):
             return {
                 "success": False,
                 "error": f"Request error: {str(e)}"
             }
         
-        except json.JSONDecodeError:
+        elif isinstance(e, JSONDecodeError):
             return {
                 "success": False,
                 "error": "Invalid JSON response from API"
             }
         
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Unexpected error: {str(e)}"
-            }
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }
     
     def translate_text(
         self,
@@ -159,7 +595,9 @@ class SarvamClient:
         source_language: str = "en-IN",
         target_language: str = "hi-IN",
         speaker_gender: str = "Male",
-        mode: str = "formal"
+        mode: str = "formal",
+        bypass_cache: bool = False,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Translate text using Sarvam AI translation API
@@ -170,84 +608,204 @@ class SarvamClient:
             target_language: Target language code (BCP-47 format)
             speaker_gender: Male or Female
             mode: formal or informal
+            bypass_cache: Skip the translation cache for this call
+            deadline: The turn's Deadline (optional); cached translations are
+                still returned once it has passed
         
         Returns:
             Dictionary with success status and translated text or error
         """
         
-        url = f"{self.base_url}/translate"
+        request_key = TranslationCache.make_key(
+            text, source_language, target_language, speaker_gender, mode, TRANSLATE_MODEL
+        )
         
-        payload = {
-            "input": text,
-            "source_language_code": source_language,
-            "target_language_code": target_language,
-            "speaker_gender": speaker_gender,
-            "mode": mode,
-            "model": "mayura:v1",
-            "enable_preprocessing": True
-        }
+        cache_key = None
+        if self.translation_cache is not None:
+            if bypass_cache:
+                self.translation_cache.record_bypass()
+            else:
+                cache_key = request_key
+                cached = self.translation_cache.get(cache_key)
+                if cached is not None:
+                    return TranslateResult(cached, cached=True)
+        
+        payload = build_translate_payload(
+            text, source_language, target_language, speaker_gender, mode
+        )
+        
+        return self._coalesced(
+            ("translate", request_key),
+            lambda: self._request_translation(payload, cache_key, deadline),
+            deadline
+        )
+    
+    def _request_translation(
+        self,
+        payload: Dict[str, Any],
+        cache_key: Optional[str],
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """Send a translation request and store the result in the cache"""
+        
+        url = f"{self.base_url}/translate"
         
         try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=15
-            )
+            response = self._send("translate", url, payload, timeout=15, deadline=deadline)
             
             if response.status_code == 200:
-                data = response.json()
-                translated_text = data.get("translated_text", "")
-                return {
-                    "success": True,
-                    "translated_text": translated_text,
-                    "raw_response": data
-                }
+                result = translate_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
+                if cache_key is not None and result.translated_text:
+                    self.translation_cache.put(cache_key, result.translated_text)
+                return result
             else:
                 return {
                     "success": False,
                     "error": f"Translation failed: HTTP {response.status_code}"
                 }
                 
+        except DeadlineExceeded as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Translation error: {str(e)}"
             }
     
-    def detect_language(self, text: str) -> Dict[str, Any]:
+    def submit_translation(
+        self,
+        text: str,
+        source_language: str = "en-IN",
+        target_language: str = "hi-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        max_chunk_chars: int = 900,
+        deadline: Optional[Deadline] = None,
+        executor: Optional[Executor] = None
+    ) -> List[ChunkPart]:
+        """
+        Split text for translation and start translating its chunks
+        
+        The text is split at markdown block and sentence boundaries; code
+        blocks, inline code and URLs are left untranslated.
+        
+        Args:
+            text: Text to translate
+            source_language: Source language code (BCP-47 format)
+            target_language: Target language code (BCP-47 format)
+            speaker_gender: Male or Female
+            mode: formal or informal
+            max_chunk_chars: Soft size limit for a single translation request
+            deadline: The turn's Deadline, shared by all chunk requests (optional)
+            executor: Where chunks are translated (defaults to translate_pool)
+        
+        Returns:
+            The text's parts in order, to be read with resolve_chunk
+        """
+        
+        executor = executor if executor is not None else self.translate_pool
+        parts: List[ChunkPart] = []
+        for chunk, translatable in chunk_for_translation(text, max_chunk_chars):
+            if not translatable:
+                parts.append(chunk)
+                continue
+            # Run in the caller's context so traced calls nest under the current span
+            future = executor.submit(
+                contextvars.copy_context().run,
+                self.translate_text,
+                chunk, source_language, target_language, speaker_gender, mode,
+                deadline=deadline
+            )
+            parts.append((future, chunk))
+        return parts
+    
+    def translate_long(
+        self,
+        text: str,
+        source_language: str = "en-IN",
+        target_language: str = "hi-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        max_chunk_chars: int = 900,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate long text in parallel chunks
+        
+        Chunks from submit_translation are translated concurrently and
+        reassembled in order. A chunk whose translation fails keeps its
+        original text.
+        
+        Args:
+            text: Text to translate
+            source_language: Source language code (BCP-47 format)
+            target_language: Target language code (BCP-47 format)
+            speaker_gender: Male or Female
+            mode: formal or informal
+            max_chunk_chars: Soft size limit for a single translation request
+            deadline: The turn's Deadline, shared by all chunk requests (optional)
+        
+        Returns:
+            Dictionary with success status and translated text or error, plus
+            chunk and failed_chunks counts
+        """
+        
+        parts = self.submit_translation(
+            text, source_language, target_language, speaker_gender, mode, max_chunk_chars, deadline
+        )
+        translated = []
+        errors = []
+        for part in parts:
+            chunk_text, error = resolve_chunk(part)
+            translated.append(chunk_text)
+            if error is not None:
+                errors.append(error)
+        
+        chunks = sum(1 for part in parts if not isinstance(part, str))
+        if chunks and len(errors) == chunks:
+            return {
+                "success": False,
+                "error": errors[0]
+            }
+        
+        return TranslateResult("".join(translated), chunks=chunks, failed_chunks=len(errors))
+    
+    def detect_language(self, text: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Detect the language of given text
         
         Args:
             text: Text to analyze
+            deadline: The turn's Deadline (optional)
             
         Returns:
             Dictionary with success status and detected language or error
         """
         
-        url = f"{self.base_url}/detect-language"
-        
         payload = {
             "input": text
         }
         
+        request_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return self._coalesced(
+            ("detect", request_key),
+            lambda: self._request_detection(payload, deadline),
+            deadline
+        )
+    
+    def _request_detection(self, payload: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Send a language detection request"""
+        
+        url = f"{self.base_url}/detect-language"
+        
         try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=payload,
-                timeout=10
-            )
+            response = self._send("detect", url, payload, timeout=10, deadline=deadline)
             
             if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "detected_language": data.get("detected_language"),
-                    "confidence": data.get("confidence"),
-                    "raw_response": data
-                }
+                return detect_result_from_data(self.codec.loads(response.content), self.keep_raw_response)
             else:
                 return {
                     "success": False,
@@ -260,6 +818,39 @@ class SarvamClient:
                 "error": f"Language detection error: {str(e)}"
             }
     
+    def _coalesced(self, key, request, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Run an idempotent request once for all concurrent identical callers
+        
+        Args:
+            key: Identity of the request (endpoint plus a digest of its input)
+            request: Zero-argument callable returning a result dictionary
+            deadline: The caller's Deadline (optional); a caller joining another
+                caller's request waits no longer than its own time left
+        
+        Returns:
+            The result; callers that shared another caller's request get a copy
+            of an error dict (typed results are read-only and shared as is)
+        """
+        try:
+            result, shared = self._flight.do(
+                key, request, timeout=deadline.remaining() if deadline is not None else None
+            )
+        except TimeoutError:
+            deadline.mark_exceeded()
+            return {"success": False, "error": str(DeadlineExceeded(key[0]))}
+        return dict(result) if shared and not isinstance(result, ApiResult) else result
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get request coalescing statistics for translate/detect calls
+        
+        Returns:
+            Dictionary with issued (upstream calls), coalesced (callers served
+            by another caller's call) and in_flight counts
+        """
+        return self._flight.stats()
+    
     def test_connection(self) -> Dict[str, Any]:
         """
         Test the connection to Sarvam AI API
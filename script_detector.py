@@ -0,0 +1,178 @@
+"""
+Table-driven Unicode script detection
+Classifies every character in one pass against precomputed script ranges
+and reports a per-script histogram, dominant language and confidence
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# (first codepoint, last codepoint, script, language code)
+SCRIPT_RANGES = (
+    (0x0041, 0x005A, "Latin", "en-IN"),
+    (0x0061, 0x007A, "Latin", "en-IN"),
+    (0x00C0, 0x024F, "Latin", "en-IN"),
+    # The danda and double danda (U+0964/U+0965) are shared by every Indic
+    # script, so they are punctuation here rather than Devanagari
+    (0x0900, 0x0963, "Devanagari", "hi-IN"),
+    (0x0966, 0x097F, "Devanagari", "hi-IN"),
+    (0x0980, 0x09FF, "Bengali", "bn-IN"),
+    (0x0A00, 0x0A7F, "Gurmukhi", "pa-IN"),
+    (0x0A80, 0x0AFF, "Gujarati", "gu-IN"),
+    (0x0B00, 0x0B7F, "Odia", "or-IN"),
+    (0x0B80, 0x0BFF, "Tamil", "ta-IN"),
+    (0x0C00, 0x0C7F, "Telugu", "te-IN"),
+    (0x0C80, 0x0CFF, "Kannada", "kn-IN"),
+    (0x0D00, 0x0D7F, "Malayalam", "ml-IN"),
+)
+
+SCRIPTS = tuple(dict.fromkeys(script for _, _, script, _ in SCRIPT_RANGES))
+SCRIPT_LANGUAGES = {script: language for _, _, script, language in SCRIPT_RANGES}
+INDIC_SCRIPTS = frozenset(SCRIPTS) - {"Latin"}
+# Script each supported language is written in; Marathi shares Devanagari with Hindi
+LANGUAGE_SCRIPTS = {language: script for script, language in SCRIPT_LANGUAGES.items()}
+LANGUAGE_SCRIPTS["mr-IN"] = "Devanagari"
+
+# Flattened boundaries: bisect_right(_BOUNDS, cp) gives a slot whose entry in
+# _SLOT_SCRIPT is the script index, or -1 between ranges
+_BOUNDS: List[int] = []
+_SLOT_SCRIPT: List[int] = [-1]
+for _first, _last, _script, _ in SCRIPT_RANGES:
+    _BOUNDS.extend((_first, _last + 1))
+    _SLOT_SCRIPT.extend((SCRIPTS.index(_script), -1))
+_NP_BOUNDS = np.array(_BOUNDS, dtype=np.uint32)
+_NP_SLOT_SCRIPT = np.array(_SLOT_SCRIPT, dtype=np.int64)
+
+# Beyond this length the NumPy path over a UTF-32 view is faster
+NUMPY_THRESHOLD = 256
+
+
+class ScriptDetection:
+    """Result of classifying one text"""
+
+    __slots__ = ("histogram", "language", "script", "confidence", "mixed")
+
+    def __init__(self, counts: Sequence[int], mixed_share: float):
+        self.histogram: Dict[str, int] = {
+            script: int(count) for script, count in zip(SCRIPTS, counts) if count
+        }
+        total = sum(self.histogram.values())
+        if total:
+            self.script: Optional[str] = max(self.histogram, key=self.histogram.get)
+            self.language = SCRIPT_LANGUAGES[self.script]
+            self.confidence = self.histogram[self.script] / total
+            self.mixed = sum(1 for count in self.histogram.values() if count / total >= mixed_share) > 1
+        else:
+            self.script = None
+            self.language = "en-IN"
+            self.confidence = 0.0
+            self.mixed = False
+
+    def share(self, script: str) -> float:
+        """Fraction of the classified characters written in a script"""
+        total = sum(self.histogram.values())
+        return self.histogram.get(script, 0) / total if total else 0.0
+
+    def dominant_indic_language(self) -> Optional[str]:
+        """Language of the most frequent Indic script, if any is present"""
+        indic = {script: count for script, count in self.histogram.items() if script in INDIC_SCRIPTS}
+        if not indic:
+            return None
+        return SCRIPT_LANGUAGES[max(indic, key=indic.get)]
+
+    def __repr__(self) -> str:
+        return (
+            f"ScriptDetection(language={self.language!r}, confidence={self.confidence:.2f}, "
+            f"mixed={self.mixed}, histogram={self.histogram})"
+        )
+
+
+def _count_python(text: str) -> List[int]:
+    counts = [0] * (len(SCRIPTS) + 1)
+    bounds = _BOUNDS
+    slots = _SLOT_SCRIPT
+    for char in text:
+        # Index -1 (not a tracked script) lands in the spare last bucket
+        counts[slots[bisect_right(bounds, ord(char))]] += 1
+    return counts[:-1]
+
+
+def _codepoints(text: str) -> np.ndarray:
+    # Lone surrogates (e.g. from a split emoji) encode as themselves, keeping
+    # one codepoint per character; they fall outside every script range
+    return np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+
+
+def _count_numpy(text: str) -> List[int]:
+    script_ids = _NP_SLOT_SCRIPT[np.searchsorted(_NP_BOUNDS, _codepoints(text), side="right")]
+    return np.bincount(script_ids[script_ids >= 0], minlength=len(SCRIPTS)).tolist()
+
+
+class ScriptDetector:
+    """Single-pass script classifier with a batch API"""
+
+    def __init__(self, mixed_share: float = 0.15, numpy_threshold: int = NUMPY_THRESHOLD):
+        """
+        Initialize the detector
+
+        Args:
+            mixed_share: Minimum share a second script needs for the text to count as mixed
+            numpy_threshold: Text length from which the vectorized path is used
+        """
+        self.mixed_share = mixed_share
+        self.numpy_threshold = numpy_threshold
+
+    def detect(self, text: str) -> ScriptDetection:
+        """
+        Classify the scripts used in a text
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            ScriptDetection with histogram, dominant language, confidence and mixed flag
+        """
+        if len(text) >= self.numpy_threshold:
+            counts = _count_numpy(text)
+        else:
+            counts = _count_python(text)
+        return ScriptDetection(counts, self.mixed_share)
+
+    def is_written_in(self, text: str, language: str, min_share: float = 0.5) -> bool:
+        """
+        Check whether a text is mostly in a language's script
+
+        Args:
+            text: Text to analyze
+            language: Language code, e.g. "hi-IN"
+            min_share: Fraction of the classified characters that must be in that script
+
+        Returns:
+            True if at least min_share of the letters are in the language's script
+        """
+        script = LANGUAGE_SCRIPTS.get(language)
+        return script is not None and self.detect(text).share(script) >= min_share
+
+    def detect_many(self, texts: Sequence[str]) -> List[ScriptDetection]:
+        """
+        Classify many texts with one vectorized pass over all of them
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            One ScriptDetection per text, in order
+        """
+        if not texts:
+            return []
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+        script_ids = _NP_SLOT_SCRIPT[
+            np.searchsorted(_NP_BOUNDS, _codepoints("".join(texts)), side="right")
+        ]
+        owners = np.repeat(np.arange(len(texts)), lengths)
+        tracked = script_ids >= 0
+        flat = owners[tracked] * len(SCRIPTS) + script_ids[tracked]
+        table = np.bincount(flat, minlength=len(texts) * len(SCRIPTS)).reshape(len(texts), len(SCRIPTS))
+        return [ScriptDetection(row.tolist(), self.mixed_share) for row in table]
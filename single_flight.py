@@ -0,0 +1,94 @@
+"""
+Single-flight call coalescing
+Concurrent callers asking for the same key share one execution and its result
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """One in-flight execution that other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe duplicate call suppression keyed by an arbitrary hashable"""
+
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._issued = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """
+        Run fn for key, or wait for an identical call already running
+
+        Args:
+            key: Identity of the call
+            fn: Zero-argument callable performing the work
+            timeout: Longest a waiting caller waits for the running call
+                (None waits until it finishes; the caller running fn is not limited)
+
+        Returns:
+            Tuple of (result, shared) where shared is True when the result
+            came from another caller's execution. Exceptions raised by fn are
+            re-raised in every waiting caller.
+
+        Raises:
+            TimeoutError: A waiting caller gave up before the running call finished
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._issued += 1
+                leader = True
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Gave up waiting for an identical call after {timeout:.1f}s")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call for key is currently running"""
+        with self._lock:
+            return key in self._calls
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dictionary with issued (executions), coalesced (callers that
+            shared another execution) and in_flight counts
+        """
+        with self._lock:
+            return {
+                "issued": self._issued,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls)
+            }
@@ -0,0 +1,248 @@
+"""
+Bounded background executor for upstream calls
+One process-wide worker pool runs chat turns and other slow upstream work
+as futures; each session holds a handle through which a newer request
+cancels or supersedes its pending one
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorFullError(RuntimeError):
+    """Raised by submit when every worker is busy and the queue is full"""
+
+
+class CancelToken:
+    """Cooperative cancellation flag checked by running tasks"""
+
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class Task:
+    """A submitted unit of work: its future, cancel token and timing"""
+
+    __slots__ = ("name", "future", "token", "submitted", "started", "finished", "superseded")
+
+    def __init__(self, name: str, future: Future, token: CancelToken):
+        self.name = name
+        self.future = future
+        self.token = token
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.superseded = False
+
+    def cancel(self) -> bool:
+        """
+        Cancel the task: a queued task never starts, a running one sees its token set
+
+        Returns:
+            True if the task had not started yet
+        """
+        self.token.cancel()
+        return self.future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the task was submitted"""
+        return time.monotonic() - self.submitted
+
+    @property
+    def queue_seconds(self) -> Optional[float]:
+        if self.started is None:
+            return None
+        return self.started - self.submitted
+
+    @property
+    def run_seconds(self) -> Optional[float]:
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class TaskExecutor:
+    """Fixed pool of worker threads with a bounded queue and per-task cancellation"""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_queue: int = 32,
+        on_finish: Optional[Callable[[Task], None]] = None
+    ):
+        """
+        Start the pool
+
+        Args:
+            max_workers: Tasks run at once
+            max_queue: Tasks waiting for a worker before submit raises ExecutorFullError
+            on_finish: Called with each task once it finished, failed or was
+                cancelled (e.g. to observe queue and run time histograms)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.on_finish = on_finish
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="upstream")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._live: Dict[int, Task] = {}
+        self._counters = {
+            "submitted": 0, "completed": 0, "failed": 0, "cancelled": 0, "superseded": 0, "rejected": 0
+        }
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Task:
+        """
+        Run fn(token, *args, **kwargs) on a worker
+
+        The function runs in a copy of the caller's context, so traced calls
+        nest under the caller's current span; it should check token.cancelled
+        between steps and return early once it is set.
+
+        Args:
+            name: Task name used in stats
+            fn: Callable taking a CancelToken first
+
+        Returns:
+            The submitted task
+
+        Raises:
+            ExecutorFullError: max_workers + max_queue tasks are already pending
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._counters["rejected"] += 1
+            raise ExecutorFullError(f"Too many pending upstream calls ({self.max_workers + self.max_queue})")
+
+        token = CancelToken()
+        task = Task(name, Future(), token)
+        context = contextvars.copy_context()
+
+        def run():
+            task.started = time.monotonic()
+            if token.cancelled:
+                raise CancelledError()
+            return context.run(fn, token, *args, **kwargs)
+
+        with self._lock:
+            self._counters["submitted"] += 1
+            self._live[id(task)] = task
+        try:
+            task.future = self._pool.submit(run)
+        except RuntimeError:
+            # Pool shut down
+            self._finish(task)
+            raise
+        task.future.add_done_callback(lambda _: self._finish(task))
+        return task
+
+    def _finish(self, task: Task):
+        task.finished = time.monotonic()
+        future = task.future
+        with self._lock:
+            if self._live.pop(id(task), None) is None:
+                return
+            if task.superseded:
+                self._counters["superseded"] += 1
+            elif future.cancelled() or task.token.cancelled:
+                self._counters["cancelled"] += 1
+            elif future.done() and future.exception() is not None:
+                self._counters["failed"] += 1
+            else:
+                self._counters["completed"] += 1
+        self._slots.release()
+        if self.on_finish is not None:
+            try:
+                self.on_finish(task)
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with task counters, queued and running tasks, and the
+            age in seconds of the oldest queued and oldest running task
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats: Dict[str, float] = dict(self._counters)
+            live = list(self._live.values())
+        queued = [now - task.submitted for task in live if task.started is None]
+        running = [now - task.started for task in live if task.started is not None]
+        stats["queued"] = len(queued)
+        stats["running"] = len(running)
+        stats["oldest_queued_seconds"] = round(max(queued, default=0.0), 3)
+        stats["oldest_running_seconds"] = round(max(running, default=0.0), 3)
+        return stats
+
+    def shutdown(self, cancel_pending: bool = True):
+        self._pool.shutdown(wait=False, cancel_futures=cancel_pending)
+
+
+class SessionTasks:
+    """A session's handle on the executor: at most one pending task per kind"""
+
+    def __init__(self, executor: TaskExecutor):
+        self.executor = executor
+        self._tasks: Dict[str, Task] = {}
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Task:
+        """
+        Submit a task, superseding the session's pending task of the same kind
+
+        Returns:
+            The new task
+
+        Raises:
+            ExecutorFullError: The shared executor is saturated
+        """
+        previous = self._tasks.pop(kind, None)
+        if previous is not None and not previous.done():
+            previous.superseded = True
+            previous.cancel()
+        task = self.executor.submit(kind, fn, *args, **kwargs)
+        self._tasks[kind] = task
+        return task
+
+    def current(self, kind: str) -> Optional[Task]:
+        """The latest task of this kind that has not been taken yet"""
+        return self._tasks.get(kind)
+
+    def take(self, kind: str) -> Optional[Task]:
+        """Remove and return the task of this kind once it is done, so its result is delivered once"""
+        task = self._tasks.get(kind)
+        if task is None or not task.done():
+            return None
+        return self._tasks.pop(kind)
+
+    def cancel(self, kind: Optional[str] = None):
+        """Cancel the pending task of one kind, or all of the session's tasks"""
+        kinds = [kind] if kind is not None else list(self._tasks)
+        for name in kinds:
+            task = self._tasks.pop(name, None)
+            if task is not None:
+                task.cancel()
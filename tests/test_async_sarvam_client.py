@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from async_sarvam_client import AsyncSarvamClient, gather_bounded
+from loadtest.stand_in import EndpointProfile, StandInConfig, StandInServer
+from resilience import CircuitBreaker, RetryPolicy
+
+
+def run(client, coro):
+    async def main():
+        async with client:
+            return await coro
+
+    return asyncio.run(main())
+
+
+def test_retries_failed_attempts_and_fires_hooks():
+    config = StandInConfig(profiles={"translate": EndpointProfile(error_rate=1.0)})
+    with StandInServer(config) as server:
+        client = AsyncSarvamClient("key", base_url=server.base_url, retry_policy=RetryPolicy(base_delay=0.01))
+        attempts = []
+        client.on_response(lambda call: attempts.append((call["endpoint"], call["status"])))
+        result = run(client, client.translate_text("Hello"))
+    assert not result["success"]
+    assert attempts == [("translate", 500)] * 3
+    assert client.resilience_stats()["translate"]["retries"] == 2
+
+
+def test_open_breaker_rejects_without_sending():
+    breakers = {name: CircuitBreaker(name, failure_threshold=1) for name in ("chat", "translate", "detect")}
+    breakers["chat"].record_failure()
+    with StandInServer() as server:
+        client = AsyncSarvamClient("key", base_url=server.base_url, circuit_breakers=breakers)
+        attempts = []
+        client.on_response(lambda call: attempts.append(call["error"]))
+        results = run(client, gather_bounded([
+            client.chat_completion([{"role": "user", "content": "Hi"}]),
+            client.detect_language("नमस्ते")
+        ]))
+    assert not results[0]["success"] and "temporarily unavailable" in results[0]["error"]
+    assert results[1]["success"]
+    assert attempts[0] is not None and attempts[1] is None
+    assert breakers["chat"].stats()["rejected"] == 1
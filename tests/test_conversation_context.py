@@ -0,0 +1,54 @@
+from conversation_context import ConversationContext
+
+SYSTEM = {"role": "system", "content": "You are Mufasa."}
+
+
+def test_window_starts_on_user_turn_past_budget():
+    context = ConversationContext(budget_tokens=300)
+    history = []
+    for turn in range(20):
+        history.append({"role": "user", "content": f"Question {turn}: " + "tell me more " * 10})
+        payload = context.build(SYSTEM, history)
+        assert payload[0]["role"] == "system"
+        assert payload[1]["role"] == "user", [m["role"] for m in payload]
+        history.append({"role": "assistant", "content": f"Answer {turn}: " + "here is more " * 10})
+
+
+def test_roles_alternate_after_folding():
+    context = ConversationContext(budget_tokens=300, keep_recent=6)
+    history = []
+    for turn in range(12):
+        history.append({"role": "user", "content": "question " * 15})
+        history.append({"role": "assistant", "content": "answer " * 15})
+    history.append({"role": "user", "content": "last question"})
+    roles = [m["role"] for m in context.build(SYSTEM, history)[1:]]
+    assert roles[0] == "user"
+    assert all(a != b for a, b in zip(roles, roles[1:]))
+    assert context.stats()["folded_messages"] > 0
+
+
+def test_cancelled_turn_leaves_roles_alternating():
+    context = ConversationContext(budget_tokens=3000)
+    history = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi, I am Mufasa."}
+    ]
+    payload = context.build(SYSTEM, history, pending={"role": "user", "content": "Tell me a story"})
+    assert [m["role"] for m in payload] == ["system", "user", "assistant", "user"]
+    # The turn was accepted, then cancelled before its reply arrived
+    history.append({"role": "user", "content": "Tell me a story"})
+    payload = context.build(SYSTEM, history, pending={"role": "user", "content": "A short one, please"})
+    assert [m["role"] for m in payload] == ["system", "user", "assistant", "user"]
+    assert payload[-1]["content"] == "Tell me a story\n\nA short one, please"
+
+
+def test_under_budget_history_opening_with_reply_is_not_folded():
+    context = ConversationContext(budget_tokens=3000)
+    history = [
+        {"role": "assistant", "content": "**Weather in Pune**\n- Condition: Sunny"},
+        {"role": "user", "content": "Should I carry an umbrella?"}
+    ]
+    payload = context.build(SYSTEM, history)
+    assert payload == [SYSTEM, history[1]]
+    stats = context.stats()
+    assert stats["folded_messages"] == 0 and stats["verbatim_messages"] == 2
@@ -0,0 +1,43 @@
+from conversation_store import ConversationHistory, ConversationStore
+
+
+def test_restore_sees_messages_still_queued(tmp_path):
+    # A long flush interval keeps the rows in the writer's queue
+    store = ConversationStore(str(tmp_path / "chats.sqlite3"), flush_interval=30)
+    try:
+        history = ConversationHistory(store)
+        history.append("user", "Hello")
+        history.append("assistant", "Hi there")
+        restored = ConversationHistory.restore(store, history.conversation_id)
+        assert [message.content for message in restored.messages] == ["Hello", "Hi there"]
+    finally:
+        store.close()
+
+
+def test_two_tabs_on_one_conversation_keep_every_message(tmp_path):
+    store = ConversationStore(str(tmp_path / "chats.sqlite3"), flush_interval=0.01)
+    try:
+        first = ConversationHistory(store)
+        first.append("user", "Hello")
+        second = ConversationHistory.restore(store, first.conversation_id)
+        first.append("user", "From the first tab")
+        second.append("user", "From the second tab")
+        assert store.flush()
+        rows = store.load(first.conversation_id)
+        assert [row[2] for row in rows] == ["Hello", "From the first tab", "From the second tab"]
+        assert [row[0] for row in rows] == [0, 1, 2]
+        assert store.stats()["seq_conflicts"] == 1
+    finally:
+        store.close()
+
+
+def test_unknown_or_malformed_ids_are_not_adopted(tmp_path):
+    store = ConversationStore(str(tmp_path / "chats.sqlite3"))
+    try:
+        planted = "a" * 32
+        assert ConversationHistory.restore(store, planted).conversation_id != planted
+        assert ConversationHistory.restore(store, "1").conversation_id != "1"
+        fresh = ConversationHistory.restore(store, "")
+        assert len(fresh.conversation_id) == 32 and not fresh.messages
+    finally:
+        store.close()
@@ -0,0 +1,30 @@
+from metrics import MetricsRegistry
+
+
+def label_names(line):
+    labels = line[line.index("{") + 1:line.index("}")]
+    return sorted(part.split("=")[0] for part in labels.split(","))
+
+
+def test_nested_stats_get_their_own_family():
+    registry = MetricsRegistry()
+    registry.register_stats("cache", "Cache counters", lambda: {
+        "hits": 3,
+        "hit_rate": 0.5,
+        "state": "closed",
+        "entries_by_language": {"hi-IN": 2, "ta-IN": 1}
+    })
+    lines = registry.render_prometheus().splitlines()
+    families = {}
+    for line in lines:
+        if not line.startswith("#"):
+            families.setdefault(line.split("{")[0], set()).add(tuple(label_names(line)))
+    assert all(len(label_sets) == 1 for label_sets in families.values())
+    assert any(line.endswith('_cache_by_key{key="entries_by_language",stat="hi-IN"} 2') for line in lines)
+    assert any(line.endswith('_cache{stat="hits"} 3') for line in lines)
+
+
+def test_family_without_samples_is_omitted():
+    registry = MetricsRegistry()
+    registry.register_stats("flat", "Flat counters", lambda: {"hits": 1})
+    assert "flat_by_key" not in registry.render_prometheus()
@@ -0,0 +1,25 @@
+from response_cache import ResponseCache
+
+
+def payload(question):
+    return {"messages": [{"role": "user", "content": question}], "model": "sarvam-m", "temperature": 0.2}
+
+
+def test_semantic_hit_skips_evicted_best_match():
+    cache = ResponseCache(max_entries_per_language=2, semantic_threshold=0.8)
+    # Stored first, so evicted first, yet the closest to the lookup below
+    cache.put(cache.make_key(payload("When does the monsoon reach Mumbai"), "en-IN"), "early June")
+    cache.put(cache.make_key(payload("When does the monsoon reach Mumbai city"), "en-IN"), "in June")
+    cache.put(cache.make_key(payload("What is the capital of India"), "en-IN"), "New Delhi")
+    assert cache.get(cache.make_key(payload("when does the monsoon reach mumbai?"), "en-IN")) == "in June"
+
+
+def test_semantic_index_grows_with_entries():
+    cache = ResponseCache(max_entries_per_language=500)
+    cache.put(cache.make_key(payload("Hello"), "en-IN"), "Hi")
+    index = next(iter(cache._indexes.values()))
+    assert len(index.vectors) < 500
+    for n in range(40):
+        cache.put(cache.make_key(payload(f"Question number {n}"), "en-IN"), str(n))
+    assert index.size == 41 and len(index.vectors) >= 41
+    assert cache.get(cache.make_key(payload("Question number 7"), "en-IN")) == "7"
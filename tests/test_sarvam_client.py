@@ -0,0 +1,84 @@
+import hashlib
+import threading
+import time
+
+import pytest
+
+from http_transport import PooledTransport
+from loadtest.stand_in import EndpointProfile, StandInConfig, StandInServer
+from resilience import CircuitBreaker, Deadline, RetryPolicy
+from sarvam_client import SarvamClient
+
+
+class BrokenTransport(PooledTransport):
+    def post(self, url, **kwargs):
+        raise ValueError("adapter bug")
+
+
+def test_unexpected_error_frees_half_open_probe():
+    breaker = CircuitBreaker("chat", failure_threshold=1, recovery_timeout=0)
+    client = SarvamClient("key", transport=BrokenTransport(), circuit_breakers={"chat": breaker})
+    breaker.record_failure()
+    with pytest.raises(ValueError):
+        client._send("chat", "http://127.0.0.1:9/chat", {}, timeout=1)
+    # The next call is let through as a probe instead of being rejected for good
+    assert breaker.allow()
+
+
+class UpperClient(SarvamClient):
+    """Translates by upper-casing, failing any chunk that mentions 'fail'"""
+
+    def translate_text(self, text, source_language="en-IN", target_language="hi-IN",
+                       speaker_gender="Male", mode="formal", bypass_cache=False, deadline=None):
+        if "fail" in text:
+            return {"success": False, "error": "Translation failed: HTTP 500"}
+        return {"success": True, "translated_text": text.upper()}
+
+
+def test_translate_long_splits_translates_and_rejoins_in_order():
+    client = UpperClient("key")
+    sentences = [f"Sentence number {n} is here." for n in range(40)]
+    text = " ".join(sentences) + "\n\n```\ncode stays\n```\n\nThis one will fail."
+    result = client.translate_long(text, max_chunk_chars=100)
+    assert result["success"]
+    assert result["chunks"] > 2 and result["failed_chunks"] == 1
+    expected = " ".join(s.upper() for s in sentences) + "\n\n```\ncode stays\n```\n\nThis one will fail."
+    assert result["translated_text"] == expected
+
+
+def test_translate_long_fails_when_every_chunk_fails():
+    result = UpperClient("key").translate_long("This will fail.")
+    assert not result["success"] and result["error"] == "Translation failed: HTTP 500"
+
+
+class SlowClient(SarvamClient):
+    def _request_detection(self, payload, deadline=None):
+        time.sleep(1.0)
+        return {"success": True, "language_code": "hi-IN"}
+
+
+def test_coalesced_follower_gives_up_at_its_deadline():
+    client = SlowClient("key")
+    leader = threading.Thread(target=client.detect_language, args=("नमस्ते",))
+    leader.start()
+    while not client._flight.in_flight(("detect", hashlib.sha256("नमस्ते".encode("utf-8")).hexdigest())):
+        time.sleep(0.01)
+    deadline = Deadline(0.1)
+    started = time.monotonic()
+    result = client.detect_language("नमस्ते", deadline)
+    assert time.monotonic() - started < 0.5
+    assert not result["success"] and deadline.exceeded
+    leader.join()
+
+
+def test_pool_stats_count_each_logical_request_once():
+    config = StandInConfig(profiles={"translate": EndpointProfile(error_rate=1.0)})
+    with StandInServer(config) as server:
+        client = SarvamClient("key", base_url=server.base_url, retry_policy=RetryPolicy(base_delay=0.01))
+        client.detect_language("नमस्ते")
+        client.detect_language("hello")
+        # Three attempts, one request
+        client.translate_text("Hello")
+        stats = client.pool_stats()
+    assert stats["requests"] == 3 and stats["checkouts"] == 5
+    assert stats["new_connections"] == 1 and stats["hits"] == 2
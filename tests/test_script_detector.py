@@ -0,0 +1,9 @@
+from script_detector import ScriptDetector
+
+
+def test_lone_surrogates_never_raise():
+    detector = ScriptDetector(numpy_threshold=1)
+    text = "नमस्ते \ud83d दुनिया"
+    assert detector.detect(text).language == ScriptDetector(numpy_threshold=10**6).detect(text).language
+    results = detector.detect_many(["\udc00abc", text, "hello"])
+    assert [r.language for r in results] == ["en-IN", "hi-IN", "en-IN"]
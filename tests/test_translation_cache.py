@@ -0,0 +1,49 @@
+import threading
+
+from translation_cache import TranslationCache
+
+
+def test_batched_writes_survive_a_restart(tmp_path):
+    path = str(tmp_path / "translations.sqlite3")
+    cache = TranslationCache(db_path=path, flush_interval=30)
+    try:
+        for n in range(10):
+            cache.put(f"key{n}", f"value{n}")
+        # Still queued, but served from memory meanwhile
+        assert cache.get("key3") == "value3"
+    finally:
+        cache.close()
+
+    reopened = TranslationCache(db_path=path)
+    try:
+        assert [reopened.get(f"key{n}") for n in range(10)] == [f"value{n}" for n in range(10)]
+        assert reopened.stats()["disk_hits"] == 10
+    finally:
+        reopened.close()
+
+
+def test_memory_hit_does_not_wait_for_a_disk_read(tmp_path):
+    cache = TranslationCache(db_path=str(tmp_path / "translations.sqlite3"))
+    try:
+        cache.put("hot", "value")
+        reading = threading.Event()
+        release = threading.Event()
+
+        def slow_read():
+            reading.set()
+            release.wait(5)
+            return 0
+
+        def miss():
+            # Park this thread's disk read inside SQLite
+            cache._reader().set_progress_handler(slow_read, 1)
+            cache.get("cold")
+
+        thread = threading.Thread(target=miss)
+        thread.start()
+        assert reading.wait(5)
+        assert cache.get("hot") == "value"
+        release.set()
+        thread.join()
+    finally:
+        cache.close()
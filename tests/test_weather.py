@@ -0,0 +1,94 @@
+import threading
+import time
+
+from resilience import Deadline
+from weather import WeatherProvider
+
+
+class SlowProvider(WeatherProvider):
+    def __init__(self, delay):
+        super().__init__("key", base_url="http://127.0.0.1:9")
+        self.delay = delay
+
+    def _fetch(self, key, city, deadline=None):
+        time.sleep(self.delay)
+        report = f"Weather in {city}"
+        with self._lock:
+            self._reports[key] = (report, time.monotonic())
+        return {"success": True, "report": report, "cached": False, "stale": False}
+
+
+def test_follower_gives_up_at_its_deadline():
+    provider = SlowProvider(delay=1.0)
+    leader = threading.Thread(target=provider.get_weather, args=("Pune",))
+    leader.start()
+    while not provider._flight.in_flight("pune"):
+        time.sleep(0.01)
+    deadline = Deadline(0.1)
+    started = time.monotonic()
+    result = provider.get_weather("pune", deadline)
+    assert time.monotonic() - started < 0.5
+    assert not result["success"] and deadline.exceeded
+    leader.join()
+
+
+def test_report_past_ttl_is_flagged_stale_with_age():
+    provider = SlowProvider(delay=0)
+    provider.get_weather("Pune")
+    report, fetched_at = provider._reports["pune"]
+    provider._reports["pune"] = (report, fetched_at - provider.ttl_seconds - 60)
+    result = provider.get_weather("Pune")
+    assert result["stale"] and result["age_seconds"] >= provider.ttl_seconds + 60
+
+
+class FlakyProvider(WeatherProvider):
+    """Fails every fetch of a city named 'Nowhere', through the real _fetch path"""
+
+    def __init__(self, **kwargs):
+        super().__init__("key", base_url="http://127.0.0.1:9", **kwargs)
+        self.calls = []
+        self.transport.get = self._get
+
+    def _get(self, url, params=None, timeout=None):
+        self.calls.append(params["q"])
+        if params["q"] == "Nowhere":
+            raise ConnectionError("refused")
+        return FakeResponse(params["q"])
+
+
+class FakeResponse:
+    status_code = 200
+    content = b""
+
+    def __init__(self, city):
+        self.city = city
+
+    def json(self):
+        return {
+            "location": {"name": self.city, "region": "", "country": ""},
+            "current": {"temp_c": 30, "feelslike_c": 32, "condition": {"text": "Sunny"},
+                        "humidity": 40, "wind_kph": 5}
+        }
+
+
+def test_failed_lookup_is_negative_cached_briefly():
+    provider = FlakyProvider(negative_ttl_seconds=30)
+    first = provider.get_weather("Nowhere")
+    second = provider.get_weather("Nowhere")
+    assert not first["success"] and second["error"] == first["error"]
+    assert provider.calls == ["Nowhere"]
+    assert provider.stats()["negative_hits"] == 1
+
+    provider.negative_ttl_seconds = 0
+    provider.get_weather("Nowhere")
+    assert provider.calls == ["Nowhere", "Nowhere"]
+
+
+def test_least_recently_used_city_is_evicted_at_capacity():
+    provider = FlakyProvider(max_cities=2)
+    provider.get_weather("Pune")
+    provider.get_weather("Delhi")
+    provider.get_weather("Pune")
+    provider.get_weather("Goa")
+    assert list(provider._reports) == ["pune", "goa"]
+    assert provider.stats()["evictions"] == 1
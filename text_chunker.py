@@ -0,0 +1,148 @@
+"""
+Text chunking for translation
+Splits markdown at block and sentence boundaries and marks spans that must
+stay untranslated (code blocks, inline code, URLs)
+"""
+
+import re
+from typing import List, Tuple
+
+# Sentence ends: Latin punctuation plus the Devanagari danda and double danda
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?।॥])\s+")
+
+_FENCED_CODE = re.compile(r"^(```|~~~)")
+_PROTECTED_INLINE = re.compile(r"(`[^`\n]+`|https?://\S+|www\.\S+)")
+_BLOCK_PREFIX = re.compile(r"^(\s*(?:#{1,6}\s+|[-*+]\s+|\d+[.)]\s+|>\s*)?)")
+
+
+def split_blocks(text: str) -> List[Tuple[str, bool]]:
+    """
+    Split markdown into blocks
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of (block, translatable) in order; fenced code blocks are not
+        translatable. Joining the blocks with newlines restores the text.
+    """
+    blocks: List[Tuple[str, bool]] = []
+    lines = text.split("\n")
+    in_code = False
+    code_lines: List[str] = []
+
+    for line in lines:
+        if _FENCED_CODE.match(line.strip()):
+            if in_code:
+                code_lines.append(line)
+                blocks.append(("\n".join(code_lines), False))
+                code_lines = []
+                in_code = False
+            else:
+                in_code = True
+                code_lines = [line]
+            continue
+        if in_code:
+            code_lines.append(line)
+        else:
+            blocks.append((line, bool(line.strip())))
+
+    if code_lines:
+        # Unterminated fence: keep it verbatim
+        blocks.append(("\n".join(code_lines), False))
+    return blocks
+
+
+def split_sentences(text: str, max_chars: int) -> List[str]:
+    """
+    Group sentences into pieces no longer than max_chars where possible
+
+    A single sentence longer than max_chars is split at whitespace.
+    """
+    pieces: List[str] = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_protected(text: str) -> List[Tuple[str, bool]]:
+    """
+    Split a line into translatable text and protected spans
+
+    Returns:
+        List of (segment, translatable); inline code and URLs are protected
+    """
+    segments: List[Tuple[str, bool]] = []
+    position = 0
+    for match in _PROTECTED_INLINE.finditer(text):
+        if match.start() > position:
+            segments.append((text[position:match.start()], True))
+        segments.append((match.group(0), False))
+        position = match.end()
+    if position < len(text):
+        segments.append((text[position:], True))
+    return segments
+
+
+def chunk_for_translation(text: str, max_chars: int = 900) -> List[Tuple[str, bool]]:
+    """
+    Split text into ordered chunks for translation
+
+    Markdown list/heading/quote prefixes, fenced code, inline code and URLs
+    become non-translatable chunks; prose is grouped by sentence up to
+    max_chars. Concatenating every chunk reproduces the original text,
+    except that runs of whitespace between sentences become one space.
+
+    Args:
+        text: Text to split
+        max_chars: Soft upper bound on a translatable chunk
+
+    Returns:
+        List of (chunk, translatable) in order
+    """
+    chunks: List[Tuple[str, bool]] = []
+    blocks = split_blocks(text)
+    for index, (block, translatable) in enumerate(blocks):
+        if index > 0:
+            chunks.append(("\n", False))
+        if not translatable:
+            chunks.append((block, False))
+            continue
+
+        prefix = _BLOCK_PREFIX.match(block).group(1)
+        if prefix:
+            chunks.append((prefix, False))
+        for segment, segment_translatable in split_protected(block[len(prefix):]):
+            if not segment_translatable or not segment.strip():
+                chunks.append((segment, False))
+                continue
+            # Keep surrounding whitespace out of the request so spacing survives
+            stripped = segment.strip()
+            leading = segment[:len(segment) - len(segment.lstrip())]
+            trailing = segment[len(segment.rstrip()):]
+            if leading:
+                chunks.append((leading, False))
+            pieces = split_sentences(stripped, max_chars)
+            for piece_index, piece in enumerate(pieces):
+                if piece_index > 0:
+                    chunks.append((" ", False))
+                chunks.append((piece, True))
+            if trailing:
+                chunks.append((trailing, False))
+    return chunks
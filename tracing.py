@@ -0,0 +1,447 @@
+"""
+Lightweight span tracing for chat turns
+One trace per turn with nested spans for each stage and for every upstream
+HTTP attempt, head-based sampling, and exporters for a local JSONL file, an
+OTLP/HTTP JSON collector and an in-memory store used by the sidebar waterfall
+"""
+
+import contextvars
+import json
+import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from http_transport import PooledTransport
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+# Marker for "use the current span as parent"
+_CURRENT = object()
+
+
+class Span:
+    """One timed operation; unsampled spans only carry IDs for their children"""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns",
+        "attributes", "status", "status_message", "sampled", "_tracer"
+    )
+
+    def __init__(
+        self,
+        tracer: Optional["Tracer"],
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status = "unset"
+        self.status_message: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        if self.sampled:
+            self.attributes[key] = value
+
+    def set_error(self, error: Any):
+        """Mark the span failed with an exception or message"""
+        self.status = "error"
+        self.status_message = str(error)
+
+    def end(self):
+        """Finish the span (later calls are ignored)"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.status == "unset":
+            self.status = "ok"
+        if self.sampled and self._tracer is not None:
+            self._tracer._on_end(self)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes
+        }
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, trace={self.trace_id[:8]}, {self.duration_ms:.1f}ms, {self.status})"
+
+
+class Tracer:
+    """Creates spans, tracks the current one per thread/context and hands finished traces to exporters"""
+
+    def __init__(self, sample_rate: float = 1.0, exporters: Optional[List[Any]] = None, max_open_traces: int = 256):
+        """
+        Initialize the tracer
+
+        Args:
+            sample_rate: Share of new traces that are recorded (0 disables tracing)
+            exporters: Objects with export(spans) receiving each finished trace
+            max_open_traces: Unfinished traces kept before the oldest are dropped
+        """
+        self.sample_rate = sample_rate
+        self.exporters = list(exporters or [])
+        self.max_open_traces = max_open_traces
+        self._lock = threading.Lock()
+        # trace_id -> finished spans waiting for their root to end
+        self._open: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._counters = {"traces": 0, "sampled": 0, "spans": 0, "dropped": 0, "export_errors": 0}
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(self, name: str, parent: Any = _CURRENT, **attributes: Any) -> Span:
+        """
+        Start a span without making it current
+
+        Args:
+            name: Span name
+            parent: Parent span; defaults to the current span, None starts a new trace
+            attributes: Initial attributes
+
+        Returns:
+            The started span; call end() when done
+        """
+        if parent is _CURRENT:
+            parent = _current_span.get()
+        if parent is not None:
+            return Span(self, name, parent.trace_id, parent.span_id, parent.sampled, attributes)
+
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        trace_id = f"{random.getrandbits(128):032x}"
+        with self._lock:
+            self._counters["traces"] += 1
+            if sampled:
+                self._counters["sampled"] += 1
+                self._open[trace_id] = []
+                while len(self._open) > self.max_open_traces:
+                    _, dropped = self._open.popitem(last=False)
+                    self._counters["dropped"] += len(dropped)
+        return Span(self, name, trace_id, None, sampled, attributes)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Run a block inside a span that is current for its duration
+
+        Starts a new trace when there is no current span. Exceptions mark
+        the span as failed and propagate.
+        """
+        span = self.start_span(name, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            # Streamlit's rerun/stop signals are control flow, not failures
+            if isinstance(e, Exception) and type(e).__name__ not in ("RerunException", "StopException"):
+                span.set_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    @contextmanager
+    def use_span(self, span: Span) -> Iterator[Span]:
+        """Make an already started span current for a block without ending it"""
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Like span() but always starts a new trace, e.g. one per chat turn"""
+        token = _current_span.set(None)
+        try:
+            with self.span(name, **attributes) as root:
+                yield root
+        finally:
+            _current_span.reset(token)
+
+    def _on_end(self, span: Span):
+        with self._lock:
+            self._counters["spans"] += 1
+            if span.parent_id is None:
+                spans = self._open.pop(span.trace_id, [])
+                spans.append(span)
+            elif span.trace_id in self._open:
+                self._open[span.trace_id].append(span)
+                return
+            else:
+                # Outlived its trace (e.g. a background call); export on its own
+                spans = [span]
+        self._export(spans)
+
+    def _export(self, spans: List[Span]):
+        spans.sort(key=lambda s: s.start_ns)
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception:
+                with self._lock:
+                    self._counters["export_errors"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get tracing counters
+
+        Returns:
+            Dictionary with traces started, sampled, spans finished, spans
+            dropped from abandoned traces, export errors and open traces
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["open_traces"] = len(self._open)
+        return stats
+
+    def shutdown(self):
+        for exporter in self.exporters:
+            shutdown = getattr(exporter, "shutdown", None)
+            if shutdown is not None:
+                shutdown()
+
+
+def trace_client(client, tracer: Tracer):
+    """
+    Record a span for every HTTP attempt a client makes inside a traced block
+
+    Uses the client's on_request/on_response hooks, so it works with
+    SarvamClient and WeatherProvider. Calls made outside any trace (such
+    as background refreshes) are not recorded.
+
+    Args:
+        client: Client to trace
+        tracer: Tracer owning the spans
+    """
+    @client.on_request
+    def _on_request(call):
+        parent = tracer.current_span()
+        if parent is None or not parent.sampled:
+            return
+        call["span"] = tracer.start_span(
+            f"{call['method']} {call['endpoint']}",
+            parent=parent,
+            **{"http.url": call["url"], "http.attempt": call["attempt"], "http.request_bytes": call["request_bytes"]}
+        )
+
+    @client.on_response
+    def _on_response(call):
+        span = call.get("span")
+        if span is None:
+            return
+        span.set_attribute("http.status_code", call["status"])
+        span.set_attribute("http.response_bytes", call["response_bytes"])
+        if call["error"] is not None:
+            span.set_error(call["error"])
+        elif call["status"] is not None and call["status"] >= 400:
+            span.set_error(f"HTTP {call['status']}")
+        span.end()
+
+
+def waterfall_rows(spans: List[Span]) -> List[Dict[str, Any]]:
+    """
+    Lay out a trace for a timing waterfall
+
+    Args:
+        spans: Finished spans of one trace
+
+    Returns:
+        Rows in depth-first order with name, depth, offset_ms (from the
+        trace start), duration_ms and status
+    """
+    if not spans:
+        return []
+    start = min(span.start_ns for span in spans)
+    children: Dict[Optional[str], List[Span]] = {}
+    ids = {span.span_id for span in spans}
+    for span in spans:
+        # Spans whose parent is missing (dropped or unfinished) hang off the top level
+        parent = span.parent_id if span.parent_id in ids else None
+        children.setdefault(parent, []).append(span)
+
+    rows = []
+
+    def visit(parent_id: Optional[str], depth: int):
+        for span in sorted(children.get(parent_id, []), key=lambda s: s.start_ns):
+            rows.append({
+                "name": span.name,
+                "depth": depth,
+                "offset_ms": round((span.start_ns - start) / 1e6, 3),
+                "duration_ms": round(span.duration_ms, 3),
+                "status": span.status
+            })
+            visit(span.span_id, depth + 1)
+
+    visit(None, 0)
+    return rows
+
+
+class RecentTraces:
+    """In-memory exporter keeping the last few traces for display"""
+
+    def __init__(self, max_traces: int = 200):
+        self.max_traces = max_traces
+        self._lock = threading.Lock()
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+
+    def export(self, spans: List[Span]):
+        trace_id = spans[0].trace_id
+        with self._lock:
+            self._traces.setdefault(trace_id, []).extend(spans)
+            self._traces.move_to_end(trace_id)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get(self, trace_id: str) -> List[Span]:
+        with self._lock:
+            return list(self._traces.get(trace_id, []))
+
+
+class JsonlExporter:
+    """Appends one JSON object per span to a local file"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n" for span in spans)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """Encode spans as an OTLP/HTTP JSON ExportTraceServiceRequest"""
+    status_codes = {"unset": 0, "ok": 1, "error": 2}
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": "mufasa.tracing"},
+                "spans": [
+                    {
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent_id or "",
+                        "name": span.name,
+                        "kind": 3 if span.name.startswith(("POST ", "GET ")) else 1,
+                        "startTimeUnixNano": str(span.start_ns),
+                        "endTimeUnixNano": str(span.end_ns),
+                        "attributes": [
+                            {"key": key, "value": _otlp_value(value)}
+                            for key, value in span.attributes.items()
+                            if value is not None
+                        ],
+                        "status": {"code": status_codes[span.status], "message": span.status_message or ""}
+                    }
+                    for span in spans
+                ]
+            }]
+        }]
+    }
+
+
+class OtlpHttpExporter:
+    """Ships traces as OTLP/HTTP JSON to a collector from a background thread"""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "mufasa-ai",
+        max_queue: int = 1000,
+        timeout: float = 2.0
+    ):
+        """
+        Initialize the exporter
+
+        Args:
+            endpoint: Collector URL, e.g. http://localhost:4318/v1/traces
+            service_name: service.name resource attribute
+            max_queue: Traces buffered before new ones are dropped
+            timeout: Read timeout for each export request
+        """
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self.transport = PooledTransport(pool_maxsize=1, connect_timeout=1.0, read_timeout=timeout)
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue(maxsize=max_queue)
+        self._counters = {"exported": 0, "dropped": 0, "failed": 0}
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, spans: List[Span]):
+        # Never block a chat turn on the collector
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self._counters["dropped"] += len(spans)
+
+    def _run(self):
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                response = self.transport.post(
+                    self.endpoint,
+                    json=otlp_payload(spans, self.service_name),
+                    timeout=self.timeout
+                )
+                response.close()
+                self._counters["exported" if response.status_code < 300 else "failed"] += len(spans)
+            except Exception:
+                self._counters["failed"] += len(spans)
+
+    def stats(self) -> Dict[str, int]:
+        stats = dict(self._counters)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    def shutdown(self, timeout: float = 5.0):
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self.transport.close()
+
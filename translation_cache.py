@@ -0,0 +1,306 @@
+"""
+Two-level cache for translation results
+In-process LRU bounded by bytes, backed by an optional SQLite (WAL) file that
+survives restarts; disk reads run outside the cache lock on per-thread
+connections and writes are committed in batches by a background thread
+"""
+
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Queued disk operations: ("put", key, value, created_at, expires_at),
+# ("delete", key, expires_at) or ("clear",)
+Op = Tuple
+
+
+class TranslationCache:
+    """Thread-safe memory + SQLite cache for translated text"""
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 4 * 1024 * 1024,
+        ttl_seconds: float = 7 * 24 * 3600,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 50000,
+        batch_size: int = 64,
+        flush_interval: float = 0.5
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_memory_bytes: Approximate byte budget for the in-process tier
+            ttl_seconds: Lifetime of an entry in both tiers
+            db_path: SQLite file for the persistent tier (None keeps memory only)
+            max_disk_entries: Oldest rows are pruned beyond this count
+            batch_size: Disk writes committed per transaction at most
+            flush_interval: Longest a disk write waits before being committed
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._writes_since_prune = 0
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "bypassed": 0
+        }
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._readers = threading.local()
+        self._queue: "queue.Queue[Optional[Op]]" = queue.Queue()
+        self._flushed = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._thread: Optional[threading.Thread] = None
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Only the writer thread uses this connection once it has started
+            self._db = self._connect()
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM translations WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+            self._thread = threading.Thread(target=self._run, name="translation-cache-writer", daemon=True)
+            self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        # Readers never block the writer (or each other) in WAL mode
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _reader(self) -> sqlite3.Connection:
+        db = getattr(self._readers, "db", None)
+        if db is None:
+            db = self._readers.db = self._connect()
+        return db
+
+    @staticmethod
+    def make_key(
+        text: str,
+        source_language: str,
+        target_language: str,
+        speaker_gender: str,
+        mode: str,
+        model: str
+    ) -> str:
+        """
+        Build the cache key for a translation request
+
+        The text is hashed so long replies do not bloat the key space.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return "|".join((digest, source_language, target_language, speaker_gender, mode, model))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a translation
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Translated text, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at, size = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._memory_bytes -= size
+                self._counters["expirations"] += 1
+            if self._db is None:
+                self._counters["misses"] += 1
+                return None
+
+        # Outside the lock, so memory hits never wait for the disk
+        try:
+            row = self._reader().execute(
+                "SELECT value, expires_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+
+        with self._lock:
+            if row is not None:
+                value, expires_at = row
+                if expires_at > now:
+                    self._counters["disk_hits"] += 1
+                    self._store_memory(key, value, expires_at)
+                    return value
+                self._counters["expirations"] += 1
+            self._counters["misses"] += 1
+        if row is not None:
+            # Only if nothing newer was written for the key meanwhile
+            self._enqueue(("delete", key, row[1]))
+        return None
+
+    def put(self, key: str, value: str):
+        """
+        Store a translation in both tiers
+
+        Args:
+            key: Key from make_key
+            value: Translated text
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._store_memory(key, value, expires_at)
+        if self._db is not None:
+            self._enqueue(("put", key, value, now, expires_at))
+
+    def _enqueue(self, op: Op):
+        with self._flushed:
+            self._enqueued += 1
+        self._queue.put(op)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every disk write queued so far is committed
+
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        with self._flushed:
+            target = self._enqueued
+            return self._flushed.wait_for(lambda: self._written >= target, timeout)
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    op = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if op is None:
+                    stop = True
+                    break
+                batch.append(op)
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch: List[Op]):
+        try:
+            with self._db:
+                for op in batch:
+                    if op[0] == "put":
+                        self._db.execute(
+                            "INSERT OR REPLACE INTO translations (key, value, created_at, expires_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            op[1:]
+                        )
+                        self._writes_since_prune += 1
+                    elif op[0] == "delete":
+                        self._db.execute(
+                            "DELETE FROM translations WHERE key = ? AND expires_at <= ?", op[1:]
+                        )
+                    else:
+                        self._db.execute("DELETE FROM translations")
+                if self._writes_since_prune >= 500:
+                    self._prune_disk(time.time())
+        except sqlite3.Error:
+            # A lost write only costs a later miss
+            pass
+        with self._flushed:
+            self._written += len(batch)
+            self._flushed.notify_all()
+
+    def record_bypass(self):
+        """Count a lookup that skipped the cache on purpose"""
+        with self._lock:
+            self._counters["bypassed"] += 1
+
+    def _store_memory(self, key: str, value: str, expires_at: float):
+        # Caller holds the lock
+        size = len(key) + len(value.encode("utf-8"))
+        if size > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[2]
+        self._memory[key] = (value, expires_at, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (_, _, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self._counters["evictions"] += 1
+
+    def _prune_disk(self, now: float):
+        # Writer thread only
+        self._writes_since_prune = 0
+        self._db.execute("DELETE FROM translations WHERE expires_at <= ?", (now,))
+        self._db.execute(
+            "DELETE FROM translations WHERE key IN ("
+            "SELECT key FROM translations ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and memory usage
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+        return stats
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self._db is not None:
+            self._enqueue(("clear",))
+            self.flush()
+
+    def close(self, timeout: float = 5.0):
+        """Commit every queued disk write and stop the writer"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        self._db.close()
@@ -0,0 +1,159 @@
+"""
+Pipelined translation of a streaming chat reply
+Cuts the reply at sentence boundaries as it arrives and translates each
+finished sentence while the model is still generating the rest
+"""
+
+import re
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from resilience import Deadline
+from sarvam_client import ChunkPart, resolve_chunk
+
+# A sentence end followed by whitespace, or a line break
+_CUT_POINT = re.compile(r"(?<=[.!?।॥])\s+|\n")
+
+
+class StreamingTranslator:
+    """Feeds streamed text to the translation API one sentence at a time"""
+
+    def __init__(
+        self,
+        client,
+        source_language: str = "en-IN",
+        target_language: str = "hi-IN",
+        speaker_gender: str = "Male",
+        mode: str = "formal",
+        executor: Optional[Executor] = None,
+        max_chunk_chars: int = 900,
+        deadline: Optional[Deadline] = None
+    ):
+        """
+        Initialize the pipeline
+
+        Args:
+            client: SarvamClient whose submit_translation splits and translates the text
+            source_language: Language of the streamed text
+            target_language: Language to translate into
+            speaker_gender: Male or Female
+            mode: formal or informal
+            executor: Where translations run (defaults to the client's translate pool)
+            max_chunk_chars: Soft size limit for a single translation request
+            deadline: The turn's Deadline, passed to every chunk request (optional)
+        """
+        self.client = client
+        self.source_language = source_language
+        self.target_language = target_language
+        self.speaker_gender = speaker_gender
+        self.mode = mode
+        self.executor = executor if executor is not None else client.translate_pool
+        self.max_chunk_chars = max_chunk_chars
+        self.deadline = deadline
+
+        self._buffer = ""
+        self._original: List[str] = []
+        self._parts: List[ChunkPart] = []
+
+    def feed(self, delta: str):
+        """
+        Add streamed text and dispatch every sentence it completes
+
+        Args:
+            delta: Next fragment of the reply
+        """
+        self._original.append(delta)
+        self._buffer += delta
+
+        cut = self._last_cut_point(self._buffer)
+        if cut > 0:
+            self._dispatch(self._buffer[:cut])
+            self._buffer = self._buffer[cut:]
+
+    def _last_cut_point(self, text: str) -> int:
+        # Never cut inside an unterminated code fence
+        fence = text.rfind("```")
+        if fence != -1 and text.count("```") % 2 == 1:
+            text = text[:fence]
+        last = 0
+        for match in _CUT_POINT.finditer(text):
+            last = match.end()
+        return last
+
+    def _dispatch(self, segment: str):
+        self._parts.extend(self.client.submit_translation(
+            segment,
+            self.source_language,
+            self.target_language,
+            self.speaker_gender,
+            self.mode,
+            self.max_chunk_chars,
+            self.deadline,
+            self.executor
+        ))
+
+    def flush(self):
+        """Dispatch whatever text is still buffered (call once the stream ends)"""
+        if self._buffer:
+            self._dispatch(self._buffer)
+            self._buffer = ""
+
+    def cancel(self) -> int:
+        """
+        Drop translations that have not started, e.g. when the turn is abandoned
+
+        Returns:
+            Number of chunk translations cancelled
+        """
+        return sum(1 for part in self._parts if not isinstance(part, str) and part[0].cancel())
+
+    def done(self) -> bool:
+        """Check whether every dispatched translation has finished"""
+        return all(isinstance(part, str) or part[0].done() for part in self._parts)
+
+    def ready_text(self) -> str:
+        """
+        Get the translated text that is ready so far
+
+        Returns:
+            Translation of the longest prefix whose chunks have all finished
+        """
+        ready = []
+        for part in self._parts:
+            if not isinstance(part, str) and not part[0].done():
+                break
+            ready.append(resolve_chunk(part)[0])
+        return "".join(ready)
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Flush the remaining text and wait for every translation
+
+        Returns:
+            Dictionary with success status, translated_text, original text and
+            failed_chunks; success is False when every chunk failed
+        """
+        self.flush()
+
+        translated = []
+        total = failed = 0
+        for part in self._parts:
+            text, error = resolve_chunk(part)
+            translated.append(text)
+            if not isinstance(part, str):
+                total += 1
+                failed += 0 if error is None else 1
+
+        original = "".join(self._original)
+        if total and failed == total:
+            return {
+                "success": False,
+                "error": "Translation failed for every sentence",
+                "original": original
+            }
+        return {
+            "success": True,
+            "translated_text": "".join(translated),
+            "original": original,
+            "failed_chunks": failed
+        }
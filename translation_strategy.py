@@ -0,0 +1,161 @@
+"""
+Per-language choice between native generation and translate-after
+Records latency and success of both ways of answering in a user's language
+and routes each turn to the faster of the paths that are reliable for it
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+# The system prompt asks the model to answer in the user's language
+NATIVE = "native"
+# The model answers in English and the reply is translated in a second hop
+TRANSLATE = "translate"
+STRATEGIES = (NATIVE, TRANSLATE)
+
+
+class PathStats:
+    """Running figures for one language and path"""
+
+    __slots__ = ("turns", "successes", "hops_skipped", "chosen", "latency", "reliability")
+
+    def __init__(self):
+        self.turns = 0
+        self.successes = 0
+        self.hops_skipped = 0
+        self.chosen = 0
+        # Exponentially weighted, so a path that recovers (or degrades) shows up quickly
+        self.latency: Optional[float] = None
+        self.reliability = 1.0
+
+    def record(self, seconds: float, success: bool, skipped_hop: bool, alpha: float):
+        self.turns += 1
+        self.successes += 1 if success else 0
+        self.hops_skipped += 1 if skipped_hop else 0
+        if self.latency is None:
+            self.latency = seconds
+            self.reliability = 1.0 if success else 0.0
+        else:
+            self.latency += alpha * (seconds - self.latency)
+            self.reliability += alpha * ((1.0 if success else 0.0) - self.reliability)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "successes": self.successes,
+            "hops_skipped": self.hops_skipped,
+            "chosen": self.chosen,
+            "latency_seconds": round(self.latency, 3) if self.latency is not None else None,
+            "reliability": round(self.reliability, 3)
+        }
+
+
+class TranslationStrategy:
+    """
+    Picks native generation or translate-after per language
+
+    Each path is tried min_samples times per language before the figures
+    are trusted. After that the faster path among those whose recent
+    success rate is at least min_success_rate wins (the more reliable one
+    if neither is), and every explore_every-th decision tries the other
+    path so its figures do not go stale. Safe to share across sessions.
+    """
+
+    def __init__(
+        self,
+        min_samples: int = 3,
+        min_success_rate: float = 0.8,
+        explore_every: int = 20,
+        alpha: float = 0.2
+    ):
+        """
+        Initialize the strategy
+
+        Args:
+            min_samples: Turns recorded per path and language before choosing by the figures
+            min_success_rate: Recent success rate a path needs to count as reliable
+            explore_every: Every n-th decision for a language takes the other path (0 never)
+            alpha: Weight of the newest turn in the latency and success averages
+        """
+        self.min_samples = min_samples
+        self.min_success_rate = min_success_rate
+        self.explore_every = explore_every
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._paths: Dict[str, Dict[str, PathStats]] = {}
+        self._decisions: Dict[str, int] = {}
+
+    def _language(self, language: str) -> Dict[str, PathStats]:
+        # Caller holds the lock
+        paths = self._paths.get(language)
+        if paths is None:
+            paths = self._paths[language] = {strategy: PathStats() for strategy in STRATEGIES}
+        return paths
+
+    def _best(self, paths: Dict[str, PathStats]) -> str:
+        tried = [s for s in STRATEGIES if paths[s].latency is not None]
+        reliable = [s for s in tried if paths[s].reliability >= self.min_success_rate]
+        if reliable:
+            return min(reliable, key=lambda s: paths[s].latency)
+        return max(tried or STRATEGIES, key=lambda s: paths[s].reliability)
+
+    def choose(self, language: str) -> str:
+        """
+        Pick the path for a new turn
+
+        Args:
+            language: The user's language code
+
+        Returns:
+            NATIVE or TRANSLATE
+        """
+        with self._lock:
+            paths = self._language(language)
+            decisions = self._decisions[language] = self._decisions.get(language, 0) + 1
+            untried = [s for s in STRATEGIES if paths[s].turns < self.min_samples]
+            if untried:
+                strategy = min(untried, key=lambda s: paths[s].turns)
+            else:
+                strategy = self._best(paths)
+                if self.explore_every and decisions % self.explore_every == 0:
+                    strategy = TRANSLATE if strategy == NATIVE else NATIVE
+            paths[strategy].chosen += 1
+        return strategy
+
+    def record(self, language: str, strategy: str, seconds: float, success: bool, skipped_hop: bool = False):
+        """
+        Record how a turn went
+
+        Args:
+            language: The user's language code
+            strategy: Path the turn took
+            seconds: Time until the reply was ready in the user's language
+            success: Whether the reply ended up in the user's language (for
+                NATIVE, without needing a translation to rescue it)
+            skipped_hop: The reply was already in the target script, so no
+                translation was made
+        """
+        with self._lock:
+            self._language(language)[strategy].record(seconds, success, skipped_hop, self.alpha)
+
+    def preferred(self, language: str) -> Optional[str]:
+        """The path the figures favour for a language, or None before any turn was recorded"""
+        with self._lock:
+            paths = self._paths.get(language)
+            if paths is None or all(stats.latency is None for stats in paths.values()):
+                return None
+            return self._best(paths)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get per-language decision statistics
+
+        Returns:
+            Dictionary keyed by language, then path, with turns, successes,
+            hops_skipped, chosen, latency_seconds and reliability
+        """
+        with self._lock:
+            return {
+                language: {strategy: stats.as_dict() for strategy, stats in paths.items()}
+                for language, paths in self._paths.items()
+            }
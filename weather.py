@@ -0,0 +1,266 @@
+"""
+Weather lookups through WeatherAPI
+Per-city TTL cache with stale-while-revalidate, a short negative cache for failed
+lookups, coalesced fetches and strict timeouts
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from http_transport import PooledTransport
+from single_flight import SingleFlight
+from call_hooks import CallHooks, Hook, response_size
+from resilience import Deadline, DeadlineExceeded
+
+WEATHER_BASE_URL = "http://api.weatherapi.com/v1"
+
+
+def normalize_city(city: str) -> str:
+    """Normalize a city name so spelling variants share one cache entry"""
+    return " ".join(city.split()).casefold()
+
+
+def format_weather_report(data: Dict[str, Any]) -> str:
+    """Format a WeatherAPI current.json payload as a markdown report"""
+    location = data["location"]["name"]
+    region = data["location"]["region"]
+    country = data["location"]["country"]
+    temp_c = data["current"]["temp_c"]
+    feelslike_c = data["current"]["feelslike_c"]
+    condition = data["current"]["condition"]["text"]
+    humidity = data["current"]["humidity"]
+    wind_kph = data["current"]["wind_kph"]
+
+    return (
+        f"**Weather in {location}, {region}, {country}**\n"
+        f"- Condition: {condition}\n"
+        f"- Temperature: {temp_c}°C (Feels like {feelslike_c}°C)\n"
+        f"- Humidity: {humidity}%\n"
+        f"- Wind Speed: {wind_kph} kph"
+    )
+
+
+class WeatherProvider:
+    """Process-wide weather lookup service shared by all sessions"""
+
+    def __init__(
+        self,
+        api_key: str,
+        ttl_seconds: float = 600,
+        stale_seconds: float = 300,
+        negative_ttl_seconds: float = 30,
+        max_cities: int = 1000,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 5.0,
+        transport: Optional[PooledTransport] = None,
+        base_url: str = WEATHER_BASE_URL,
+        hooks: Optional[CallHooks] = None
+    ):
+        """
+        Initialize the provider
+
+        Args:
+            api_key: WeatherAPI key
+            ttl_seconds: How long a report is served as fresh
+            stale_seconds: How long past the TTL a report may still be served
+                (flagged stale, with its age) while it is refreshed in the background
+            negative_ttl_seconds: How long a failed lookup is answered from the
+                cache instead of calling WeatherAPI again
+            max_cities: Most reports (and, separately, failures) kept; the least
+                recently used one is evicted beyond this
+            connect_timeout: Seconds allowed for connecting to WeatherAPI
+            read_timeout: Seconds allowed for WeatherAPI to respond
+            transport: Pooled transport (one is created if omitted)
+            base_url: WeatherAPI root, e.g. a local stand-in server for load tests
+            hooks: on_request/on_response callbacks fired around every fetch
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_cities = max_cities
+        self.transport = transport if transport is not None else PooledTransport(
+            pool_maxsize=4,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
+
+        self.hooks = hooks if hooks is not None else CallHooks()
+
+        self._lock = threading.Lock()
+        self._reports: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._failures: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._counters = {
+            "fresh_hits": 0,
+            "stale_hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "fetches": 0,
+            "errors": 0,
+            "evictions": 0,
+            "background_refreshes": 0
+        }
+
+    def on_request(self, hook: Hook) -> Hook:
+        """Register a callback fired before every fetch (see call_hooks.CallHooks)"""
+        return self.hooks.on_request(hook)
+
+    def on_response(self, hook: Hook) -> Hook:
+        """Register a callback fired after every fetch (see call_hooks.CallHooks)"""
+        return self.hooks.on_response(hook)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def get_weather(self, city: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Get the current weather report for a city
+
+        Args:
+            city: City name as typed by the user
+            deadline: The turn's Deadline; caps the fetch at the time left
+                (optional, cached reports are served regardless)
+
+        Returns:
+            Dictionary with success status and report (markdown) or error,
+            plus cached/stale flags and, for stale reports, age_seconds
+        """
+        key = normalize_city(city)
+        if not key:
+            return {"success": False, "error": "Please enter a city name."}
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._reports.get(key)
+            if entry is not None:
+                self._reports.move_to_end(key)
+            failure = self._failures.get(key)
+
+        if entry is not None:
+            report, fetched_at = entry
+            age = now - fetched_at
+            if age < self.ttl_seconds:
+                self._count("fresh_hits")
+                return {"success": True, "report": report, "cached": True, "stale": False}
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._count("stale_hits")
+                self._refresh_in_background(key, city)
+                return {"success": True, "report": report, "cached": True, "stale": True, "age_seconds": age}
+
+        if failure is not None and now - failure[1] < self.negative_ttl_seconds:
+            self._count("negative_hits")
+            return {"success": False, "error": failure[0], "cached": True}
+
+        self._count("misses")
+        try:
+            # A caller joining another session's fetch still only waits for the time it has left
+            result, _ = self._flight.do(
+                key, lambda: self._fetch(key, city, deadline),
+                timeout=deadline.remaining() if deadline is not None else None
+            )
+        except TimeoutError:
+            self._count("errors")
+            deadline.mark_exceeded()
+            return {"success": False, "error": str(DeadlineExceeded("weather"))}
+        except Exception as e:
+            return {"success": False, "error": f"Error fetching weather: {str(e)}"}
+        return result
+
+    def _refresh_in_background(self, key: str, city: str):
+        if self._flight.in_flight(key):
+            return
+        self._count("background_refreshes")
+
+        def refresh():
+            try:
+                self._flight.do(key, lambda: self._fetch(key, city))
+            except Exception:
+                # The stale report stays in place; the next caller retries
+                pass
+
+        threading.Thread(target=refresh, name="weather-refresh", daemon=True).start()
+
+    def _drop_expired(self):
+        # Caller holds the lock
+        cutoff = time.monotonic() - self.ttl_seconds - self.stale_seconds
+        for city_key in [k for k, (_, fetched_at) in self._reports.items() if fetched_at < cutoff]:
+            del self._reports[city_key]
+
+    def _remember(self, cache: "OrderedDict[str, Tuple[str, float]]", key: str, value: str):
+        # Caller holds the lock
+        cache[key] = (value, time.monotonic())
+        cache.move_to_end(key)
+        if len(cache) > self.max_cities and cache is self._reports:
+            self._drop_expired()
+        while len(cache) > self.max_cities:
+            cache.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _fail(self, key: str, error: str) -> Dict[str, Any]:
+        with self._lock:
+            self._counters["errors"] += 1
+            self._remember(self._failures, key, error)
+        return {"success": False, "error": error}
+
+    def _fetch(self, key: str, city: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        self._count("fetches")
+        params = {
+            "key": self.api_key,
+            "q": city.strip(),
+            "aqi": "no"
+        }
+        url = f"{self.base_url}/current.json"
+        call = self.hooks.start("weather", "GET", url)
+        try:
+            try:
+                timeout = None
+                if deadline is not None:
+                    read = deadline.timeout(self.transport.read_timeout, "weather")
+                    timeout = (min(self.transport.connect_timeout, read), read)
+                response = self.transport.get(url, params=params, timeout=timeout)
+            except Exception as e:
+                self.hooks.finish(call, error=e)
+                if deadline is not None and deadline.expired:
+                    deadline.mark_exceeded()
+                    raise DeadlineExceeded("weather") from e
+                raise
+            self.hooks.finish(call, response.status_code, response_size(response))
+            data = response.json()
+            if response.status_code == 200:
+                report = format_weather_report(data)
+                with self._lock:
+                    self._remember(self._reports, key, report)
+                    self._failures.pop(key, None)
+                return {"success": True, "report": report, "cached": False, "stale": False}
+            else:
+                error_message = data.get("error", {}).get("message", "Unknown error")
+                return self._fail(key, f"Could not fetch weather: {error_message}")
+
+        except DeadlineExceeded as e:
+            # The caller ran out of time; that says nothing about the city
+            self._count("errors")
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            return self._fail(key, f"Error fetching weather: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache and fetch statistics
+
+        Returns:
+            Dictionary with hit/miss/fetch/error/eviction counters, coalesced
+            waits and the number of cached cities and failures
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["cached_cities"] = len(self._reports)
+            stats["cached_failures"] = len(self._failures)
+        flight = self._flight.stats()
+        stats["coalesced"] = flight["coalesced"]
+        stats["in_flight"] = flight["in_flight"]
+        return stats